@@ -1,4 +1,46 @@
+import time
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+class ActionTimer:
+    """
+    Lightweight timing hook for one `get_action` call.
+
+    The orchestrator attaches a timer to the actor before asking for an action;
+    streaming actors report each received token through `Actor.record_token`.
+    `on_limit` is called once `token_limit` tokens were received (the
+    orchestrator uses it to cancel the action).
+    """
+
+    __slots__ = ("started_at", "first_token_at", "tokens", "throttled_seconds", "token_limit", "on_limit")
+
+    def __init__(self, token_limit: Optional[int] = None, on_limit: Optional[Callable[[], Any]] = None):
+        self.started_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.tokens = 0
+        self.throttled_seconds = 0.0
+        self.token_limit = token_limit
+        self.on_limit = on_limit
+
+    def on_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.tokens += 1
+        if self.token_limit is not None and self.tokens >= self.token_limit and self.on_limit is not None:
+            self.on_limit()
+
+# Timer of the action being produced in the current task. Lets code below the
+# actor (e.g. the LLM rate limiter) report time without knowing the actor.
+active_timer: ContextVar[Optional[ActionTimer]] = ContextVar("active_timer", default=None)
+
+def record_throttling(seconds: float) -> None:
+    """
+    Adds time spent waiting for a rate limiter to the current action timer.
+    """
+    timer = active_timer.get()
+    if timer is not None:
+        timer.throttled_seconds += seconds
 
 class Actor(ABC):
     """
@@ -8,6 +50,22 @@ class Actor(ABC):
     allowing the orchestration layer to treat them interchangeably.
     """
 
+    # Set by the orchestrator while an action is being produced.
+    timer: Optional[ActionTimer] = None
+
+    def record_token(self) -> None:
+        """
+        Reports one streamed token (or chunk) to the attached timer, if any.
+        """
+        if self.timer is not None:
+            self.timer.on_token()
+
+    async def prepare(self) -> None:
+        """
+        Called once before the first turn of a session (e.g. to open network
+        connections ahead of time). Does nothing by default.
+        """
+
     @abstractmethod
     async def get_action(self, observation: str) -> str:
         """
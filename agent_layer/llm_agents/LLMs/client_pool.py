@@ -0,0 +1,211 @@
+import asyncio
+import atexit
+import hashlib
+import os
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:  # recent openai releases are built on httpx2
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+
+# Builds an SDK client around the shared HTTP client.
+ClientFactory = Callable[[str, httpx.AsyncClient], Any]
+
+# (provider, base URL, digest of the API key)
+ClientKey = Tuple[str, Optional[str], str]
+
+# Longest wait for the rest of a response body when it is closed early.
+DRAIN_TIMEOUT_SECONDS = 0.5
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """
+    Connection limits of every pooled HTTP client.
+
+    Attributes:
+        max_connections (int): Open connections per client.
+        max_keepalive_connections (int): Idle connections kept for reuse.
+        keepalive_expiry (float): Seconds an idle connection is kept.
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "PoolLimits":
+        """
+        Reads LLM_POOL_MAX_CONNECTIONS, LLM_POOL_MAX_KEEPALIVE and
+        LLM_POOL_KEEPALIVE_EXPIRY, falling back to the defaults.
+        """
+        return cls(
+            max_connections=int(os.getenv("LLM_POOL_MAX_CONNECTIONS", cls.max_connections)),
+            max_keepalive_connections=int(os.getenv("LLM_POOL_MAX_KEEPALIVE", cls.max_keepalive_connections)),
+            keepalive_expiry=float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", cls.keepalive_expiry))
+        )
+
+
+class _DrainingStream(httpx.AsyncByteStream):
+    """
+    Response body that reads what is left of itself when closed.
+
+    Streaming SDKs stop reading at their end-of-stream event (e.g. `[DONE]`),
+    before the end of the HTTP body. An unfinished response cannot go back to
+    the pool, so without draining every streamed request would cost a new
+    connection. Bodies that do not end quickly (an abandoned generation) are
+    closed as before.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream):
+        self._stream = stream
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await asyncio.wait_for(self._drain(), DRAIN_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, httpx.HTTPError):
+            pass
+        finally:
+            await self._stream.aclose()
+
+    async def _drain(self) -> None:
+        async for _ in self._stream:
+            pass
+
+
+class _DrainingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        response.stream = _DrainingStream(response.stream)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _PooledClient:
+    __slots__ = ("client", "http_client", "warmed")
+
+    def __init__(self, client: Any, http_client: httpx.AsyncClient):
+        self.client = client
+        self.http_client = http_client
+        self.warmed = False
+
+
+class ClientPool:
+    """
+    Process-wide registry of SDK clients, keyed by provider, base URL and API
+    key, so every LLM wrapper of a process reuses the same keep-alive
+    connections.
+
+    HTTP connections belong to the event loop that opened them, so clients
+    are also kept per loop: a worker process or a server reuses them for as
+    long as its loop lives.
+    """
+
+    def __init__(self, limits: Optional[PoolLimits] = None):
+        self.limits = limits if limits is not None else PoolLimits.from_env()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientKey, _PooledClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self, provider: str, base_url: Optional[str], api_key: str, factory: ClientFactory) -> Any:
+        """
+        Returns the client of the running event loop for these credentials,
+        creating it on first use.
+
+        Raises:
+            RuntimeError: If called outside of a running event loop.
+        """
+        return self._entry(provider, base_url, api_key, factory).client
+
+    async def warm_up(self, provider: str, base_url: Optional[str], api_key: str, factory: ClientFactory) -> None:
+        """
+        Opens a connection to the provider (TCP and TLS handshakes) ahead of the
+        first request. Only the first call per client does anything; failures
+        are ignored, the first request will simply connect itself.
+        """
+        entry = self._entry(provider, base_url, api_key, factory)
+        if entry.warmed:
+            return
+        entry.warmed = True
+
+        url = base_url or getattr(entry.client, "base_url", None)
+        if url is None:
+            return
+        try:
+            await entry.http_client.head(str(url))
+        except httpx.HTTPError:
+            pass
+
+    async def aclose(self) -> None:
+        """
+        Closes the clients of the running event loop.
+        """
+        entries = self._clients.pop(asyncio.get_running_loop(), {})
+        await _close_entries(entries)
+
+    def close_all(self) -> None:
+        """
+        Closes the clients of every loop that is still open and not running
+        (loops that are already closed have released their connections).
+        """
+        for loop, entries in list(self._clients.items()):
+            if not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(_close_entries(entries))
+        self._clients.clear()
+
+    def _entry(self, provider: str, base_url: Optional[str], api_key: str, factory: ClientFactory) -> _PooledClient:
+        entries = self._clients.setdefault(asyncio.get_running_loop(), {})
+        key = (provider, base_url, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+        entry = entries.get(key)
+        if entry is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.limits.max_connections,
+                    max_keepalive_connections=self.limits.max_keepalive_connections,
+                    keepalive_expiry=self.limits.keepalive_expiry
+                )
+            )
+            http_client = httpx.AsyncClient(transport=_DrainingTransport(transport), follow_redirects=True)
+            entry = _PooledClient(factory(api_key, http_client), http_client)
+            entries[key] = entry
+        return entry
+
+
+async def _close_entries(entries: Dict[ClientKey, _PooledClient]) -> None:
+    for entry in entries.values():
+        await entry.http_client.aclose()
+
+
+_POOL: Optional[ClientPool] = None
+
+def get_client_pool() -> ClientPool:
+    """
+    Returns the process-wide client pool.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = ClientPool()
+    return _POOL
+
+async def close_clients() -> None:
+    """
+    Closes the pooled clients of the running event loop. Call it before the
+    loop ends (e.g. at the end of `asyncio.run`).
+    """
+    if _POOL is not None:
+        await _POOL.aclose()
+
+@atexit.register
+def _close_at_exit() -> None:
+    if _POOL is not None:
+        _POOL.close_all()
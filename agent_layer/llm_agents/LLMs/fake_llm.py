@@ -0,0 +1,211 @@
+import asyncio
+import json
+import os
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
+
+from openai import APIConnectionError, RateLimitError
+
+from agent_layer.llm_agents.LLMs.client_pool import httpx
+from agent_layer.llm_agents.LLMs.general_llm import GeneralLLM
+from agent_layer.llm_agents.LLMs.openai_llm import MAX_RATE_LIMIT_RETRIES
+from agent_layer.llm_agents.LLMs.rate_limiter import estimate_tokens, get_rate_limiter
+
+# Produces the text of a response from the request messages.
+ResponsePolicy = Callable[[List[Dict[str, str]], random.Random], str]
+
+# Endpoint reported by the injected errors (nothing is ever sent to it).
+FAKE_BASE_URL = "http://fake-llm.invalid/v1"
+
+_SEQUENCE_PATTERN = re.compile(r'sequence:\s*(.+)', flags=re.IGNORECASE)
+_TOKEN_PATTERN = re.compile(r'\S+\s*|\s+')
+
+@dataclass(frozen=True)
+class FakeLLMConfig:
+    """
+    Behaviour of the fake backend.
+
+    Attributes:
+        first_token_latency (float): Seconds before the first token.
+        tokens_per_second (float): Streaming rate after the first token (0 streams at once).
+        error_rate (float): Probability that a request fails with a connection error.
+        rate_limit_rate (float): Probability that a request is answered with a 429.
+        retry_after (Optional[float]): `Retry-After` of the injected 429 responses.
+        reasoning_words (int): Filler words written before the action.
+        trailing_words (int): Filler words written after the action.
+        responses (Tuple[str, ...]): Scripted responses, replayed in a cycle. When
+                                     empty, the response policy writes them.
+        seed (Optional[int]): Seed of the random generator (latency aside,
+                              the responses are then reproducible).
+    """
+    first_token_latency: float = 0.5
+    tokens_per_second: float = 50.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: Optional[float] = 1.0
+    reasoning_words: int = 40
+    trailing_words: int = 0
+    responses: Tuple[str, ...] = ()
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.first_token_latency < 0 or self.tokens_per_second < 0:
+            raise ValueError("Latency and token rate cannot be negative.")
+        if not 0 <= self.error_rate <= 1 or not 0 <= self.rate_limit_rate <= 1:
+            raise ValueError("error_rate and rate_limit_rate must be between 0 and 1.")
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMConfig":
+        """
+        Reads FAKE_LLM_TTFT, FAKE_LLM_TOKENS_PER_SECOND, FAKE_LLM_ERROR_RATE,
+        FAKE_LLM_RATE_LIMIT_RATE, FAKE_LLM_RETRY_AFTER, FAKE_LLM_REASONING_WORDS,
+        FAKE_LLM_TRAILING_WORDS, FAKE_LLM_SEED and FAKE_LLM_RESPONSES (path to
+        a JSON list of responses), falling back to the defaults.
+        """
+        responses: Tuple[str, ...] = ()
+        responses_path = os.getenv("FAKE_LLM_RESPONSES")
+        if responses_path:
+            with open(responses_path, 'r', encoding='utf-8') as f:
+                responses = tuple(json.load(f))
+        seed = os.getenv("FAKE_LLM_SEED")
+        retry_after = os.getenv("FAKE_LLM_RETRY_AFTER")
+
+        return cls(
+            first_token_latency=float(os.getenv("FAKE_LLM_TTFT", cls.first_token_latency)),
+            tokens_per_second=float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", cls.tokens_per_second)),
+            error_rate=float(os.getenv("FAKE_LLM_ERROR_RATE", cls.error_rate)),
+            rate_limit_rate=float(os.getenv("FAKE_LLM_RATE_LIMIT_RATE", cls.rate_limit_rate)),
+            retry_after=float(retry_after) if retry_after else cls.retry_after,
+            reasoning_words=int(os.getenv("FAKE_LLM_REASONING_WORDS", cls.reasoning_words)),
+            trailing_words=int(os.getenv("FAKE_LLM_TRAILING_WORDS", cls.trailing_words)),
+            responses=responses,
+            seed=int(seed) if seed else None
+        )
+
+
+def random_answer_policy(messages: List[Dict[str, str]], rng: random.Random) -> str:
+    """
+    Default policy: answers the last `sequence: ...` of the conversation (as
+    shown by Mystery Sequences) with as many random bits as it has symbols.
+    """
+    for message in reversed(messages):
+        if message["role"] != "user":
+            continue
+        matches = _SEQUENCE_PATTERN.findall(message["content"])
+        if matches:
+            length = len(matches[-1].split())
+            return " ".join(rng.choice("01") for _ in range(length))
+    return "0"
+
+
+class FakeLLM(GeneralLLM):
+    """
+    Local stand-in for an LLM provider, for load tests and CI.
+
+    It needs no API key and opens no connection. Responses are written in the
+    `action: { ... }` format, either from a script or by a response policy,
+    and streamed with the configured first-token latency and token rate.
+    Connection errors and 429 responses can be injected; the 429s go through
+    the rate limiter like those of the real providers.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "fake",
+        config: Optional[FakeLLMConfig] = None,
+        policy: ResponsePolicy = random_answer_policy
+    ):
+        """
+        Args:
+            model_name (str): The model identifier (only used for rate limits).
+            config (FakeLLMConfig, optional): Defaults to `FakeLLMConfig.from_env()`.
+            policy (ResponsePolicy): Writes the answer when no script is configured.
+        """
+        super().__init__()
+        self.model_name = model_name
+        self.config = config if config is not None else FakeLLMConfig.from_env()
+        self.policy = policy
+        self.rng = random.Random(self.config.seed)
+        self.rate_limiter = get_rate_limiter(self.get_provider_name(), model_name)
+        self._calls = 0
+
+    def _load_api_credentials(self) -> str:
+        return ""
+
+    def get_api_key_name(self) -> str:
+        return ""
+
+    def get_provider_name(self) -> str:
+        return "fake"
+
+    def get_base_url(self) -> str:
+        return FAKE_BASE_URL
+
+    def generate_client(self, api_key: str, http_client: Any) -> None:
+        return None
+
+    async def warm_up(self) -> None:
+        pass
+
+    def write_response(self, messages: List[Dict[str, str]]) -> str:
+        """
+        Returns the full text of the next response.
+        """
+        if self.config.responses:
+            response = self.config.responses[self._calls % len(self.config.responses)]
+            self._calls += 1
+            return response
+
+        reasoning = self._filler(self.config.reasoning_words)
+        trailing = self._filler(self.config.trailing_words)
+        response = f"{reasoning}\naction: {{ {self.policy(messages, self.rng)} }}"
+        return f"{response}\n{trailing}" if trailing else response
+
+    def _filler(self, words: int) -> str:
+        return " ".join(self.rng.choice(("let", "me", "check", "the", "pattern", "again")) for _ in range(words))
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncGenerator[str, None]:
+        """
+        Streams a fake response, one word (with its trailing whitespace) per token.
+
+        Raises:
+            APIConnectionError: With probability `error_rate`.
+            RateLimitError: When `rate_limit_rate` hit every attempt.
+        """
+        prompt_tokens = sum(estimate_tokens(message["content"]) for message in messages)
+        request = httpx.Request("POST", f"{FAKE_BASE_URL}/chat/completions")
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            async with self.rate_limiter.request(prompt_tokens + max_tokens) as permit:
+                permit.add_tokens(prompt_tokens)
+                # A 429 is answered at once; everything else after the first-token latency.
+                if self.rng.random() < self.config.rate_limit_rate:
+                    permit.rate_limited(self.config.retry_after)
+                    if attempt == MAX_RATE_LIMIT_RETRIES - 1:
+                        raise self._rate_limit_error(request)
+                    continue
+
+                await asyncio.sleep(self.config.first_token_latency)
+                if self.rng.random() < self.config.error_rate:
+                    raise APIConnectionError(message="Injected connection error.", request=request)
+
+                tokens = _TOKEN_PATTERN.findall(self.write_response(messages))[:max_tokens]
+                delay = 1 / self.config.tokens_per_second if self.config.tokens_per_second else 0
+                for index, token in enumerate(tokens):
+                    if index and delay:
+                        await asyncio.sleep(delay)
+                    permit.add_tokens(1)
+                    yield token
+                return
+
+    def _rate_limit_error(self, request: httpx.Request) -> RateLimitError:
+        headers = {} if self.config.retry_after is None else {"retry-after": str(self.config.retry_after)}
+        response = httpx.Response(429, headers=headers, request=request)
+        return RateLimitError("Injected rate limit.", response=response, body=None)
@@ -1,6 +1,8 @@
 import os
 from abc import ABC, abstractmethod
-from typing import List, Dict, AsyncGenerator, Any
+from typing import List, Dict, AsyncGenerator, Any, Optional
+
+from agent_layer.llm_agents.LLMs.client_pool import get_client_pool
 
 class GeneralLLM(ABC):
     """
@@ -9,15 +11,41 @@ class GeneralLLM(ABC):
     It handles:
     1. Secure credential loading from environment variables.
     2. Enforcing a standard interface for asynchronous streaming (stream_chat).
+    3. Sharing SDK clients (and their connections) through the process-wide
+       client pool.
     """
 
     def __init__(self):
         """
         Initializes the LLM wrapper. 
-        It automatically loads credentials and creates the client instance.
+        It automatically loads credentials; the client comes from the pool on first use.
         """
         self.api_key = self._load_api_credentials()
-        self.client = self.generate_client(self.api_key)
+
+    @property
+    def client(self) -> Any:
+        """
+        The pooled SDK client of the running event loop.
+        """
+        return get_client_pool().get(self.get_provider_name(), self.get_base_url(), self.api_key, self.generate_client)
+
+    async def warm_up(self) -> None:
+        """
+        Opens a connection to the provider before the first request.
+        """
+        await get_client_pool().warm_up(self.get_provider_name(), self.get_base_url(), self.api_key, self.generate_client)
+
+    def get_provider_name(self) -> str:
+        """
+        Identifies the provider (used to key pooled clients and rate limits).
+        """
+        return type(self).__name__.lower()
+
+    def get_base_url(self) -> Optional[str]:
+        """
+        The API endpoint, or None for the SDK default.
+        """
+        return None
 
     def _load_api_credentials(self) -> str:
         """
@@ -46,12 +74,13 @@ class GeneralLLM(ABC):
         pass
 
     @abstractmethod
-    def generate_client(self, api_key: str) -> Any:
+    def generate_client(self, api_key: str, http_client: Any) -> Any:
         """
         Instantiates and returns the specific SDK client (e.g., AsyncOpenAI).
         
         Args:
             api_key (str): The loaded API key.
+            http_client: The pooled HTTP client the SDK client must send its requests through.
         """
         pass
 
@@ -74,4 +103,36 @@ class GeneralLLM(ABC):
         Yields:
             str: Individual string tokens as they are generated.
         """
-        yield ""  
\ No newline at end of file
+        yield ""  
+
+class LLMWrapper(GeneralLLM, ABC):
+    """
+    Base of the clients that add behaviour around another client (caching,
+    retries). Credentials, the SDK client and the provider identity are the
+    wrapped client's; subclasses only implement `stream_chat`.
+    """
+
+    def __init__(self, llm: GeneralLLM):
+        # The wrapped client already holds the credentials.
+        self.llm = llm
+        self.model_name = getattr(llm, "model_name", type(llm).__name__)
+        self.api_key = llm.api_key
+
+    @property
+    def client(self) -> Any:
+        return self.llm.client
+
+    async def warm_up(self) -> None:
+        await self.llm.warm_up()
+
+    def get_provider_name(self) -> str:
+        return self.llm.get_provider_name()
+
+    def get_base_url(self) -> Optional[str]:
+        return self.llm.get_base_url()
+
+    def get_api_key_name(self) -> str:
+        return self.llm.get_api_key_name()
+
+    def generate_client(self, api_key: str, http_client: Any) -> Any:
+        return self.llm.generate_client(api_key, http_client)
@@ -1,4 +1,3 @@
-from openai import AsyncOpenAI
 from agent_layer.llm_agents.LLMs.openai_llm import OpenAILLM
 
 class GrokLLM(OpenAILLM):
@@ -23,11 +22,14 @@ class GrokLLM(OpenAILLM):
         """
         return "XAI_API_KEY"
 
-    def generate_client(self, api_key: str) -> AsyncOpenAI:
+    def get_provider_name(self) -> str:
         """
-        Initializes the asynchronous OpenAI client pointing to xAI's infrastructure.
+        Identifies the provider whose rate limits apply to this client.
         """
-        return AsyncOpenAI(
-            api_key=api_key,
-            base_url="https://api.x.ai/v1"
-        )
\ No newline at end of file
+        return "xai"
+
+    def get_base_url(self) -> str:
+        """
+        Points the OpenAI client to xAI's infrastructure.
+        """
+        return "https://api.x.ai/v1"
\ No newline at end of file
@@ -1,7 +1,10 @@
 from typing import List, Type
+from agent_layer.llm_agents.LLMs.fake_llm import FakeLLM
 from agent_layer.llm_agents.LLMs.general_llm import GeneralLLM
 from agent_layer.llm_agents.LLMs.grok_llm import GrokLLM
 from agent_layer.llm_agents.LLMs.openai_llm import OpenAILLM
+from agent_layer.llm_agents.LLMs.resilient_llm import ResilienceConfig, ResilientLLM
+from agent_layer.llm_agents.LLMs.response_cache import CachedLLM, get_response_cache
 
 # Registry mapping model identifiers to their implementation classes.
 # This acts as the configuration center for supported models.
@@ -14,22 +17,41 @@ MODELS: dict[str, Type[GeneralLLM]] = {
     "grok-4": GrokLLM,
     "grok-4-1-fast": GrokLLM,
     "grok-4-1-fast-non-reasoning": GrokLLM,
+
+    # Local fake backend (no key, no network), see fake_llm.py
+    "fake": FakeLLM,
 }
 
 def get_llm(model_name: str) -> GeneralLLM:
     """
     Factory function: Returns an instantiated LLM client based on the model name.
+
+    The client retries and hedges its requests (see resilient_llm.py, configured
+    through the LLM_MAX_ATTEMPTS, LLM_HEDGE_* and LLM_BACKUP_MODEL variables).
     
     Args:
         model_name (str): The specific model identifier (e.g., 'gpt-4'). 
                           It is case-insensitive.
 
     Returns:
-        GeneralLLM: An instance of the LLM class configured for the requested model.
+        GeneralLLM: An instance of the LLM class configured for the requested model,
+                    behind the response cache when LLM_CACHE_DIR is set.
 
     Raises:
-        ValueError: If the model name is not in the supported list.
+        ValueError: If the model name (or the backup model) is not in the supported list.
     """
+    llm = _create_llm(model_name)
+
+    config = ResilienceConfig.from_env()
+    backup = None
+    if config.backup_model is not None and config.backup_model.lower().strip() != llm.model_name:
+        backup = _create_llm(config.backup_model)
+    llm = ResilientLLM(llm, config, backup)
+
+    cache = get_response_cache()
+    return CachedLLM(llm, cache) if cache is not None else llm
+
+def _create_llm(model_name: str) -> GeneralLLM:
     # Normalize input to ensure case-insensitivity
     normalized_name = model_name.lower().strip()
 
@@ -41,7 +63,6 @@ def get_llm(model_name: str) -> GeneralLLM:
         )
     
     llm_class = MODELS[normalized_name]
-    
     return llm_class(model_name=normalized_name)
 
 def list_available_llms() -> List[str]:
@@ -1,7 +1,18 @@
-from typing import List, Dict, AsyncGenerator, Any
-from openai import AsyncOpenAI
+import os
+from typing import List, Dict, AsyncGenerator, Any, Optional
+from openai import AsyncOpenAI, RateLimitError
 
+from agent_layer.llm_agents.LLMs.client_pool import httpx
 from agent_layer.llm_agents.LLMs.general_llm import GeneralLLM
+from agent_layer.llm_agents.LLMs.rate_limiter import estimate_tokens, get_rate_limiter
+
+# Attempts for a request answered with 429 before the error is raised.
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Seconds to open a connection. The read timeout (the longest silence of a
+# response, LLM_REQUEST_TIMEOUT) replaces the SDK's 600-second default.
+CONNECT_TIMEOUT_SECONDS = 10.0
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 60.0
 
 class OpenAILLM(GeneralLLM):
     """
@@ -15,6 +26,13 @@ class OpenAILLM(GeneralLLM):
         """
         super().__init__()
         self.model_name = model_name
+        self.rate_limiter = get_rate_limiter(self.get_provider_name(), model_name)
+
+    def get_provider_name(self) -> str:
+        """
+        Identifies the provider whose rate limits apply to this client.
+        """
+        return "openai"
 
 
     def get_api_key_name(self) -> str:
@@ -23,11 +41,21 @@ class OpenAILLM(GeneralLLM):
         """
         return "OPENAI_API_KEY"
 
-    def generate_client(self, api_key: str) -> AsyncOpenAI:
+    def generate_client(self, api_key: str, http_client: Any) -> AsyncOpenAI:
         """
         Initializes the asynchronous OpenAI client.
+
+        The SDK's own retries are disabled: 429s are retried here through the
+        rate limiter and other transient errors by ResilientLLM.
         """
-        return AsyncOpenAI(api_key=api_key)
+        timeout = float(os.getenv("LLM_REQUEST_TIMEOUT", DEFAULT_REQUEST_TIMEOUT_SECONDS))
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.get_base_url(),
+            http_client=http_client,
+            max_retries=0,
+            timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT_SECONDS)
+        )
 
     async def stream_chat(
         self, 
@@ -46,18 +74,44 @@ class OpenAILLM(GeneralLLM):
         Yields:
             str: Tokens as they are received from the API.
         """
-        # Initiate the request with stream=True
-        stream = await self.client.chat.completions.create(
-            model=self.model_name,
-            messages=messages,
-            temperature=temperature,
-            max_completion_tokens=max_tokens,
-            stream=True
-        )
+        prompt_tokens = sum(estimate_tokens(message["content"]) for message in messages)
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            async with self.rate_limiter.request(prompt_tokens + max_tokens) as permit:
+                permit.add_tokens(prompt_tokens)
+                try:
+                    # Initiate the request with stream=True
+                    stream = await self.client.chat.completions.create(
+                        model=self.model_name,
+                        messages=messages,
+                        temperature=temperature,
+                        max_completion_tokens=max_tokens,
+                        stream=True
+                    )
+                except RateLimitError as e:
+                    # The limiter backs off; the next attempt waits for it.
+                    permit.rate_limited(_retry_after(e))
+                    if attempt == MAX_RATE_LIMIT_RETRIES - 1:
+                        raise
+                    continue
+
+                # Iterate over the asynchronous stream. Closing this generator early
+                # (the caller already has its action) closes the HTTP response.
+                async with stream:
+                    async for chunk in stream:
+                        # Extract content delta (can be None for the first/last chunks)
+                        content = chunk.choices[0].delta.content
+                        if content:
+                            permit.add_tokens(estimate_tokens(content))
+                            yield content
+                return
 
-        # Iterate over the asynchronous stream
-        async for chunk in stream:
-            # Extract content delta (can be None for the first/last chunks)
-            content = chunk.choices[0].delta.content
-            if content:
-                yield content
\ No newline at end of file
+
+def _retry_after(error: RateLimitError) -> Optional[float]:
+    """
+    Reads the Retry-After header of a 429 response, if any.
+    """
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
@@ -0,0 +1,117 @@
+import math
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_QUANTILES: Tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+class P2Quantile:
+    """
+    Streaming estimate of a single quantile with the P² algorithm
+    (Jain & Chlamtac, 1985): five markers, constant memory, no stored samples.
+    """
+
+    __slots__ = ("p", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p: float):
+        if not 0.0 < p < 1.0:
+            raise ValueError("Quantile must be between 0 and 1 (exclusive).")
+        self.p = p
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    @property
+    def count(self) -> int:
+        if len(self._heights) < 5:
+            return len(self._heights)
+        return self._positions[4] + 1
+
+    def add(self, value: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # Cell containing the new value; extremes replace the end markers.
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] = self._linear(i, step)
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    @property
+    def value(self) -> float:
+        """
+        The current estimate (exact while fewer than five values were added;
+        NaN if none).
+        """
+        heights = self._heights
+        if not heights:
+            return math.nan
+        if len(heights) < 5:
+            # Linear interpolation between the closest ranks.
+            rank = self.p * (len(heights) - 1)
+            low = math.floor(rank)
+            high = min(low + 1, len(heights) - 1)
+            return heights[low] + (heights[high] - heights[low]) * (rank - low)
+        return heights[2]
+
+
+class QuantileSketch:
+    """
+    A set of P² estimators fed with the same stream.
+    """
+
+    __slots__ = ("_estimators",)
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES):
+        self._estimators = [P2Quantile(p) for p in quantiles]
+
+    def add(self, value: float) -> None:
+        for estimator in self._estimators:
+            estimator.add(value)
+
+    @property
+    def count(self) -> int:
+        return self._estimators[0].count if self._estimators else 0
+
+    def values(self) -> Dict[float, float]:
+        """
+        Returns the estimate of every tracked quantile (e.g. {0.5: 3.0, 0.95: 7.0}).
+        """
+        return {estimator.p: estimator.value for estimator in self._estimators}
@@ -0,0 +1,381 @@
+import asyncio
+import json
+import math
+import os
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+
+from agent_layer.actor import record_throttling
+
+try:
+    import fcntl
+except ImportError:  # Windows: limits are only shared inside each process
+    fcntl = None
+
+# Rough size of a token, used to estimate the prompt size before sending it.
+CHARS_PER_TOKEN = 4
+
+# Directory where bucket state is shared between processes (one file per
+# provider/model). Unset, every process keeps its own buckets in memory.
+STATE_DIR_VARIABLE = "LLM_RATE_LIMIT_DIR"
+
+# AIMD parameters of the shared request rate.
+MIN_RATE_SCALE = 0.05
+RATE_SCALE_INCREASE = 0.02
+DEFAULT_BACKOFF_SECONDS = 2.0
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Limits applied to one provider (or one model of a provider).
+
+    Attributes:
+        rpm (Optional[float]): Requests per minute. None means unlimited.
+        tpm (Optional[float]): Tokens (prompt + completion) per minute. None means unlimited.
+        max_concurrency (Optional[int]): Upper bound of in-flight requests per process.
+                                         None means unlimited. The actual bound
+                                         adapts (AIMD) to the 429 responses.
+    """
+    rpm: Optional[float] = None
+    tpm: Optional[float] = None
+    max_concurrency: Optional[int] = None
+
+    @property
+    def has_buckets(self) -> bool:
+        return self.rpm is not None or self.tpm is not None
+
+
+# Explicit limits, keyed by "provider" or "provider/model". Environment
+# variables (see `get_rate_limit`) are used when no entry matches.
+RATE_LIMITS: Dict[str, RateLimit] = {}
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+def get_rate_limit(provider: str, model_name: str) -> Tuple[str, RateLimit]:
+    """
+    Resolves the limits of a model and the key of the buckets they apply to.
+
+    Model-level limits (`RATE_LIMITS["provider/model"]` or the environment
+    variables `{PROVIDER}_{MODEL}_RPM|TPM|CONCURRENCY`, e.g. `OPENAI_GPT_5_RPM=500`)
+    get buckets of their own. Otherwise the provider-level limits
+    (`RATE_LIMITS["provider"]` or `{PROVIDER}_RPM|TPM|CONCURRENCY`, e.g.
+    `XAI_TPM=2000000`) apply, with buckets shared by all the models of the provider.
+
+    Returns:
+        Tuple[str, RateLimit]: The bucket key and its limits.
+    """
+    for key in (f"{provider}/{model_name}", provider):
+        if key in RATE_LIMITS:
+            return key, RATE_LIMITS[key]
+        limit = _read_env_limit(_env_prefix(key))
+        if limit is not None:
+            return key, limit
+    return provider, RateLimit()
+
+def _read_env_limit(prefix: str) -> Optional[RateLimit]:
+    values = {suffix: os.getenv(f"{prefix}_{suffix}") for suffix in ("RPM", "TPM", "CONCURRENCY")}
+    if not any(values.values()):
+        return None
+    return RateLimit(
+        rpm=float(values["RPM"]) if values["RPM"] else None,
+        tpm=float(values["TPM"]) if values["TPM"] else None,
+        max_concurrency=int(values["CONCURRENCY"]) if values["CONCURRENCY"] else None
+    )
+
+def _env_prefix(name: str) -> str:
+    return re.sub(r"[^0-9A-Za-z]+", "_", name).upper()
+
+
+class AdaptiveConcurrency:
+    """
+    Process-local bound on in-flight requests with AIMD adjustment: the bound
+    grows by about one per round of successful requests and halves on every
+    rate-limited response. Without `max_limit`, requests are not bounded until
+    the first rate-limited response.
+    """
+
+    def __init__(self, max_limit: Optional[int] = None):
+        self.max_limit = max_limit if max_limit is not None else math.inf
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._waiters: deque = deque()
+
+    async def acquire(self) -> None:
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        if self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._wake()
+
+    def on_rate_limited(self) -> None:
+        # Unbounded so far: start from the load that was rate limited.
+        current = self.limit if self.limit < math.inf else max(self.in_flight, 1)
+        self.limit = float(max(1, int(current / 2)))
+
+    def _wake(self) -> None:
+        if not self._waiters:
+            return
+        free_slots = len(self._waiters) if self.limit == math.inf else int(self.limit) - self.in_flight
+        for waiter in list(self._waiters)[:max(free_slots, 0)]:
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(None)
+
+
+class _MemoryState:
+    """Bucket state visible to the current process only (default)."""
+
+    def __init__(self):
+        self._state: dict = {}
+
+    async def update(self, fn: Callable[[dict], float]) -> float:
+        return fn(self._state)
+
+
+class _FileState:
+    """
+    Bucket state kept in a small JSON file guarded by an exclusive `flock`,
+    so every process using the same directory draws from the same buckets.
+    The locked read-modify-write runs in a thread, off the event loop.
+    """
+
+    def __init__(self, key: str, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"{_env_prefix(key).lower()}.json"
+
+    async def update(self, fn: Callable[[dict], float]) -> float:
+        return await asyncio.to_thread(self._update, fn)
+
+    def _update(self, fn: Callable[[dict], float]) -> float:
+        with open(self.path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read()
+                try:
+                    state = json.loads(content) if content else {}
+                except json.JSONDecodeError:
+                    state = {}
+                result = fn(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# Called when the limiter admits the request of the current task, i.e. when it
+# is actually sent (ResilientLLM starts its first-token clock there).
+on_admitted: ContextVar[Optional[Callable[[], None]]] = ContextVar("on_admitted", default=None)
+
+class RateLimiter:
+    """
+    Token-bucket limiter for one provider/model.
+
+    Requests-per-minute and tokens-per-minute buckets are shared by every
+    session of the process and, with a `state_dir`, by every process using that
+    directory. On a rate-limited response the shared refill rate is halved and
+    all callers pause for the back-off period; each success raises it again
+    additively (AIMD). The per-process concurrency bound follows the same rule.
+
+    Without RPM/TPM limits there are no buckets: requests only pass through the
+    concurrency bound and the back-off after a 429, both kept in memory.
+    """
+
+    def __init__(self, key: str, limit: RateLimit, state_dir: Optional[Path] = None):
+        self.key = key
+        self.limit = limit
+        self.concurrency = AdaptiveConcurrency(limit.max_concurrency)
+        shared = state_dir is not None and fcntl is not None and limit.has_buckets
+        self._state = _FileState(key, state_dir) if shared else _MemoryState()
+        self._cooldown_until = 0.0
+
+    @asynccontextmanager
+    async def request(self, estimated_tokens: int) -> AsyncIterator["RequestPermit"]:
+        """
+        Waits until the request fits the limits and holds a concurrency slot
+        while it runs.
+
+        Args:
+            estimated_tokens (int): Upper estimate of prompt + completion tokens.
+                                    The unused part is returned through the permit.
+        """
+        waiting_since = time.perf_counter()
+        await self.concurrency.acquire()
+        try:
+            await self._take(estimated_tokens)
+            record_throttling(time.perf_counter() - waiting_since)
+            admitted = on_admitted.get()
+            if admitted is not None:
+                admitted()
+            permit = RequestPermit(estimated_tokens)
+            failed = False
+            try:
+                yield permit
+            except GeneratorExit:
+                # The caller closed its stream early (e.g. it already has its
+                # action): the request still succeeded.
+                raise
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                # Reported here, not after the yield, so early closes are counted too.
+                if permit.was_rate_limited:
+                    await self._on_rate_limited(permit.retry_after)
+                else:
+                    await self._on_finished(permit.unused_tokens, succeeded=not failed)
+        finally:
+            self.concurrency.release()
+
+    async def _take(self, tokens: int) -> None:
+        if not self.limit.has_buckets:
+            cooldown = self._cooldown_until - time.time()
+            if cooldown > 0:
+                await asyncio.sleep(cooldown)
+            return
+
+        while True:
+            wait = await self._state.update(lambda state: self._try_take(state, tokens, time.time()))
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _refill(self, state: dict, now: float) -> None:
+        scale = state.setdefault("rate_scale", 1.0)
+        elapsed = max(now - state.get("updated_at", now), 0.0)
+        state["updated_at"] = now
+
+        for bucket, per_minute in (("requests", self.limit.rpm), ("tokens", self.limit.tpm)):
+            if per_minute is None:
+                continue
+            level = state.get(bucket, per_minute)
+            state[bucket] = min(per_minute, level + elapsed * per_minute * scale / 60)
+
+    def _try_take(self, state: dict, tokens: int, now: float) -> float:
+        """
+        Takes one request and `tokens` tokens from the buckets, or returns the
+        number of seconds to wait before trying again.
+        """
+        self._refill(state, now)
+
+        cooldown = state.get("cooldown_until", 0.0) - now
+        if cooldown > 0:
+            return cooldown
+
+        scale = state["rate_scale"]
+        wait = 0.0
+        if self.limit.rpm is not None and state["requests"] < 1:
+            wait = max(wait, (1 - state["requests"]) * 60 / (self.limit.rpm * scale))
+        if self.limit.tpm is not None:
+            # Requests larger than the whole bucket go through once it is full.
+            needed = min(tokens, self.limit.tpm)
+            if state["tokens"] < needed:
+                wait = max(wait, (needed - state["tokens"]) * 60 / (self.limit.tpm * scale))
+        if wait > 0:
+            return wait
+
+        if self.limit.rpm is not None:
+            state["requests"] -= 1
+        if self.limit.tpm is not None:
+            state["tokens"] -= tokens
+        return 0.0
+
+    async def _on_finished(self, unused_tokens: int, succeeded: bool) -> None:
+        """
+        Returns the unused reserved tokens and, for a successful request, grows
+        the request rate and concurrency bound back (AIMD).
+        """
+        if succeeded:
+            self.concurrency.on_success()
+        if not self.limit.has_buckets:
+            return
+
+        def update(state: dict) -> float:
+            self._refill(state, time.time())
+            if succeeded:
+                state["rate_scale"] = min(1.0, state["rate_scale"] + RATE_SCALE_INCREASE)
+            if self.limit.tpm is not None and unused_tokens > 0:
+                state["tokens"] = min(self.limit.tpm, state["tokens"] + unused_tokens)
+            return 0.0
+
+        await self._state.update(update)
+
+    async def _on_rate_limited(self, retry_after: Optional[float]) -> None:
+        self.concurrency.on_rate_limited()
+        backoff = retry_after if retry_after is not None else DEFAULT_BACKOFF_SECONDS
+        if not self.limit.has_buckets:
+            self._cooldown_until = max(self._cooldown_until, time.time() + backoff)
+            return
+
+        def update(state: dict) -> float:
+            now = time.time()
+            self._refill(state, now)
+            state["rate_scale"] = max(MIN_RATE_SCALE, state["rate_scale"] / 2)
+            state["cooldown_until"] = max(state.get("cooldown_until", 0.0), now + backoff)
+            return 0.0
+
+        await self._state.update(update)
+
+
+class RequestPermit:
+    """
+    Handle of an admitted request, used to report its outcome to the limiter.
+    """
+
+    def __init__(self, reserved_tokens: int):
+        self._reserved_tokens = reserved_tokens
+        self._used_tokens = 0
+        self.was_rate_limited = False
+        self.retry_after: Optional[float] = None
+
+    @property
+    def unused_tokens(self) -> int:
+        return self._reserved_tokens - self._used_tokens
+
+    def add_tokens(self, count: int) -> None:
+        """Counts tokens actually consumed (prompt or generated)."""
+        self._used_tokens += count
+
+    def rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Reports a 429 response; the limiter backs off when the request ends."""
+        self.was_rate_limited = True
+        self.retry_after = retry_after
+
+
+# Process-wide limiters, shared by every client drawing from the same buckets.
+_LIMITERS: Dict[str, RateLimiter] = {}
+
+def get_rate_limiter(provider: str, model_name: str) -> RateLimiter:
+    """
+    Returns the process-wide limiter that applies to a provider/model.
+
+    Its buckets are shared with the other processes only when LLM_RATE_LIMIT_DIR
+    names a directory (use one per run or per user, e.g. `mktemp -d`).
+    """
+    key, limit = get_rate_limit(provider, model_name)
+    if key not in _LIMITERS:
+        state_dir = os.getenv(STATE_DIR_VARIABLE)
+        _LIMITERS[key] = RateLimiter(key, limit, Path(state_dir) if state_dir else None)
+    return _LIMITERS[key]
@@ -0,0 +1,296 @@
+import asyncio
+import os
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, List, Optional, Set, Tuple
+
+from agent_layer.llm_agents.LLMs.general_llm import GeneralLLM, LLMWrapper
+from agent_layer.llm_agents.LLMs.quantiles import QuantileSketch
+from agent_layer.llm_agents.LLMs.rate_limiter import on_admitted
+from agent_layer.llm_agents.LLMs.retry_policy import TRANSIENT_STATUS_CODES, RetryPolicy
+
+# Time-to-first-token quantiles tracked per model (and usable as hedge thresholds).
+TRACKED_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+
+@dataclass(frozen=True)
+class ResilienceConfig:
+    """
+    Retry and hedging behaviour of ResilientLLM.
+
+    Attributes:
+        max_attempts (int): Attempts per request, including the first one.
+        hedge_quantile (Optional[float]): First-token latency quantile after which a
+                                          duplicate request is sent. None (the default)
+                                          disables hedging.
+        min_samples (int): Measured requests of a model before it is hedged (at least 1).
+        min_hedge_delay (float): Shortest wait (seconds) before hedging.
+        backup_model (Optional[str]): Model receiving the hedged requests (default: the same).
+    """
+    max_attempts: int = 3
+    hedge_quantile: Optional[float] = None
+    min_samples: int = 20
+    min_hedge_delay: float = 0.25
+    backup_model: Optional[str] = None
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if self.hedge_quantile is not None and self.hedge_quantile not in TRACKED_QUANTILES:
+            raise ValueError(f"hedge_quantile must be one of {TRACKED_QUANTILES} or None.")
+        if self.min_samples < 1:
+            raise ValueError("min_samples must be at least 1.")
+
+    @classmethod
+    def from_env(cls) -> "ResilienceConfig":
+        """
+        Reads LLM_MAX_ATTEMPTS, LLM_HEDGE_QUANTILE (e.g. "0.95"; unset or "off" disables hedging),
+        LLM_HEDGE_MIN_SAMPLES, LLM_HEDGE_MIN_DELAY and LLM_BACKUP_MODEL,
+        falling back to the defaults.
+        """
+        quantile = os.getenv("LLM_HEDGE_QUANTILE")
+        return cls(
+            max_attempts=int(os.getenv("LLM_MAX_ATTEMPTS", cls.max_attempts)),
+            hedge_quantile=cls.hedge_quantile if quantile is None else (
+                None if quantile.lower() in ("", "off", "none") else float(quantile)
+            ),
+            min_samples=int(os.getenv("LLM_HEDGE_MIN_SAMPLES", cls.min_samples)),
+            min_hedge_delay=float(os.getenv("LLM_HEDGE_MIN_DELAY", cls.min_hedge_delay)),
+            backup_model=os.getenv("LLM_BACKUP_MODEL") or None
+        )
+
+
+class LatencyTracker:
+    """
+    Per-model time-to-first-token quantiles, in constant memory (P² sketches).
+
+    Only the time after the rate limiter admitted a request is measured, so
+    throttling does not read as provider latency.
+    """
+
+    def __init__(self):
+        self._sketches: Dict[str, QuantileSketch] = {}
+
+    def record(self, model_name: str, seconds: float) -> None:
+        sketch = self._sketches.get(model_name)
+        if sketch is None:
+            sketch = self._sketches[model_name] = QuantileSketch(TRACKED_QUANTILES)
+        sketch.add(seconds)
+
+    def count(self, model_name: str) -> int:
+        sketch = self._sketches.get(model_name)
+        return sketch.count if sketch is not None else 0
+
+    def quantile(self, model_name: str, q: float) -> Optional[float]:
+        """
+        Returns the estimated quantile `q` (one of TRACKED_QUANTILES), or None
+        if the model was never measured.
+        """
+        sketch = self._sketches.get(model_name)
+        if sketch is None or not sketch.count:
+            return None
+        return sketch.values()[q]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns {model: {"count": n, "p50": ..., "p95": ...}} for every measured model.
+        """
+        return {
+            model: {"count": sketch.count, "p50": sketch.values()[0.5], "p95": sketch.values()[0.95]}
+            for model, sketch in self._sketches.items()
+        }
+
+
+_TRACKER: Optional[LatencyTracker] = None
+
+def get_latency_tracker() -> LatencyTracker:
+    """
+    Returns the process-wide latency tracker.
+    """
+    global _TRACKER
+    if _TRACKER is None:
+        _TRACKER = LatencyTracker()
+    return _TRACKER
+
+
+class _Attempt:
+    """
+    One request in flight: its stream and when it was admitted by the rate limiter.
+    """
+
+    __slots__ = ("llm", "stream", "admitted_at", "task")
+
+    def __init__(self, llm: GeneralLLM, stream: AsyncGenerator[str, None]):
+        self.llm = llm
+        self.stream = stream
+        # Clients without a rate limiter send their request right away.
+        self.admitted_at: Optional[float] = None if hasattr(llm, "rate_limiter") else time.perf_counter()
+        self.task: Optional[asyncio.Task] = None
+
+    def admit(self) -> None:
+        self.admitted_at = time.perf_counter()
+
+
+class ResilientLLM(LLMWrapper):
+    """
+    Wraps an LLM client with request retries and hedging.
+
+    Transient errors (connection failures, timeouts, 5xx) raised before the
+    first token are retried with jittered exponential back-off; 429s are
+    already retried by the client's rate limiter. When hedging is enabled and
+    a model has enough measurements, a request whose first token is later than the configured
+    quantile is duplicated (to the backup model, if any) and the stream that
+    answers first is kept; the other one is closed. Errors after the first
+    token are raised: the caller already consumed part of the response.
+    """
+
+    def __init__(
+        self,
+        llm: GeneralLLM,
+        config: Optional[ResilienceConfig] = None,
+        backup: Optional[GeneralLLM] = None,
+        tracker: Optional[LatencyTracker] = None
+    ):
+        """
+        Args:
+            llm (GeneralLLM): The primary client.
+            config (ResilienceConfig, optional): Defaults to `ResilienceConfig.from_env()`.
+            backup (GeneralLLM, optional): Client of the hedged requests (default: `llm`).
+            tracker (LatencyTracker, optional): Defaults to the process-wide tracker.
+        """
+        super().__init__(llm)
+        self.config = config if config is not None else ResilienceConfig.from_env()
+        self.backup = backup
+        self.tracker = tracker if tracker is not None else get_latency_tracker()
+        self.retry_policy = RetryPolicy(
+            max_attempts=self.config.max_attempts,
+            initial_backoff=0.5,
+            max_backoff=8.0,
+            transient_status_codes=TRANSIENT_STATUS_CODES - {429}
+        )
+        self.retries = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self._closing: Set[asyncio.Task] = set()
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncGenerator[str, None]:
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            try:
+                first_token, stream = await self._first_token(messages, temperature, max_tokens)
+                break
+            except Exception as error:
+                if attempt == self.retry_policy.max_attempts or not self.retry_policy.is_transient(error):
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+
+        async with aclosing(stream):
+            if first_token is None:
+                return
+            yield first_token
+            async for token in stream:
+                yield token
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Seconds to wait for the first token before hedging, or None if the
+        request is not hedged.
+        """
+        if self.config.hedge_quantile is None or self.tracker.count(self.model_name) < self.config.min_samples:
+            return None
+        threshold = self.tracker.quantile(self.model_name, self.config.hedge_quantile)
+        if threshold is None:
+            return None
+        return max(self.config.min_hedge_delay, threshold)
+
+    async def _first_token(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> Tuple[Optional[str], AsyncGenerator[str, None]]:
+        """
+        Starts the request (and its hedge, if it is late) and returns the first
+        token of the winner with the rest of its stream.
+        """
+        primary = self._start(self.llm, messages, temperature, max_tokens)
+        attempts = [primary]
+        winner = primary
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                await self._wait_first_token(primary, delay)
+            if delay is None or primary.task.done():
+                return await primary.task, primary.stream
+
+            self.hedges += 1
+            attempts.append(self._start(self.backup or self.llm, messages, temperature, max_tokens))
+            pending = {attempt.task for attempt in attempts}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in attempts:
+                    if attempt.task in done and attempt.task.exception() is None:
+                        winner = attempt
+                        if attempt is not primary:
+                            self.hedges_won += 1
+                        return attempt.task.result(), attempt.stream
+            # Both failed: the primary's error decides whether to retry.
+            return await primary.task, primary.stream
+        finally:
+            for attempt in attempts:
+                if attempt is not winner:
+                    self._abandon(attempt)
+                elif not attempt.task.done():
+                    # Interrupted (cancelled caller): stop the request.
+                    attempt.task.cancel()
+
+    def _start(
+        self,
+        llm: GeneralLLM,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> _Attempt:
+        attempt = _Attempt(llm, llm.stream_chat(messages, temperature=temperature, max_tokens=max_tokens))
+        attempt.task = asyncio.create_task(self._read_first_token(attempt))
+        return attempt
+
+    async def _read_first_token(self, attempt: _Attempt) -> Optional[str]:
+        # Runs in its own task, so the callback only sees this request's admission.
+        on_admitted.set(attempt.admit)
+        token = await anext(attempt.stream, None)
+        if attempt.admitted_at is not None:
+            self.tracker.record(attempt.llm.model_name, time.perf_counter() - attempt.admitted_at)
+        return token
+
+    async def _wait_first_token(self, attempt: _Attempt, delay: float) -> None:
+        # The clock starts once the rate limiter lets the request through.
+        while not attempt.task.done():
+            if attempt.admitted_at is None:
+                remaining = delay
+            else:
+                remaining = attempt.admitted_at + delay - time.perf_counter()
+                if remaining <= 0:
+                    return
+            await asyncio.wait({attempt.task}, timeout=remaining)
+
+    def _abandon(self, attempt: _Attempt) -> None:
+        """
+        Stops an attempt that was not kept.
+        """
+        task = attempt.task
+        if not task.done():
+            # Interrupts the request; its stream ends with the cancellation.
+            task.cancel()
+            return
+        if task.cancelled() or task.exception() is not None:
+            return
+        # It has a first token too: close the rest of its stream.
+        closing = asyncio.create_task(attempt.stream.aclose())
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import aclosing
+from contextvars import ContextVar
+from pathlib import Path
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
+
+from agent_layer.llm_agents.LLMs.general_llm import GeneralLLM, LLMWrapper
+
+# Share of `max_bytes` kept after an eviction, so evictions do not run on every write.
+EVICTION_TARGET = 0.9
+
+# Identifies the current trajectory (e.g. the evaluator's run ID). Sampled
+# (temperature > 0) responses are only cached under a scope: replaying a run
+# gives back that run's own samples, while different runs stay independent.
+cache_scope: ContextVar[Optional[str]] = ContextVar("cache_scope", default=None)
+
+# Set by consumers that stop reading as soon as the response contains its
+# action. Only they may store a truncated response or be served one: the same
+# tokens make them stop at the same point, while other consumers need the rest.
+stops_at_action: ContextVar[bool] = ContextVar("stops_at_action", default=False)
+
+class ResponseCache:
+    """
+    Content-addressed store of LLM responses on local disk.
+
+    Each response is a small JSON file named after the hash of its request,
+    with its tokens and whether it is complete or only a prefix.
+    Reading a response refreshes its modification time; once the directory
+    exceeds `max_bytes`, the least recently used files are deleted. Writes are
+    atomic, so several processes can share the directory. `put` may scan the
+    whole directory and is meant to run in a worker thread (see CachedLLM).
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 1024 ** 3):
+        """
+        Args:
+            directory (str | Path): Where the responses are stored.
+            max_bytes (int): Size above which the oldest responses are evicted.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def key(
+        self,
+        model_name: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> Optional[str]:
+        """
+        Returns the cache key of a request, or None if it must not be cached
+        (a sampled request outside of any `cache_scope`).
+        """
+        scope = None
+        if temperature > 0:
+            scope = cache_scope.get()
+            if scope is None:
+                return None
+        request = {
+            "model": model_name,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "scope": scope
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[List[str], bool]]:
+        """
+        Returns the tokens of a stored response and whether it is complete, or None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        return entry["tokens"], entry["complete"]
+
+    def put(self, key: str, tokens: List[str], complete: bool = True) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"tokens": tokens, "complete": complete}, f)
+        os.replace(temp_path, path)
+
+        with self._size_lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += path.stat().st_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        return [(path, path.stat()) for path in self.directory.glob("*/*.json")]
+
+    def _scan_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _evict(self) -> None:
+        # Other processes write to the same directory: start from its real content.
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        target = self.max_bytes * EVICTION_TARGET
+        for path, stat in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= stat.st_size
+        self._size = size
+
+
+class CachedLLM(LLMWrapper):
+    """
+    Wraps an LLM client and serves repeated requests from a ResponseCache.
+
+    A hit is replayed token by token, so callers (and their `on_reasoning`
+    callbacks) cannot tell it from a live stream. Responses are stored when
+    they end. A stream closed early is stored as a truncated prefix only if
+    its consumer set `stops_at_action`, and only such consumers are served a
+    prefix: for the others it is a miss, and the complete response replaces
+    it. Streams interrupted by an error or a cancellation are not stored.
+    """
+
+    def __init__(self, llm: GeneralLLM, cache: ResponseCache):
+        super().__init__(llm)
+        self.cache = cache
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> AsyncGenerator[str, None]:
+        key = self.cache.key(self.model_name, messages, temperature, max_tokens)
+        partial_ok = stops_at_action.get()
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None and (cached[1] or partial_ok):
+                for token in cached[0]:
+                    yield token
+                return
+
+        tokens = []
+        try:
+            async with aclosing(self.llm.stream_chat(messages, temperature=temperature, max_tokens=max_tokens)) as stream:
+                async for token in stream:
+                    tokens.append(token)
+                    yield token
+        except GeneratorExit:
+            # The consumer has its action: it will stop at the same point on replay.
+            if key is not None and partial_ok:
+                await asyncio.to_thread(self.cache.put, key, tokens, False)
+            raise
+
+        if key is not None:
+            # Off the event loop: the first write and evictions scan the directory.
+            await asyncio.to_thread(self.cache.put, key, tokens)
+
+
+_CACHE: Optional[ResponseCache] = None
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Returns the process-wide cache configured through LLM_CACHE_DIR (and
+    LLM_CACHE_MAX_MB, default 1024), or None when caching is disabled.
+    """
+    global _CACHE
+    directory = os.getenv("LLM_CACHE_DIR")
+    if not directory:
+        return None
+    if _CACHE is None or _CACHE.directory != Path(directory):
+        _CACHE = ResponseCache(directory, max_bytes=int(float(os.getenv("LLM_CACHE_MAX_MB", "1024")) * 1024 ** 2))
+    return _CACHE
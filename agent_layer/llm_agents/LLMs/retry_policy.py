@@ -0,0 +1,55 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import FrozenSet, Tuple, Type
+
+from openai import APIConnectionError
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and server errors.
+TRANSIENT_STATUS_CODES: FrozenSet[int] = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How often a failed operation (an evaluation session, an LLM request) is
+    attempted again, and after how long.
+
+    Only transient errors (network failures, timeouts, rate limits and server
+    errors) are retried; any other exception (a parse bug, an engine
+    assertion, a rejected API key) fails the operation at once.
+
+    Attributes:
+        max_attempts (int): Attempts per operation, including the first one.
+        initial_backoff (float): Seconds before the first retry.
+        max_backoff (float): Upper bound of the wait between attempts.
+        multiplier (float): Growth factor of the wait after each attempt.
+        jitter (float): Random spread of each wait, as a fraction of it.
+        transient_errors (Tuple[Type[BaseException], ...]): Exception types always retried.
+        transient_status_codes (FrozenSet[int]): HTTP statuses (read from the
+                                                 exception's `status_code`) retried.
+    """
+    max_attempts: int = 3
+    initial_backoff: float = 1.0
+    max_backoff: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    transient_errors: Tuple[Type[BaseException], ...] = (
+        ConnectionError, TimeoutError, asyncio.TimeoutError, APIConnectionError
+    )
+    transient_status_codes: FrozenSet[int] = TRANSIENT_STATUS_CODES
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+    def is_transient(self, error: BaseException) -> bool:
+        if isinstance(error, self.transient_errors):
+            return True
+        return getattr(error, "status_code", None) in self.transient_status_codes
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait after the failed attempt number `attempt` (1-based).
+        """
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
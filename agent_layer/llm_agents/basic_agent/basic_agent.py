@@ -1,7 +1,8 @@
 import os
 import json
-from typing import List, Dict, Optional
+from typing import Optional
 
+from agent_layer.llm_agents.context_window import ContextWindow
 from agent_layer.llm_agents.llm_agent import LLMAgent
 from agent_layer.agent_actor import ReasoningCallback
 
@@ -9,7 +10,7 @@ class BasicAgent(LLMAgent):
     """
     A concrete implementation of an LLM Agent.
     
-    It maintains a session memory (message history) and uses a predefined system prompt
+    It maintains a session memory (a ContextWindow) and uses a predefined system prompt
     loaded from a JSON configuration file to guide the LLM's behavior.
     """
 
@@ -17,7 +18,10 @@ class BasicAgent(LLMAgent):
         self, 
         llm: str = "grok-4-1-fast-non-reasoning", 
         system_prompt_id: str = "check_hypothesis", 
-        on_reasoning: Optional[ReasoningCallback] = None
+        on_reasoning: Optional[ReasoningCallback] = None,
+        max_context_tokens: int = 0,
+        keep_last_turns: int = 4,
+        drain_after_action: bool = False
     ):
         """
         Initialize the BasicAgent.
@@ -26,10 +30,13 @@ class BasicAgent(LLMAgent):
             model_name (str): The identifier of the model to use (passed to LLMAgent).
             system_prompt_id (str): The key to look up in 'system_prompts.json'.
             on_reasoning (ReasoningCallback, optional): Hook for real-time UI streaming.
+            max_context_tokens (int): Prompt token budget. 0 sends the whole history.
+            keep_last_turns (int): Turns sent verbatim under a budget; older ones are summarized.
+            drain_after_action (bool): Keep streaming the reasoning written after the action.
         """
-        super().__init__(model_name=llm, on_reasoning=on_reasoning)
+        super().__init__(model_name=llm, on_reasoning=on_reasoning, drain_after_action=drain_after_action)
         
-        self.message_history: List[Dict[str, str]] = []
+        self.context = ContextWindow(max_context_tokens or None, keep_last_turns)
         self.system_prompt = self._load_system_prompt(system_prompt_id)
 
     def _load_system_prompt(self, system_prompt_id: str) -> str:
@@ -65,9 +72,11 @@ class BasicAgent(LLMAgent):
         Processes the game observation and returns the next action.
 
         This method:
-        1. Updates internal memory with the new observation.
-        2. Streams the response from the LLM client (emitting reasoning to UI).
-        3. Parses the final action command.
+        1. Updates internal memory with the new observation and builds the
+           prompt within the token budget.
+        2. Streams the response from the LLM client (emitting reasoning to UI)
+           until its action is complete.
+        3. Returns the parsed action command.
 
         Args:
             observation (str): The text description from the game environment.
@@ -75,22 +84,9 @@ class BasicAgent(LLMAgent):
         Returns:
             str: The parsed action command (e.g., "open door").
         """
-        self.message_history.append({
-            "role": "user", 
-            "content": observation
-        })
-        
-        messages = [{"role": "system", "content": self.system_prompt}] + self.message_history
-        full_response = ""
-
-
-        async for token in self.llm_client.stream_chat(messages):
-            full_response += token
-            await self.emit_reasoning(token)
-
-        self.message_history.append({
-            "role": "assistant", 
-            "content": full_response
-        })
+        self.context.add_observation(observation)
+        messages = self.context.build(self.system_prompt)
+        response, action = await self._stream_action(messages)
+        self.context.add_response(response, action)
 
-        return self._extract_action(full_response)
\ No newline at end of file
+        return action
\ No newline at end of file
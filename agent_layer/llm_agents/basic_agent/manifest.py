@@ -2,7 +2,7 @@ import os
 import json
 from typing import List
 from app_layer.registries.generic_registry import EntityManifest
-from app_layer.registries.specs import ChoiceParamSpec
+from app_layer.registries.specs import BoolParamSpec, ChoiceParamSpec, IntParamSpec
 from .basic_agent import BasicAgent
 from agent_layer.llm_agents.LLMs.llm_selector import list_available_llms
 
@@ -49,6 +49,28 @@ manifest = EntityManifest(
             description="The system prompt identity defined in system_prompts.json.",
             choices=prompt_ids,
             default=prompt_ids[0]
+        ),
+        IntParamSpec(
+            id="max_context_tokens",
+            label="Context Budget (tokens)",
+            description="Prompt token budget; older turns are summarized to fit. 0 sends the whole history.",
+            default=0,
+            min_value=0,
+            max_value=float('inf')
+        ),
+        IntParamSpec(
+            id="keep_last_turns",
+            label="Verbatim Turns",
+            description="Number of recent turns sent verbatim when a context budget is set.",
+            default=4,
+            min_value=0,
+            max_value=float('inf')
+        ),
+        BoolParamSpec(
+            id="drain_after_action",
+            label="Stream Reasoning After Action",
+            description="Keep streaming what the model writes after its action instead of closing the request.",
+            default=False
         )
     ]
 )
\ No newline at end of file
@@ -0,0 +1,135 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from agent_layer.llm_agents.LLMs.rate_limiter import estimate_tokens
+
+# Tokens added by the chat format around each message (role, separators).
+MESSAGE_OVERHEAD_TOKENS = 4
+
+MEMORY_HEADER = "\n\nSummary of earlier turns (observation -> your action):"
+
+@dataclass
+class _Turn:
+    observation: str
+    response: str
+    action: str
+    tokens: int
+
+
+class ContextWindow:
+    """
+    Conversation memory of an LLM agent with a prompt token budget.
+
+    The system prompt and the last `keep_last_turns` turns are sent verbatim.
+    Older turns are folded into a structured memory appended to the system
+    prompt: one line per turn with its (shortened) observation and the action
+    that was taken, without the reasoning. When the prompt would still exceed
+    `max_tokens`, more recent turns are folded and then the oldest memory
+    lines are dropped. The current observation is always sent whole.
+
+    Tokens are estimated locally (the rate limiter's estimate), and the totals
+    are kept up to date as turns are added, so building a prompt does not
+    recount the history.
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None, keep_last_turns: int = 4, max_note_chars: int = 200):
+        """
+        Args:
+            max_tokens (int, optional): Prompt budget. None keeps the whole
+                                        conversation verbatim.
+            keep_last_turns (int): Turns sent verbatim when a budget is set.
+            max_note_chars (int): Longest observation kept in a memory line.
+        """
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1.")
+        if keep_last_turns < 0:
+            raise ValueError("keep_last_turns cannot be negative.")
+
+        self.max_tokens = max_tokens
+        self.keep_last_turns = keep_last_turns
+        self.max_note_chars = max_note_chars
+
+        self._turns: Deque[_Turn] = deque()
+        self._turns_tokens = 0
+        self._notes: Deque[str] = deque()
+        self._notes_tokens = 0
+        self._folded = 0
+        self._dropped = 0
+        self._pending: Optional[str] = None
+
+    @property
+    def turns(self) -> int:
+        """
+        Number of completed turns, including the folded ones.
+        """
+        return self._folded + len(self._turns)
+
+    def add_observation(self, observation: str) -> None:
+        self._pending = observation
+
+    def add_response(self, response: str, action: str) -> None:
+        """
+        Completes the current turn with the model's response and the action parsed from it.
+        """
+        observation = self._pending if self._pending is not None else ""
+        self._pending = None
+        tokens = _message_tokens(observation) + _message_tokens(response)
+        self._turns.append(_Turn(observation, response, action, tokens))
+        self._turns_tokens += tokens
+
+    def build(self, system_prompt: str) -> List[Dict[str, str]]:
+        """
+        Returns the messages of the next request, within the budget if possible.
+        """
+        if self.max_tokens is not None:
+            while len(self._turns) > self.keep_last_turns:
+                self._fold_oldest_turn()
+
+            # The memory header is reserved even while the memory is empty.
+            fixed = (
+                _message_tokens(system_prompt) + _message_tokens(self._pending or "")
+                + estimate_tokens(MEMORY_HEADER)
+            )
+            while self._turns and fixed + self._notes_tokens + self._turns_tokens > self.max_tokens:
+                self._fold_oldest_turn()
+            while self._notes and fixed + self._notes_tokens > self.max_tokens:
+                self._notes_tokens -= estimate_tokens(self._notes.popleft())
+                self._dropped += 1
+
+        messages = [{"role": "system", "content": system_prompt + self._render_memory()}]
+        for turn in self._turns:
+            messages.append({"role": "user", "content": turn.observation})
+            messages.append({"role": "assistant", "content": turn.response})
+        if self._pending is not None:
+            messages.append({"role": "user", "content": self._pending})
+        return messages
+
+    def _fold_oldest_turn(self) -> None:
+        turn = self._turns.popleft()
+        self._turns_tokens -= turn.tokens
+        self._folded += 1
+
+        note = f"Turn {self._folded}: {self._shorten(turn.observation)} -> {turn.action}"
+        self._notes.append(note)
+        self._notes_tokens += estimate_tokens(note)
+
+    def _shorten(self, observation: str) -> str:
+        # The end of an observation (latest state, feedback) matters most.
+        text = " ".join(observation.split())
+        if len(text) > self.max_note_chars:
+            text = "..." + text[-self.max_note_chars:]
+        return text
+
+    def _render_memory(self) -> str:
+        if not self._notes:
+            return ""
+        lines = [MEMORY_HEADER]
+        if self._dropped:
+            lines.append(f"[{self._dropped} earlier turns not retained]")
+        lines.extend(self._notes)
+        return "\n".join(lines)
+
+
+def _message_tokens(content: str) -> int:
+    return estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
@@ -1,8 +1,57 @@
+import asyncio
 import re
 from abc import ABC
-from typing import Optional
+from contextlib import aclosing, suppress
+from typing import AsyncGenerator, Dict, List, Optional, Set, Tuple
 from agent_layer.agent_actor import AgentActor, ReasoningCallback
 from agent_layer.llm_agents.LLMs.llm_selector import get_llm
+from agent_layer.llm_agents.LLMs.response_cache import stops_at_action
+
+# Supported formats: "action: { jump }", "ACTION:{attack}", "Action: { open door }"
+ACTION_PATTERN = re.compile(r'action\s*:\s*\{(.*?)\}', flags=re.IGNORECASE | re.DOTALL)
+_ACTION_OPENING = re.compile(r'action\s*:\s*\{', flags=re.IGNORECASE)
+
+# Characters kept from the end of the text when no opening was found, so an
+# opening split across tokens (e.g. "act" + "ion: {") is still detected.
+_OPENING_LOOKBACK = 64
+
+class ActionParser:
+    """
+    Finds the action of a response while it is being streamed.
+
+    `feed` returns the action as soon as the first complete `action: { ... }`
+    block has been received; it is the same action `LLMAgent._extract_action`
+    would find in the full text. Each character is scanned about once.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.action: Optional[str] = None
+        self._scan_from = 0
+        self._content_start: Optional[int] = None
+
+    def feed(self, token: str) -> Optional[str]:
+        """
+        Adds a token and returns the action once it is complete (None before).
+        """
+        self.text += token
+        if self.action is not None:
+            return self.action
+
+        if self._content_start is None:
+            match = _ACTION_OPENING.search(self.text, self._scan_from)
+            if match is None:
+                self._scan_from = max(self._scan_from, len(self.text) - _OPENING_LOOKBACK)
+                return None
+            self._content_start = self._scan_from = match.end()
+
+        end = self.text.find("}", self._scan_from)
+        if end == -1:
+            self._scan_from = len(self.text)
+            return None
+        self.action = self.text[self._content_start:end].strip()
+        return self.action
+
 
 class LLMAgent(AgentActor, ABC):
     """
@@ -14,7 +63,12 @@ class LLMAgent(AgentActor, ABC):
     2. Providing utilities to parse structured commands (actions) from unstructured chat responses.
     """
 
-    def __init__(self, model_name: str, on_reasoning: Optional[ReasoningCallback] = None):
+    def __init__(
+        self,
+        model_name: str,
+        on_reasoning: Optional[ReasoningCallback] = None,
+        drain_after_action: bool = False
+    ):
         """
         Initialize the LLM Agent.
 
@@ -22,11 +76,62 @@ class LLMAgent(AgentActor, ABC):
             model_name (str): The identifier of the model to be loaded via the factory (e.g., 'gpt-4').
             on_reasoning (ReasoningCallback, optional): A callback function to handle real-time 
                                                         streaming of the agent's internal reasoning.
+            drain_after_action (bool): Keep reading the response after its action (in the
+                                       background, for the reasoning display) instead of
+                                       closing the stream.
         """
         super().__init__(on_reasoning)
         self.model_name = model_name
+        self.drain_after_action = drain_after_action
         
         self.llm_client = get_llm(model_name)
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    async def prepare(self) -> None:
+        """
+        Warms up the connection of the LLM client.
+        """
+        await self.llm_client.warm_up()
+
+    async def _stream_action(self, messages: List[Dict[str, str]]) -> Tuple[str, str]:
+        """
+        Streams a response (emitting it as reasoning) and stops reading as soon
+        as its action is complete, instead of waiting for the model to finish.
+        The rest of the stream is closed (or drained) in the background.
+
+        Returns:
+            Tuple[str, str]: The text received and the action.
+        """
+        parser = ActionParser()
+        stream = self.llm_client.stream_chat(messages)
+
+        # A drained stream is read to its end, so it needs complete responses.
+        scope = stops_at_action.set(not self.drain_after_action)
+        try:
+            async for token in stream:
+                self.record_token()
+                await self.emit_reasoning(token)
+                if parser.feed(token) is not None:
+                    self._release_stream(stream)
+                    return parser.text, parser.action
+        finally:
+            stops_at_action.reset(scope)
+
+        return parser.text, self._extract_action(parser.text)
+
+    def _release_stream(self, stream: AsyncGenerator[str, None]) -> None:
+        coroutine = self._drain(stream) if self.drain_after_action else stream.aclose()
+        task = asyncio.create_task(coroutine)
+        # The loop only keeps weak references to its tasks.
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _drain(self, stream: AsyncGenerator[str, None]) -> None:
+        # The action was already played: late errors do not matter.
+        with suppress(Exception):
+            async with aclosing(stream):
+                async for token in stream:
+                    await self.emit_reasoning(token)
 
     def _extract_action(self, response_text: str) -> str:
         """
@@ -42,9 +147,7 @@ class LLMAgent(AgentActor, ABC):
             str: The content found inside the action brackets.
                  Returns the original text if no pattern is matched (fallback).
         """
-        # Supported formats: "action: { jump }", "ACTION:{attack}", "Action: { open door }"
-        pattern = r'action\s*:\s*\{(.*?)\}'
-        match = re.search(pattern, response_text, flags=re.IGNORECASE | re.DOTALL)
+        match = ACTION_PATTERN.search(response_text)
 
         if not match:
             # Fallback: Return the raw text. 
@@ -6,6 +6,7 @@ from app_layer.core.game_runner import GameRunner
 from game_layer.game_engine.core_engine import CoreEngine
 from agent_layer.actor import Actor
 from agent_layer.human_actor import HumanActor, InputSource
+from app_layer.core.runner_types import SessionBudget
 
 # Factories
 from ..registries.manager import get_game_registry, get_agent_registry
@@ -15,16 +16,23 @@ class SessionBuilder(ABC):
     Abstract Base Class for configuring and building Game Sessions.
     """
 
-    def __init__(self, game_name: str, game_params: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        game_name: str,
+        game_params: Optional[Dict[str, Any]] = None,
+        budget: Optional[SessionBudget] = None
+    ):
         """
         Base initialization for shared session parameters.
 
         Args:
             game_name (str): Identifier of the game to load.
             game_params (dict, optional): Specific parameters for the Game constructor.
+            budget (SessionBudget, optional): Turn, wall-time and token limits of the session.
         """
         self.game_name = game_name
         self.game_params = game_params if game_params is not None else {}
+        self.budget = budget
 
     def build(self) -> GameRunner:
         """
@@ -44,7 +52,7 @@ class SessionBuilder(ABC):
 
         actor = self._create_actor()
 
-        return GameRunner(game, actor)
+        return GameRunner(game, actor, self.budget)
 
     @abstractmethod
     def _create_actor(self) -> Actor:
@@ -62,16 +70,18 @@ class HumanSessionBuilder(SessionBuilder):
         self, 
         game_name: str, 
         input_adapter: InputSource, 
-        game_params: Optional[Dict[str, Any]] = None
+        game_params: Optional[Dict[str, Any]] = None,
+        budget: Optional[SessionBudget] = None
     ):
         """
         Args:
             game_name (str): The game to play.
             input_adapter (InputSource): Interface for reading human input.
             game_params (dict, optional): Configuration for the game.
+            budget (SessionBudget, optional): Limits of the session.
         """
         # Pass game config to parent
-        super().__init__(game_name, game_params)
+        super().__init__(game_name, game_params, budget)
         self.input_adapter = input_adapter
 
     def _create_actor(self) -> Actor:
@@ -87,7 +97,8 @@ class AgentSessionBuilder(SessionBuilder):
         game_name: str,
         agent_name: str, 
         game_params: Optional[Dict[str, Any]] = None,
-        agent_params: Optional[Dict[str, Any]] = None
+        agent_params: Optional[Dict[str, Any]] = None,
+        budget: Optional[SessionBudget] = None
     ):
         """
         Args:
@@ -97,9 +108,10 @@ class AgentSessionBuilder(SessionBuilder):
             on_reasoning (Callable, optional): Callback for streaming thought process.
             game_params (dict, optional): Configuration for the game.
             agent_params (dict, optional): Configuration for the agent.
+            budget (SessionBudget, optional): Limits of the session.
         """
         # Pass game config to parent
-        super().__init__(game_name, game_params)
+        super().__init__(game_name, game_params, budget)
         
         self.agent_name = agent_name
         self.agent_params = agent_params if agent_params is not None else {}
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
+from app_layer.core.runner_types import SessionBudget
+
 @dataclass
 class SessionConfig:
     """
@@ -10,4 +12,5 @@ class SessionConfig:
     is_human: bool
     agent_name: Optional[str] = None
     game_params: Dict[str, Any] = field(default_factory=dict)
-    agent_params: Optional[Dict[str, Any]] = None
\ No newline at end of file
+    agent_params: Optional[Dict[str, Any]] = None
+    budget: Optional[SessionBudget] = None
\ No newline at end of file
@@ -1,7 +1,11 @@
-from typing import AsyncGenerator, Union
+import asyncio
+import time
+from typing import AsyncGenerator, Optional, Tuple, Union
 from game_layer.game_engine.core_engine import CoreEngine, GameStatus
-from agent_layer.actor import Actor
-from app_layer.core.runner_types import GameEvent, GameStart, GameTurn, GameResult
+from agent_layer.actor import Actor, ActionTimer, active_timer
+from app_layer.core.runner_types import (
+    GameEvent, GameStart, GameTurn, GameResult, TurnTiming, SessionTiming, SessionBudget, BudgetExhausted
+)
 
 class GameRunner:
     """
@@ -13,7 +17,7 @@ class GameRunner:
     flow control, rate limiting, and presentation logic independently.
     """
 
-    def __init__(self, game: CoreEngine, actor: Actor):
+    def __init__(self, game: CoreEngine, actor: Actor, budget: Optional[SessionBudget] = None):
         """
         Initialize the Game Runner.
 
@@ -22,27 +26,35 @@ class GameRunner:
                                state management and logic.
             actor (Actor): The asynchronous entity (AI Agent or Human Adapter) 
                            responsible for making decisions.
+            budget (SessionBudget, optional): Turn, wall-time and token limits of the session.
         """
         self.game = game
         self.actor = actor
+        self.budget = budget if budget is not None else SessionBudget()
 
     async def run(self) -> AsyncGenerator[GameEvent, None]:
         """
         Executes the main game loop indefinitely until the Game Engine signals a stop.
 
         The method handles the flow in three phases:
-        1. **Initialization**: Starts the game and yields the initial scene.
+        1. **Initialization**: Lets the actor prepare (e.g. warm up its LLM
+           connection), starts the game and yields the initial scene.
         2. **Loop**: Alternates between Actor decisions and Game steps. 
            Input validation errors are handled internally by the Game Engine 
            and returned as standard observations.
         3. **Termination**: Determines the final result based on the Game Status.
 
+        When a budget limit is reached, the action in progress (if any) is
+        cancelled and the session ends with a `BudgetExhausted` status.
+
         Yields:
             GameStart: Once, upon initialization.
             GameTurn: Repeatedly, for every action taken.
-            GameResult: Once, when the game status is no longer RUNNING.
+            GameResult: Once, when the game status is no longer RUNNING or the
+                        budget is exhausted.
         """
         # 1. Initialization Phase
+        await self.actor.prepare()
         current_observation = self.game.start()
         score = self.game.get_score()
         yield GameStart(
@@ -52,19 +64,43 @@ class GameRunner:
         )
 
         iteration = 0
+        session_timing = SessionTiming()
+        started_at = time.perf_counter()
+        exhausted: Optional[BudgetExhausted] = None
         
         # 2. Main Loop Phase
         while self.game.game_status == GameStatus.RUNNING:
-            
-            action = await self.actor.get_action(current_observation)
+            exhausted = self._check_budget(iteration, started_at, session_timing)
+            if exhausted is not None:
+                break
+
+            timer, action = await self._request_action(current_observation, started_at, session_timing)
+            if isinstance(action, BudgetExhausted):
+                exhausted = action
+                break
+            action_done = time.perf_counter()
 
             new_observation = self.game.step(action)
+            step_done = time.perf_counter()
             score = self.game.get_score()
+
+            timing = TurnTiming(
+                action_seconds=action_done - timer.started_at,
+                step_seconds=step_done - action_done,
+                first_token_seconds=(
+                    timer.first_token_at - timer.started_at if timer.first_token_at is not None else None
+                ),
+                tokens=timer.tokens,
+                throttled_seconds=timer.throttled_seconds
+            )
+            session_timing.add(timing)
+
             yield GameTurn(
                 iteration=iteration + 1,
                 action=action,
                 observation=new_observation,
-                score=score
+                score=score,
+                timing=timing
             )
 
             current_observation = new_observation
@@ -73,7 +109,67 @@ class GameRunner:
         # 3. Termination Phase
         final_score = self.game.get_score()
         yield GameResult(
-            final_status=self.game.game_status,
-            history_log=self.game.get_full_history(),
-            final_score=final_score
-        )
\ No newline at end of file
+            final_status=exhausted if exhausted is not None else self.game.game_status,
+            history=self.game.get_history(),
+            final_score=final_score,
+            timing=session_timing
+        )
+
+    def _check_budget(self, iteration: int, started_at: float, session_timing: SessionTiming) -> Optional[BudgetExhausted]:
+        """
+        Returns the budget limit already reached before a new turn, if any.
+        """
+        budget = self.budget
+        if budget.max_turns is not None and iteration >= budget.max_turns:
+            return BudgetExhausted.TURNS
+        if budget.max_seconds is not None and time.perf_counter() - started_at >= budget.max_seconds:
+            return BudgetExhausted.WALL_TIME
+        if budget.max_tokens is not None and session_timing.tokens >= budget.max_tokens:
+            return BudgetExhausted.TOKENS
+        return None
+
+    async def _request_action(
+        self,
+        observation: str,
+        started_at: float,
+        session_timing: SessionTiming
+    ) -> Tuple[ActionTimer, Union[str, BudgetExhausted]]:
+        """
+        Asks the actor for an action under the remaining budget.
+
+        The action runs in its own task so it can be cancelled when the wall
+        time runs out or the timer reports that the token budget is spent.
+
+        Returns:
+            The turn's timer, and either the action or the limit that cancelled it.
+        """
+        budget = self.budget
+        timer = ActionTimer(
+            token_limit=budget.max_tokens - session_timing.tokens if budget.max_tokens is not None else None
+        )
+        self.actor.timer = timer
+        timer_token = active_timer.set(timer)
+        try:
+            # The task copies the current context, including the active timer.
+            task = asyncio.create_task(self.actor.get_action(observation))
+        finally:
+            active_timer.reset(timer_token)
+        timer.on_limit = task.cancel
+
+        timeout = None
+        if budget.max_seconds is not None:
+            timeout = max(budget.max_seconds - (time.perf_counter() - started_at), 0.0)
+
+        try:
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if not done:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                return timer, BudgetExhausted.WALL_TIME
+            if task.cancelled() and timer.token_limit is not None and timer.tokens >= timer.token_limit:
+                return timer, BudgetExhausted.TOKENS
+            return timer, task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+            self.actor.timer = None
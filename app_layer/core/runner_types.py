@@ -1,6 +1,126 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum, auto
 from game_layer.game_engine.core_engine import GameStatus
-from typing import Union
+from game_layer.game_engine.history import SessionHistory
+from typing import Optional, Union
+
+@dataclass(frozen=True)
+class SessionBudget:
+    """
+    Per-session limits enforced by the GameRunner. None means unlimited.
+
+    Attributes:
+        max_turns (int, optional): Actions sent to the game.
+        max_seconds (float, optional): Wall time since the game started.
+        max_tokens (int, optional): Streamed tokens over all turns. The action
+                                    being generated is cancelled as soon as the
+                                    limit is reached.
+    """
+    max_turns: Optional[int] = None
+    max_seconds: Optional[float] = None
+    max_tokens: Optional[int] = None
+
+    def __post_init__(self):
+        for name in ("max_turns", "max_seconds", "max_tokens"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive.")
+
+class BudgetExhausted(Enum):
+    """
+    Final status of a session ended by its SessionBudget while the game was
+    still running.
+    """
+    TURNS = auto()
+    WALL_TIME = auto()
+    TOKENS = auto()
+
+@dataclass(frozen=True)
+class TurnTiming:
+    """
+    Timing measurements of a single turn.
+
+    Attributes:
+        action_seconds (float): Wall time of `actor.get_action`.
+        step_seconds (float): Wall time of `game.step`.
+        first_token_seconds (Optional[float]): Time until the actor received its first
+                                               streamed token (None for non-streaming actors).
+        tokens (int): Streamed tokens (provider chunks) received by the actor.
+        throttled_seconds (float): Part of `action_seconds` spent waiting for the
+                                   LLM rate limiter.
+    """
+    action_seconds: float
+    step_seconds: float
+    first_token_seconds: Optional[float] = None
+    tokens: int = 0
+    throttled_seconds: float = 0.0
+
+    @property
+    def generation_seconds(self) -> float:
+        """Time spent streaming, from the first token to the end of get_action."""
+        if self.first_token_seconds is None:
+            return 0.0
+        return self.action_seconds - self.first_token_seconds
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        generation = self.generation_seconds
+        return self.tokens / generation if generation > 0 else None
+
+@dataclass
+class SessionTiming:
+    """
+    Running totals of the turn timings of one or more sessions.
+    """
+    turns: int = 0
+    action_seconds: float = 0.0
+    step_seconds: float = 0.0
+    tokens: int = 0
+    first_token_seconds: float = 0.0
+    first_token_turns: int = 0
+    generation_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+    def add(self, timing: TurnTiming) -> None:
+        self.turns += 1
+        self.throttled_seconds += timing.throttled_seconds
+        self.action_seconds += timing.action_seconds
+        self.step_seconds += timing.step_seconds
+        self.tokens += timing.tokens
+        if timing.first_token_seconds is not None:
+            self.first_token_seconds += timing.first_token_seconds
+            self.first_token_turns += 1
+            self.generation_seconds += timing.generation_seconds
+
+    def merge(self, other: "SessionTiming") -> None:
+        self.turns += other.turns
+        self.throttled_seconds += other.throttled_seconds
+        self.action_seconds += other.action_seconds
+        self.step_seconds += other.step_seconds
+        self.tokens += other.tokens
+        self.first_token_seconds += other.first_token_seconds
+        self.first_token_turns += other.first_token_turns
+        self.generation_seconds += other.generation_seconds
+
+    @property
+    def mean_action_seconds(self) -> float:
+        return self.action_seconds / self.turns if self.turns else 0.0
+
+    @property
+    def mean_step_seconds(self) -> float:
+        return self.step_seconds / self.turns if self.turns else 0.0
+
+    @property
+    def mean_throttled_seconds(self) -> float:
+        return self.throttled_seconds / self.turns if self.turns else 0.0
+
+    @property
+    def mean_first_token_seconds(self) -> Optional[float]:
+        return self.first_token_seconds / self.first_token_turns if self.first_token_turns else None
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        return self.tokens / self.generation_seconds if self.generation_seconds > 0 else None
 
 @dataclass
 class GameStart:
@@ -27,11 +147,13 @@ class GameTurn:
         iteration (int): The current turn number (1-based index).
         action (str): The specific command issued by the actor.
         observation (str): The outcome of the action.
+        timing (TurnTiming, optional): Latency and token figures of the turn.
     """
     iteration: int
     action: str
     observation: str
     score: float
+    timing: Optional[TurnTiming] = None
 
 @dataclass
 class GameResult:
@@ -41,11 +163,25 @@ class GameResult:
     This object is yielded exactly once when the game loop terminates.
     
     Attributes:
-        final_status (GameStatus): The ending state (FINISHED or FAILED).
-        history_log (str): The complete textual record of all inputs and observations.
+        final_status (GameStatus | BudgetExhausted): The ending state (FINISHED or
+                                                     FAILED), or the budget that ended the session.
+        history (SessionHistory): Structured record of the inputs and observations,
+                                  rendered to text only when `history_log` is read.
+        timing (SessionTiming): Totals of the turn timings of the session.
     """
-    final_status: GameStatus
+    final_status: Union[GameStatus, BudgetExhausted]
     final_score: float
-    history_log: str
+    history: SessionHistory
+    timing: SessionTiming = field(default_factory=SessionTiming)
+
+    @property
+    def budget_exhausted(self) -> bool:
+        """True if the session was cut short by its budget."""
+        return isinstance(self.final_status, BudgetExhausted)
+
+    @property
+    def history_log(self) -> str:
+        """The complete textual record of all inputs and observations."""
+        return self.history.render()
 
 GameEvent = Union[GameStart, GameTurn, GameResult]
@@ -1,106 +1,525 @@
 import asyncio
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
-from typing import Dict, List, Any, Optional
+import queue
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Deque, Dict, List, Any, Optional, Set, Tuple
+from collections import deque
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum, auto
 from tqdm import tqdm
 
 from app_layer.building.session_config import SessionConfig
 from app_layer.execution.managers.direct_execution_manager import DirectExecutionManager
-from app_layer.core.runner_types import GameStart, GameTurn, GameResult
+from app_layer.core.runner_types import GameStart, GameTurn, GameResult, SessionTiming
+from game_layer.game_engine.core_engine import GameStatus
+from app_layer.execution.session_outcome import SessionOutcome, SessionFailure, SessionResult
+from game_layer.game_engine.trace import SessionTrace, TraceWriter
+from app_layer.execution.statistics import RunningStats, StoppingRule
+from app_layer.execution.checkpoint import CheckpointStore
+from app_layer.execution.worker_pool import WorkerPool, run_in_worker_loop
+from app_layer.registries.manager import get_game_registry
+from agent_layer.llm_agents.LLMs.response_cache import cache_scope
+from agent_layer.llm_agents.LLMs.quantiles import QuantileSketch
+from agent_layer.llm_agents.LLMs.retry_policy import RetryPolicy
+
+class ExecutionMode(Enum):
+    """
+    How AgentEvaluator distributes the sessions.
+
+    PROCESSES: One session at a time per worker process.
+    ASYNCIO: Every session runs concurrently on the caller's event loop.
+    HYBRID: Worker processes, each running several sessions concurrently.
+    """
+    PROCESSES = auto()
+    ASYNCIO = auto()
+    HYBRID = auto()
 
 @dataclass(frozen=True)
 class StatsReport:
     """
     Immutable structured report containing the aggregated results 
     of the simulation runs.
+
+    All figures come from streaming accumulators, so building the report
+    does not require keeping the individual scores. Quantiles are P²
+    estimates; confidence bands are 95% normal intervals of the mean.
+    `total_runs` counts the scored sessions; runs that failed after all their
+    attempts are only counted in `failed_runs` and `failures_by_error`.
     """
     total_runs: int
     global_average_score: float
     average_score_per_turn: Dict[int, float]
     max_turns_reached: int
+    final_score_std: float = 0.0
+    final_score_confidence: Tuple[float, float] = (0.0, 0.0)
+    final_score_quantiles: Dict[float, float] = field(default_factory=dict)
+    turns_quantiles: Dict[float, float] = field(default_factory=dict)
+    score_std_per_turn: Dict[int, float] = field(default_factory=dict)
+    confidence_band_per_turn: Dict[int, Tuple[float, float]] = field(default_factory=dict)
+    stopped_early: bool = False
+    average_action_seconds: float = 0.0
+    average_throttled_seconds: float = 0.0
+    average_step_seconds: float = 0.0
+    average_first_token_seconds: Optional[float] = None
+    tokens_per_second: Optional[float] = None
+    total_tokens: int = 0
+    budget_exhausted_runs: int = 0
+    failed_runs: int = 0
+    retried_attempts: int = 0
+    worker_crashes: int = 0
+    failures_by_error: Dict[str, int] = field(default_factory=dict)
+
+async def _run_with_retry(config: SessionConfig, run_id: int, record_trace: bool, policy: RetryPolicy) -> SessionResult:
+    """
+    Runs one session, retrying it after transient errors with the policy's
+    back-off. Errors never propagate: they end up in a SessionFailure.
+    """
+    # Cached sampled responses are replayed per run ID (see response_cache.py).
+    cache_scope.set(f"run-{run_id}")
+    for attempt in range(1, policy.max_attempts + 1):
+        try:
+            outcome = await _run_logic(config, record_trace)
+            outcome.attempts = attempt
+            if outcome.trace:
+                outcome.trace.run_id = run_id
+            return outcome
+        except Exception as e:
+            transient = policy.is_transient(e)
+            if not transient or attempt == policy.max_attempts:
+                return SessionFailure.from_exception(e, transient, attempt)
+            await asyncio.sleep(policy.backoff(attempt))
 
-def _execute_session_task(config: SessionConfig) -> tuple[Dict[int, float], float]:
+def session_game_configs(config: SessionConfig) -> List[str]:
+    """
+    Returns the game configurations a session loads (none for games without
+    one, or when the game cannot be built: the sessions report that error).
+    """
+    try:
+        game = get_game_registry().get(config.game_name).cls(**config.game_params)
+    except Exception:
+        return []
+    config_name = getattr(game, "config_name", None)
+    return [config_name] if config_name is not None else []
+
+def _execute_session_task(config: SessionConfig, run_id: int, record_trace: bool, policy: RetryPolicy) -> SessionResult:
     """
     Worker task executing a single game session via DirectExecutionManager.
     """
-    return asyncio.run(_run_logic(config))
+    return run_in_worker_loop(_run_with_retry(config, run_id, record_trace, policy))
+
+def _execute_session_batch(
+    config: SessionConfig,
+    run_ids: List[int],
+    concurrency: int,
+    record_trace: bool,
+    policy: RetryPolicy,
+    finished: "queue.Queue[Tuple[int, SessionResult]]",
+    delivered: Dict[int, bool]
+) -> None:
+    """
+    Worker task executing the sessions `run_ids` on one event loop, at most
+    `concurrency` at a time. Each result is put on the `finished` queue (a
+    manager proxy) as soon as its session ends, not when the batch does, and
+    its run ID is then marked in `delivered` (a manager dict).
+    """
+    async def report() -> None:
+        async for result in _run_concurrently(config, run_ids, concurrency, record_trace, policy):
+            finished.put(result)
+            delivered[result[0]] = True
+    run_in_worker_loop(report())
+
+def _put_all(target: "queue.Queue", items: List[Any]) -> None:
+    for item in items:
+        target.put(item)
+
+async def _run_concurrently(
+    config: SessionConfig,
+    run_ids: List[int],
+    concurrency: int,
+    record_trace: bool,
+    policy: RetryPolicy
+) -> AsyncIterator[Tuple[int, SessionResult]]:
+    """
+    Runs the sessions `run_ids` on the current event loop and yields them
+    (tagged with their run ID) as they finish.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(run_id: int) -> Tuple[int, SessionResult]:
+        async with semaphore:
+            return run_id, await _run_with_retry(config, run_id, record_trace, policy)
 
-async def _run_logic(config: SessionConfig) -> tuple[Dict[int, float], float]:
+    tasks = [asyncio.create_task(limited(run_id)) for run_id in run_ids]
+    try:
+        for future in asyncio.as_completed(tasks):
+            yield await future
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def _run_logic(config: SessionConfig, record_trace: bool = False) -> SessionOutcome:
     """
     Internal async logic consuming the DirectExecutionManager stream.
     """
     history = {}
     final_score = 0.0
+    timing = SessionTiming()
+    budget_exhausted = False
+    trace = SessionTrace(config.game_name, config.game_params) if record_trace else None
     
     manager = DirectExecutionManager(config)
     
     async for event in manager.execute():
         match event:
-            case GameStart(initial_score=score):
+            case GameStart(initial_score=score, initial_observation=observation):
                 history[0] = score
-            case GameTurn(iteration=it, score=score):
+                if trace:
+                    trace.initial_observation = observation
+            case GameTurn(iteration=it, score=score, action=action, observation=observation):
                 history[it] = score
-            case GameResult(final_score=score):
+                if trace:
+                    trace.record(action, observation)
+            case GameResult(final_score=score, final_status=status, timing=session_timing) as result:
                 final_score = score
+                timing = session_timing
+                budget_exhausted = result.budget_exhausted
+                if trace:
+                    # Traces hold engine statuses; a cut-short game was still running.
+                    trace.final_status = GameStatus.RUNNING if budget_exhausted else status
+                    trace.final_score = score
                 
-    return history, final_score
+    return SessionOutcome(
+        score_per_turn=history,
+        final_score=final_score,
+        timing=timing,
+        budget_exhausted=budget_exhausted,
+        trace=trace
+    )
 
 class AgentEvaluator:
     """
     Manages the execution of multiple game sessions for statistical evaluation.
     """
 
-    def __init__(self, session_config: SessionConfig, total_runs: int = 100, max_workers: int = None):
+    def __init__(
+        self,
+        session_config: SessionConfig,
+        total_runs: int = 100,
+        max_workers: int = None,
+        trace_path: Optional[str] = None,
+        mode: ExecutionMode = ExecutionMode.PROCESSES,
+        concurrency: int = 64,
+        checkpoint_path: Optional[str] = None,
+        stopping_rule: Optional[StoppingRule] = None,
+        show_progress: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_tasks_per_child: Optional[int] = None
+    ):
+        """
+        Args:
+            session_config (SessionConfig): The session to evaluate.
+            total_runs (int): Number of sessions to run (the budget, when a
+                              stopping rule is set).
+            max_workers (int, optional): Number of worker processes (PROCESSES and
+                                         HYBRID modes).
+            trace_path (str, optional): If set, every session is recorded into this
+                                        binary trace file (see game_engine/trace.py).
+            mode (ExecutionMode): How sessions are distributed.
+            concurrency (int): Maximum concurrent sessions per event loop (ASYNCIO and
+                               HYBRID modes). In HYBRID mode, each worker task runs a
+                               batch of this many sessions and reports each one as
+                               soon as it ends.
+            checkpoint_path (str, optional): JSONL file where finished runs are stored.
+                                             Re-running with the same file skips the
+                                             runs it already holds and includes them
+                                             in the report.
+            stopping_rule (StoppingRule, optional): Runs sessions in waves and stops
+                                                    as soon as the rule is met.
+            show_progress (bool): Whether to display a progress bar.
+            retry_policy (RetryPolicy, optional): Retries of runs that failed with a
+                                                  transient error. Failed runs are
+                                                  counted in the report, not scored.
+            max_tasks_per_child (int, optional): Tasks after which a worker process is
+                                                 replaced (PROCESSES and HYBRID modes).
+        """
+        if concurrency < 1:
+            raise ValueError("StatsRunner: concurrency must be at least 1.")
         if session_config.is_human:
             raise ValueError("StatsRunner: Human sessions are not supported for statistics gathering.")
 
         self.session_config = session_config
         self.total_runs = total_runs
         self.max_workers = max_workers or (multiprocessing.cpu_count() * 2)
+        self.trace_path = trace_path
+        self.mode = mode
+        self.concurrency = concurrency
+        self.checkpoint_path = checkpoint_path
+        self.stopping_rule = stopping_rule
+        self.show_progress = show_progress
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.max_tasks_per_child = max_tasks_per_child
+        self.stopped_early = False
         
-        self.history: Dict[int, List[float]] = defaultdict(list)
-        self.final_scores: List[float] = []
+        self.turn_stats: Dict[int, RunningStats] = defaultdict(RunningStats)
+        self.final_score_stats = RunningStats()
+        self.final_score_quantiles = QuantileSketch()
+        self.turns_quantiles = QuantileSketch()
+        self.timing = SessionTiming()
+        self.budget_exhausted_runs = 0
+        self.failed_runs = 0
+        self.retried_attempts = 0
+        self.worker_crashes = 0
+        self.failures_by_error: Dict[str, int] = defaultdict(int)
+
+        # Set up by the first wave.
+        self._pending_run_ids: Optional[Deque[int]] = None
+        self._checkpoint: Optional[CheckpointStore] = None
+        self._append_traces = False
+        self._checkpointed_runs: Optional[Set[int]] = None
+        self._progress_bar = None
 
     async def run(self) -> StatsReport:
         """
-        Executes simulations across processes and aggregates results.
+        Executes the simulations according to the execution mode and aggregates results.
+        With a stopping rule, sessions run in waves until the rule is met or the
+        budget is spent.
+        """
+        self._prepare()
+        rule = self.stopping_rule
+
+        while self._pending_run_ids:
+            if rule and rule.is_met(self.final_score_stats):
+                self.stopped_early = True
+                break
+            await self.run_wave(rule.wave_size if rule else None)
+
+        self.close()
+        return self._generate_report()
+
+    @property
+    def remaining_runs(self) -> int:
+        self._prepare()
+        return len(self._pending_run_ids)
+
+    async def run_wave(self, runs: Optional[int] = None) -> int:
+        """
+        Runs the next `runs` pending sessions (all of them by default) and
+        integrates their results.
+
+        Returns:
+            int: The number of sessions executed.
         """
-        loop = asyncio.get_running_loop()
-        progress_bar = tqdm(total=self.total_runs, desc="Simulating", unit="game")
+        run_ids = self.take_pending(runs)
+        if not run_ids:
+            return 0
+
+        trace_writer = None
+        if self.trace_path is not None:
+            # Sessions traced after the last checkpoint flush of a crashed run are run again: drop them.
+            trace_writer = TraceWriter(self.trace_path, append=self._append_traces, keep_runs=self._checkpointed_runs)
+            if self._checkpoint:
+                self._checkpoint.before_flush = trace_writer.flush
+        self._append_traces = True
+        self._checkpointed_runs = None
+
+        try:
+            async for run_id, result in self._iter_sessions(run_ids):
+                # Traced first: the checkpoint flushes the trace before itself.
+                if trace_writer and isinstance(result, SessionOutcome):
+                    trace_writer.write(result.trace)
+                self.record(run_id, result)
+        finally:
+            if self._checkpoint:
+                self._checkpoint.flush()
+                self._checkpoint.before_flush = None
+            if trace_writer:
+                trace_writer.close()
+
+        return len(run_ids)
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:            
-            tasks = [
-                loop.run_in_executor(executor, _execute_session_task, self.session_config)
-                for _ in range(self.total_runs)
-            ]
-            
-            for future in asyncio.as_completed(tasks):
-                session_history, final_score = await future
-                self._integrate_session(session_history, final_score)
-                progress_bar.update(1)
+    def take_pending(self, runs: Optional[int] = None) -> List[int]:
+        """
+        Removes the next `runs` pending run IDs (all of them by default) from
+        the schedule and returns them. The caller executes them and reports
+        each outcome through `record`.
+        """
+        self._prepare()
+        count = len(self._pending_run_ids) if runs is None else min(runs, len(self._pending_run_ids))
+        return [self._pending_run_ids.popleft() for _ in range(count)]
 
-        progress_bar.close()
+    def record(self, run_id: int, result: SessionResult) -> None:
+        """
+        Integrates a finished session and stores it in the checkpoint, if any.
+        Failed runs are only counted (and are not checkpointed, so a resumed
+        evaluation attempts them again).
+        """
+        self.retried_attempts += result.attempts - 1
+        if isinstance(result, SessionFailure):
+            self.failed_runs += 1
+            self.failures_by_error[result.error_type] += 1
+        else:
+            self._integrate_session(result)
+            if self._checkpoint:
+                self._checkpoint.append(run_id, result)
+        self._progress_bar.update(1)
+
+    def report(self) -> StatsReport:
+        """
+        Returns the report of the sessions integrated so far.
+        """
         return self._generate_report()
 
-    def _integrate_session(self, session_history: Dict[int, float], final_score: float):
-        self.final_scores.append(final_score)
-        for turn, score in session_history.items():
-            self.history[turn].append(score)
+    def close(self) -> None:
+        """
+        Releases the checkpoint file and the progress bar.
+        """
+        if self._checkpoint:
+            self._checkpoint.close()
+        if self._progress_bar is not None:
+            self._progress_bar.close()
+
+    def _prepare(self) -> None:
+        """
+        Loads the checkpoint (once) and computes the run IDs still to execute.
+        """
+        if self._pending_run_ids is not None:
+            return
+
+        self._checkpoint = CheckpointStore(self.checkpoint_path, self.session_config) if self.checkpoint_path else None
+        completed = self._checkpoint.load() if self._checkpoint else {}
+        for outcome in completed.values():
+            self._integrate_session(outcome)
+
+        self._pending_run_ids = deque(run_id for run_id in range(self.total_runs) if run_id not in completed)
+        self._append_traces = bool(completed)
+        self._checkpointed_runs = set(completed)
+        self._progress_bar = tqdm(
+            total=self.total_runs,
+            initial=self.total_runs - len(self._pending_run_ids),
+            desc=f"Simulating {self.session_config.agent_name}",
+            unit="game",
+            disable=not self.show_progress
+        )
+
+    def _iter_sessions(self, run_ids: List[int]) -> AsyncIterator[Tuple[int, SessionResult]]:
+        record_trace = self.trace_path is not None
+        if self.mode == ExecutionMode.ASYNCIO:
+            return _run_concurrently(self.session_config, run_ids, self.concurrency, record_trace, self.retry_policy)
+        if self.mode == ExecutionMode.HYBRID:
+            return self._run_hybrid(run_ids, record_trace)
+        return self._run_in_processes(run_ids, record_trace)
+
+    def _create_pool(self) -> WorkerPool:
+        return WorkerPool(
+            self.max_workers,
+            max_tasks_per_child=self.max_tasks_per_child,
+            max_crash_retries=self.retry_policy.max_attempts - 1,
+            game_configs=session_game_configs(self.session_config)
+        )
+
+    async def _run_in_processes(self, run_ids: List[int], record_trace: bool) -> AsyncIterator[Tuple[int, SessionResult]]:
+        with self._create_pool() as pool:
+            async def run_one(run_id: int) -> Tuple[int, SessionResult]:
+                try:
+                    return run_id, await pool.run(_execute_session_task, self.session_config, run_id, record_trace, self.retry_policy)
+                except BrokenProcessPool as e:
+                    return run_id, SessionFailure.from_exception(e, transient=True, attempts=pool.max_attempts)
+
+            try:
+                for future in asyncio.as_completed([run_one(run_id) for run_id in run_ids]):
+                    yield await future
+            finally:
+                self.worker_crashes += pool.crashes
+
+    async def _run_hybrid(self, run_ids: List[int], record_trace: bool) -> AsyncIterator[Tuple[int, SessionResult]]:
+        batches = [run_ids[start:start + self.concurrency] for start in range(0, len(run_ids), self.concurrency)]
+        with multiprocessing.Manager() as manager, self._create_pool() as pool:
+            # Workers report every session as it ends; None marks the end of all batches.
+            finished = manager.Queue()
+            # Run IDs already put on `finished`, so a crashed batch only resubmits the others.
+            delivered = manager.dict()
+
+            def pending(batch: List[int]) -> List[int]:
+                done = set(delivered.keys())
+                return [run_id for run_id in batch if run_id not in done]
+
+            async def run_batch(batch: List[int]) -> None:
+                def retry_args() -> Optional[Tuple[Any, ...]]:
+                    remaining = pending(batch)
+                    if not remaining:
+                        return None
+                    return (self.session_config, remaining, self.concurrency, record_trace, self.retry_policy,
+                            finished, delivered)
+
+                try:
+                    await pool.run(
+                        _execute_session_batch, self.session_config, batch, self.concurrency, record_trace,
+                        self.retry_policy, finished, delivered, retry_args=retry_args
+                    )
+                except BrokenProcessPool as e:
+                    # Sessions the batch already reported keep their result.
+                    failure = SessionFailure.from_exception(e, transient=True, attempts=pool.max_attempts)
+                    remaining = await asyncio.to_thread(pending, batch)
+                    await asyncio.to_thread(_put_all, finished, [(run_id, failure) for run_id in remaining])
+
+            async def run_batches() -> None:
+                try:
+                    await asyncio.gather(*(run_batch(batch) for batch in batches))
+                finally:
+                    await asyncio.to_thread(finished.put, None)
+
+            runner = asyncio.create_task(run_batches())
+            # A worker can crash between reporting a session and marking it delivered, so the
+            # resubmitted batch may report it again: keep the first result.
+            reported: Set[int] = set()
+            try:
+                while True:
+                    item = await asyncio.to_thread(finished.get)
+                    if item is None:
+                        break
+                    if item[0] not in reported:
+                        reported.add(item[0])
+                        yield item
+                await runner
+            finally:
+                runner.cancel()
+                self.worker_crashes += pool.crashes
+
+    def _integrate_session(self, outcome: SessionOutcome):
+        self.final_score_stats.add(outcome.final_score)
+        self.final_score_quantiles.add(outcome.final_score)
+        self.turns_quantiles.add(max(outcome.score_per_turn, default=0))
+        self.timing.merge(outcome.timing)
+        self.budget_exhausted_runs += outcome.budget_exhausted
+        for turn, score in outcome.score_per_turn.items():
+            self.turn_stats[turn].add(score)
 
     def _generate_report(self) -> StatsReport:
-        avg_per_turn = {
-            turn: sum(scores) / len(scores) 
-            for turn, scores in sorted(self.history.items())
-        }
-        
-        global_avg = sum(self.final_scores) / len(self.final_scores) if self.final_scores else 0.0
-        max_turns = max(avg_per_turn.keys()) if avg_per_turn else 0
+        turns = sorted(self.turn_stats)
+        final = self.final_score_stats
 
         return StatsReport(
-            total_runs=len(self.final_scores),
-            global_average_score=global_avg,
-            average_score_per_turn=avg_per_turn,
-            max_turns_reached=max_turns
-        )
\ No newline at end of file
+            total_runs=final.count,
+            global_average_score=final.mean,
+            average_score_per_turn={turn: self.turn_stats[turn].mean for turn in turns},
+            max_turns_reached=turns[-1] if turns else 0,
+            final_score_std=final.std,
+            final_score_confidence=final.confidence_interval(),
+            final_score_quantiles=self.final_score_quantiles.values(),
+            turns_quantiles=self.turns_quantiles.values(),
+            score_std_per_turn={turn: self.turn_stats[turn].std for turn in turns},
+            confidence_band_per_turn={turn: self.turn_stats[turn].confidence_interval() for turn in turns},
+            stopped_early=self.stopped_early,
+            average_action_seconds=self.timing.mean_action_seconds,
+            average_throttled_seconds=self.timing.mean_throttled_seconds,
+            average_step_seconds=self.timing.mean_step_seconds,
+            average_first_token_seconds=self.timing.mean_first_token_seconds,
+            tokens_per_second=self.timing.tokens_per_second,
+            total_tokens=self.timing.tokens,
+            budget_exhausted_runs=self.budget_exhausted_runs,
+            failed_runs=self.failed_runs,
+            retried_attempts=self.retried_attempts,
+            worker_crashes=self.worker_crashes,
+            failures_by_error=dict(self.failures_by_error)
+        )
@@ -0,0 +1,144 @@
+import json
+import os
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from app_layer.building.session_config import SessionConfig
+from app_layer.core.runner_types import SessionTiming
+from app_layer.execution.session_outcome import SessionOutcome
+
+# run_id -> stored outcome (without trace)
+CompletedRuns = Dict[int, SessionOutcome]
+
+class CheckpointStore:
+    """
+    Durable JSONL record of the finished sessions of an evaluation.
+
+    The first line identifies the evaluated session configuration; every other
+    line holds one finished run keyed by its run ID. Writes are buffered and
+    flushed in batches (every `flush_every` runs or `flush_interval` seconds),
+    so a crash loses at most the last unflushed batch. `before_flush` is
+    called before each batch is written, so data the runs depend on (e.g.
+    their traces) is never behind the checkpoint.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        session_config: SessionConfig,
+        flush_every: int = 20,
+        flush_interval: float = 5.0
+    ):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._config_key = _config_key(session_config)
+
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+        self._file = None
+        self.before_flush: Optional[Callable[[], None]] = None
+
+    def load(self) -> CompletedRuns:
+        """
+        Reads the runs already stored. A partially written last line (from an
+        interrupted write) is ignored.
+
+        Raises:
+            ValueError: If the store was created for a different session configuration.
+        """
+        completed: CompletedRuns = {}
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            header = f.readline()
+            if not header.endswith("\n"):
+                return completed
+            if json.loads(header).get("config") != self._config_key:
+                raise ValueError(
+                    f"Checkpoint '{self.path}' belongs to a different session configuration."
+                )
+
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                record = json.loads(line)
+                completed[record["run_id"]] = SessionOutcome(
+                    score_per_turn={int(turn): score for turn, score in record["history"].items()},
+                    final_score=record["final_score"],
+                    timing=SessionTiming(**record.get("timing", {})),
+                    budget_exhausted=record.get("budget_exhausted", False)
+                )
+
+        return completed
+
+    def append(self, run_id: int, outcome: SessionOutcome) -> None:
+        """
+        Buffers a finished run, flushing the buffer when a batch is complete.
+        """
+        record = {
+            "run_id": run_id,
+            "history": outcome.score_per_turn,
+            "final_score": outcome.final_score,
+            "timing": asdict(outcome.timing),
+            "budget_exhausted": outcome.budget_exhausted
+        }
+        self._pending.append(json.dumps(record) + "\n")
+        if len(self._pending) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered runs to disk and syncs the file.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        if self.before_flush is not None:
+            self.before_flush()
+        if self._file is None:
+            self._open()
+        self._file.write("".join(self._pending))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = []
+
+    def _open(self) -> None:
+        if self.path.exists():
+            self._drop_partial_line()
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if is_new:
+            self._file.write(json.dumps({"config": self._config_key}) + "\n")
+
+    def _drop_partial_line(self) -> None:
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _config_key(session_config: SessionConfig) -> dict:
+    # Round-trip through JSON so the key compares equal to the stored one.
+    return json.loads(json.dumps(asdict(session_config), sort_keys=True, default=_describe))
+
+def _describe(value) -> dict:
+    # Objects in the parameters (e.g. a history policy) are identified by
+    # their type and attributes, which are stable across processes.
+    return {type(value).__qualname__: getattr(value, "__dict__", repr(value))}
@@ -0,0 +1,87 @@
+import asyncio
+import math
+from dataclasses import dataclass
+
+from app_layer.execution.agent_evaluator import AgentEvaluator, StatsReport
+from app_layer.execution.statistics import welch_test
+
+@dataclass(frozen=True)
+class ComparisonReport:
+    """
+    Outcome of a sequential comparison between two evaluations.
+
+    Attributes:
+        report_a (StatsReport): Results of the first configuration.
+        report_b (StatsReport): Results of the second configuration.
+        mean_difference (float): Mean final score of A minus that of B.
+        p_value (float): Two-sided p-value of the last test.
+        conclusive (bool): True if the difference was significant at the
+                           per-look level before the budget ran out.
+    """
+    report_a: StatsReport
+    report_b: StatsReport
+    mean_difference: float
+    p_value: float
+    conclusive: bool
+
+async def compare_evaluators(
+    evaluator_a: AgentEvaluator,
+    evaluator_b: AgentEvaluator,
+    significance_level: float = 0.05,
+    wave_size: int = 50,
+    min_runs: int = 30
+) -> ComparisonReport:
+    """
+    Runs two evaluations side by side in waves and stops as soon as the
+    difference between their mean final scores is significant, or when either
+    evaluator's `total_runs` budget is spent.
+
+    The test is repeated after every wave (and once before the first wave
+    when resumed evaluations already have `min_runs` sessions), so each look
+    uses the Bonferroni level `significance_level / looks`; the overall
+    false-positive rate stays below `significance_level`.
+
+    Args:
+        evaluator_a (AgentEvaluator): First configuration.
+        evaluator_b (AgentEvaluator): Second configuration.
+        significance_level (float): Overall type I error rate.
+        wave_size (int): Sessions added to each configuration per wave.
+        min_runs (int): Sessions required per configuration before testing.
+    """
+    if wave_size < 1:
+        raise ValueError("wave_size must be at least 1.")
+
+    max_waves = max(math.ceil(min(evaluator_a.remaining_runs, evaluator_b.remaining_runs) / wave_size), 1)
+    # Resumed evaluations may already be tested before the first wave.
+    looks_before_waves = int(_has_min_runs(evaluator_a, evaluator_b, min_runs))
+    level_per_look = significance_level / (max_waves + looks_before_waves)
+
+    difference, p_value = welch_test(evaluator_a.final_score_stats, evaluator_b.final_score_stats)
+    conclusive = False
+    try:
+        while True:
+            if _has_min_runs(evaluator_a, evaluator_b, min_runs) and p_value < level_per_look:
+                conclusive = True
+                break
+            if not evaluator_a.remaining_runs or not evaluator_b.remaining_runs:
+                break
+
+            await asyncio.gather(evaluator_a.run_wave(wave_size), evaluator_b.run_wave(wave_size))
+            difference, p_value = welch_test(evaluator_a.final_score_stats, evaluator_b.final_score_stats)
+    finally:
+        evaluator_a.close()
+        evaluator_b.close()
+
+    evaluator_a.stopped_early = conclusive and evaluator_a.remaining_runs > 0
+    evaluator_b.stopped_early = conclusive and evaluator_b.remaining_runs > 0
+    return ComparisonReport(
+        report_a=evaluator_a.report(),
+        report_b=evaluator_b.report(),
+        mean_difference=difference,
+        p_value=p_value,
+        conclusive=conclusive
+    )
+
+
+def _has_min_runs(evaluator_a: AgentEvaluator, evaluator_b: AgentEvaluator, min_runs: int) -> bool:
+    return min(evaluator_a.final_score_stats.count, evaluator_b.final_score_stats.count) >= min_runs
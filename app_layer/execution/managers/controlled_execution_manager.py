@@ -51,7 +51,8 @@ class ControlledExecutionManager:
             return HumanSessionBuilder(
                 game_name=self.config.game_name,
                 input_adapter=self._input_adapter,
-                game_params=self.config.game_params
+                game_params=self.config.game_params,
+                budget=self.config.budget
             ).build()
         else:
             self.config.agent_params["on_reasoning"] = self._on_agent_reasoning 
@@ -60,6 +61,7 @@ class ControlledExecutionManager:
                 agent_name=self.config.agent_name,
                 agent_params=self.config.agent_params,
                 game_params=self.config.game_params,
+                budget=self.config.budget
             ).build()
 
     async def _on_agent_reasoning(self, data: Any) -> None:
@@ -40,7 +40,8 @@ class DirectExecutionManager:
             return HumanSessionBuilder(
                 game_name=self.config.game_name,
                 input_adapter=self.input_adapter,
-                game_params=self.config.game_params
+                game_params=self.config.game_params,
+                budget=self.config.budget
             ).build()
         
         return AgentSessionBuilder(
@@ -48,6 +49,7 @@ class DirectExecutionManager:
             agent_name=self.config.agent_name,
             agent_params=self.config.agent_params,
             game_params=self.config.game_params,
+            budget=self.config.budget
         ).build()
 
     async def execute(self) -> AsyncGenerator[GameEvent, None]:
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Union
+
+from app_layer.core.runner_types import SessionTiming
+from game_layer.game_engine.trace import SessionTrace
+
+@dataclass
+class SessionOutcome:
+    """
+    What an evaluation keeps from one finished session.
+
+    Attributes:
+        score_per_turn (Dict[int, float]): Score after each turn (0 = initial score).
+        final_score (float): Score when the session ended.
+        timing (SessionTiming): Latency and token totals of the session.
+        budget_exhausted (bool): True if the session was ended by its SessionBudget.
+        attempts (int): Attempts needed (more than 1 if transient errors were retried).
+        trace (SessionTrace, optional): Recorded inputs and observations, if requested.
+    """
+    score_per_turn: Dict[int, float]
+    final_score: float
+    timing: SessionTiming = field(default_factory=SessionTiming)
+    budget_exhausted: bool = False
+    attempts: int = 1
+    trace: Optional[SessionTrace] = None
+
+@dataclass(frozen=True)
+class SessionFailure:
+    """
+    A session that could not be completed.
+
+    Errors are captured where they happen (possibly in a worker process) and
+    reduced to this picklable summary.
+
+    Attributes:
+        error_type (str): Class name of the last exception.
+        message (str): Its message.
+        transient (bool): Whether the error was classified as transient.
+        attempts (int): Attempts made before giving up.
+    """
+    error_type: str
+    message: str
+    transient: bool
+    attempts: int
+
+    @classmethod
+    def from_exception(cls, error: BaseException, transient: bool, attempts: int) -> "SessionFailure":
+        return cls(type(error).__name__, str(error), transient, attempts)
+
+SessionResult = Union[SessionOutcome, SessionFailure]
@@ -0,0 +1,94 @@
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# Two-sided 95% normal confidence level.
+CONFIDENCE_Z = 1.96
+
+class RunningStats:
+    """
+    Streaming mean and variance (Welford's algorithm) in constant memory.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        """Standard error of the mean."""
+        return math.sqrt(self.variance / self.count) if self.count else 0.0
+
+    def confidence_interval(self, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+        """
+        Returns the normal-approximation confidence interval of the mean.
+        """
+        half_width = z * self.stderr
+        return self.mean - half_width, self.mean + half_width
+
+
+@dataclass(frozen=True)
+class StoppingRule:
+    """
+    Sequential early-stopping settings for an evaluation.
+
+    Runs are scheduled in waves of `wave_size`; after each wave the evaluation
+    stops once the 95% confidence interval of the mean final score is at most
+    `target_ci_width` wide (and at least `min_runs` runs finished). The
+    evaluator's `total_runs` remains the hard budget.
+    """
+    target_ci_width: Optional[float] = None
+    min_runs: int = 30
+    wave_size: int = 50
+
+    def __post_init__(self):
+        if self.wave_size < 1:
+            raise ValueError("wave_size must be at least 1.")
+
+    def is_met(self, stats: RunningStats) -> bool:
+        if self.target_ci_width is None or stats.count < max(self.min_runs, 2):
+            return False
+        low, high = stats.confidence_interval()
+        return high - low <= self.target_ci_width
+
+
+def welch_test(a: RunningStats, b: RunningStats) -> Tuple[float, float]:
+    """
+    Compares the means of two samples (Welch's unequal-variance test, with the
+    normal approximation used for the p-value).
+
+    Returns:
+        Tuple[float, float]: The difference of means (a - b) and the two-sided p-value.
+    """
+    difference = a.mean - b.mean
+    if a.count < 2 or b.count < 2:
+        return difference, 1.0
+
+    stderr = math.sqrt(a.variance / a.count + b.variance / b.count)
+    if stderr == 0:
+        return difference, 0.0 if difference else 1.0
+    return difference, math.erfc(abs(difference) / stderr / math.sqrt(2))
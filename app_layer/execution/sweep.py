@@ -0,0 +1,338 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tqdm import tqdm
+
+from agent_layer.llm_agents.LLMs.llm_selector import MODELS
+from agent_layer.llm_agents.LLMs.rate_limiter import STATE_DIR_VARIABLE
+from agent_layer.llm_agents.LLMs.retry_policy import RetryPolicy
+from app_layer.building.session_config import SessionConfig
+from app_layer.core.runner_types import SessionBudget
+from app_layer.execution.agent_evaluator import AgentEvaluator, StatsReport, _run_with_retry, session_game_configs
+from app_layer.execution.session_outcome import SessionFailure, SessionResult
+from app_layer.execution.worker_pool import WorkerPool, run_in_worker_loop
+from app_layer.registries.manager import get_agent_registry, get_game_registry
+
+# (cell index, session config, run ID)
+SweepJob = Tuple[int, SessionConfig, int]
+
+@dataclass(frozen=True)
+class SweepCell:
+    """
+    One combination of the grid. `llm` and `system_prompt_id` are None when
+    the grid does not vary them (the agent defaults apply).
+    """
+    game_name: str
+    agent_name: str
+    llm: Optional[str] = None
+    system_prompt_id: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return "/".join(part for part in (self.game_name, self.agent_name, self.llm, self.system_prompt_id) if part)
+
+    @property
+    def provider(self) -> str:
+        """Group of cells sharing rate limits (the LLM implementation class)."""
+        return MODELS[self.llm].__name__ if self.llm else ""
+
+@dataclass(frozen=True)
+class SweepGrid:
+    """
+    Cartesian product of the configurations to evaluate.
+
+    Attributes:
+        games (Sequence[str]): Game IDs from the game registry.
+        agents (Sequence[str]): Agent IDs from the agent registry.
+        llms (Sequence[str]): `llm` values (keys of llm_selector.MODELS). Empty
+                              means the agent default.
+        system_prompt_ids (Sequence[str]): `system_prompt_id` values. Empty means
+                                           the agent default.
+        game_params (Dict[str, Dict]): Parameters per game ID.
+        agent_params (Dict[str, Any]): Extra parameters passed to every agent.
+        budget (SessionBudget, optional): Limits applied to every session.
+    """
+    games: Sequence[str]
+    agents: Sequence[str]
+    llms: Sequence[str] = ()
+    system_prompt_ids: Sequence[str] = ()
+    game_params: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    agent_params: Dict[str, Any] = field(default_factory=dict)
+    budget: Optional[SessionBudget] = None
+
+    def validate(self) -> None:
+        """
+        Raises:
+            ValueError: If a game, agent or LLM of the grid is unknown.
+        """
+        if not self.games or not self.agents:
+            raise ValueError("SweepGrid: At least one game and one agent are required.")
+        games = get_game_registry()
+        agents = get_agent_registry()
+        for game_name in self.games:
+            games.get(game_name)
+        for agent_name in self.agents:
+            agents.get(agent_name)
+        for llm in self.llms:
+            if llm not in MODELS:
+                raise ValueError(f"SweepGrid: Unknown LLM '{llm}'.")
+
+    def cells(self) -> List[SweepCell]:
+        return [
+            SweepCell(game_name, agent_name, llm, prompt_id)
+            for game_name in self.games
+            for agent_name in self.agents
+            for llm in (self.llms or (None,))
+            for prompt_id in (self.system_prompt_ids or (None,))
+        ]
+
+    def session_config(self, cell: SweepCell) -> SessionConfig:
+        agent_params = dict(self.agent_params)
+        if cell.llm is not None:
+            agent_params["llm"] = cell.llm
+        if cell.system_prompt_id is not None:
+            agent_params["system_prompt_id"] = cell.system_prompt_id
+        return SessionConfig(
+            game_name=cell.game_name,
+            is_human=False,
+            agent_name=cell.agent_name,
+            game_params=dict(self.game_params.get(cell.game_name, {})),
+            agent_params=agent_params,
+            budget=self.budget
+        )
+
+@dataclass(frozen=True)
+class SweepReport:
+    """
+    Consolidated results of a sweep, one StatsReport per cell.
+    """
+    results: List[Tuple[SweepCell, StatsReport]]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        for cell, report in self.results:
+            low, high = report.final_score_confidence
+            rows.append({
+                "game": cell.game_name,
+                "agent": cell.agent_name,
+                "llm": cell.llm or "-",
+                "prompt": cell.system_prompt_id or "-",
+                "runs": report.total_runs,
+                "mean_score": report.global_average_score,
+                "ci_low": low,
+                "ci_high": high,
+                "median_turns": report.turns_quantiles.get(0.5),
+                "action_seconds": report.average_action_seconds,
+                "tokens": report.total_tokens,
+                "budget_exhausted": report.budget_exhausted_runs,
+                "failed": report.failed_runs
+            })
+        return rows
+
+    def format_table(self) -> str:
+        """
+        Renders the results as a fixed-width text table.
+        """
+        rows = [
+            {key: _format_value(value) for key, value in row.items()}
+            for row in self.rows()
+        ]
+        if not rows:
+            return ""
+        columns = list(rows[0])
+        widths = {column: max(len(column), *(len(row[column]) for row in rows)) for column in columns}
+        lines = [
+            "  ".join(column.ljust(widths[column]) for column in columns),
+            "  ".join("-" * widths[column] for column in columns)
+        ]
+        lines += ["  ".join(row[column].ljust(widths[column]) for column in columns) for row in rows]
+        return "\n".join(lines)
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
+
+def _round_robin(iterables: Iterable[Iterable]) -> Iterable:
+    """Yields one item from each iterable in turn until all are exhausted."""
+    iterators = [iter(it) for it in iterables]
+    active = len(iterators)
+    nexts = cycle(iterator.__next__ for iterator in iterators)
+    while active:
+        try:
+            for next_item in nexts:
+                yield next_item()
+        except StopIteration:
+            active -= 1
+            nexts = cycle(islice(nexts, active))
+
+def _execute_sweep_batch(jobs: List[SweepJob], concurrency: int, policy: RetryPolicy) -> List[Tuple[int, int, SessionResult]]:
+    """
+    Worker task running a batch of sessions (possibly of different cells) on
+    one event loop, at most `concurrency` at a time.
+    """
+    async def collect() -> List[Tuple[int, int, SessionResult]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(cell_index: int, config: SessionConfig, run_id: int) -> Tuple[int, int, SessionResult]:
+            async with semaphore:
+                return cell_index, run_id, await _run_with_retry(config, run_id, False, policy)
+
+        return await asyncio.gather(*(limited(*job) for job in jobs))
+    return run_in_worker_loop(collect())
+
+class SweepRunner:
+    """
+    Evaluates every cell of a SweepGrid in one global schedule.
+
+    All the sessions share one worker pool. The schedule interleaves the
+    cells, alternating between providers, so each batch mixes providers
+    instead of saturating one of them while the others sit idle. Unless
+    LLM_RATE_LIMIT_DIR is already set, the workers get a temporary one (see
+    rate_limiter.py), so their rate limiters share their buckets and
+    concurrent cells of a provider draw from the same budget.
+    """
+
+    def __init__(
+        self,
+        grid: SweepGrid,
+        runs_per_cell: int = 100,
+        max_workers: Optional[int] = None,
+        concurrency: int = 16,
+        checkpoint_dir: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_tasks_per_child: Optional[int] = None
+    ):
+        """
+        Args:
+            grid (SweepGrid): The configurations to evaluate.
+            runs_per_cell (int): Sessions per cell.
+            max_workers (int, optional): Number of worker processes.
+            concurrency (int): Sessions per worker task, run concurrently on the
+                               worker's event loop (1 = one session at a time).
+            checkpoint_dir (str, optional): Directory with one checkpoint file per
+                                            cell; completed runs are skipped on rerun.
+            retry_policy (RetryPolicy, optional): Retries of runs that failed with a
+                                                  transient error.
+            max_tasks_per_child (int, optional): Tasks after which a worker process is replaced.
+        """
+        if concurrency < 1:
+            raise ValueError("SweepRunner: concurrency must be at least 1.")
+        grid.validate()
+
+        self.grid = grid
+        self.runs_per_cell = runs_per_cell
+        self.max_workers = max_workers or (multiprocessing.cpu_count() * 2)
+        self.concurrency = concurrency
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.max_tasks_per_child = max_tasks_per_child
+        self.worker_crashes = 0
+
+        self.cells = grid.cells()
+        self.evaluators = [self._create_evaluator(cell) for cell in self.cells]
+
+    def _create_evaluator(self, cell: SweepCell) -> AgentEvaluator:
+        checkpoint_path = None
+        if self.checkpoint_dir is not None:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            checkpoint_path = str(self.checkpoint_dir / f"{re.sub(r'[^0-9A-Za-z_.-]+', '_', cell.label)}.jsonl")
+        return AgentEvaluator(
+            self.grid.session_config(cell),
+            total_runs=self.runs_per_cell,
+            checkpoint_path=checkpoint_path,
+            show_progress=False
+        )
+
+    def schedule(self) -> List[SweepJob]:
+        """
+        Builds the interleaved list of the sessions still to run: round-robin
+        over providers and, within a provider, over its cells.
+        """
+        per_provider: Dict[str, List[List[SweepJob]]] = {}
+        for index, (cell, evaluator) in enumerate(zip(self.cells, self.evaluators)):
+            jobs = [(index, evaluator.session_config, run_id) for run_id in evaluator.take_pending()]
+            per_provider.setdefault(cell.provider, []).append(jobs)
+        return list(_round_robin(_round_robin(cells) for cells in per_provider.values()))
+
+    async def run(self) -> SweepReport:
+        """
+        Runs the whole grid and returns the consolidated report.
+        """
+        jobs = self.schedule()
+        batches = [jobs[start:start + self.concurrency] for start in range(0, len(jobs), self.concurrency)]
+        game_configs = {
+            name for evaluator in self.evaluators for name in session_game_configs(evaluator.session_config)
+        }
+        # Without a state directory, each worker would have its own rate limit buckets.
+        state_dir = None if os.getenv(STATE_DIR_VARIABLE) else tempfile.mkdtemp(prefix="sweep-rate-limits-")
+        pool = WorkerPool(
+            self.max_workers,
+            max_tasks_per_child=self.max_tasks_per_child,
+            max_crash_retries=self.retry_policy.max_attempts - 1,
+            game_configs=sorted(game_configs),
+            environment={STATE_DIR_VARIABLE: state_dir} if state_dir else None
+        )
+
+        async def run_batch(batch: List[SweepJob]) -> List[Tuple[int, int, SessionResult]]:
+            try:
+                return await pool.run(_execute_sweep_batch, batch, self.concurrency, self.retry_policy)
+            except BrokenProcessPool as e:
+                failure = SessionFailure.from_exception(e, transient=True, attempts=pool.max_attempts)
+                return [(cell_index, run_id, failure) for cell_index, _, run_id in batch]
+
+        progress_bar = tqdm(total=len(jobs), desc="Sweeping", unit="game")
+        try:
+            with pool:
+                for future in asyncio.as_completed([run_batch(batch) for batch in batches]):
+                    for cell_index, run_id, result in await future:
+                        self.evaluators[cell_index].record(run_id, result)
+                        progress_bar.update(1)
+        finally:
+            self.worker_crashes += pool.crashes
+            progress_bar.close()
+            if state_dir is not None:
+                shutil.rmtree(state_dir, ignore_errors=True)
+            for evaluator in self.evaluators:
+                evaluator.close()
+
+        return SweepReport(results=[
+            (cell, evaluator.report()) for cell, evaluator in zip(self.cells, self.evaluators)
+        ])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate every combination of games, agents, LLMs and prompts.")
+    parser.add_argument("--games", nargs="+", required=True, help="Game IDs.")
+    parser.add_argument("--agents", nargs="+", required=True, help="Agent IDs.")
+    parser.add_argument("--llms", nargs="*", default=[], help="LLM identifiers (agent default if omitted).")
+    parser.add_argument("--prompts", nargs="*", default=[], help="System prompt IDs (agent default if omitted).")
+    parser.add_argument("--runs", type=int, default=100, help="Sessions per cell.")
+    parser.add_argument("--max_workers", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--checkpoint_dir", default=None)
+    args = parser.parse_args()
+
+    grid = SweepGrid(games=args.games, agents=args.agents, llms=args.llms, system_prompt_ids=args.prompts)
+    runner = SweepRunner(
+        grid,
+        runs_per_cell=args.runs,
+        max_workers=args.max_workers,
+        concurrency=args.concurrency,
+        checkpoint_dir=args.checkpoint_dir
+    )
+    print(asyncio.run(runner.run()).format_table())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app_layer.registries.manager import get_game_registry
+from game_layer.game_engine.core_engine import CoreEngine
+from game_layer.game_engine.trace import ReplayResult, SessionTrace, read_traces, replay_trace
+
+@dataclass(frozen=True)
+class RescoreReport:
+    """
+    Summary of replaying a trace file against the current game rules.
+    """
+    total_sessions: int
+    recorded_average_score: float
+    replayed_average_score: float
+    changed_scores: int
+    changed_statuses: int
+    diverged_sessions: int
+
+def build_game(trace: SessionTrace, game_params: Optional[Dict[str, Any]] = None) -> CoreEngine:
+    """
+    Instantiates the game a session was recorded with, through the game registry.
+
+    Args:
+        trace (SessionTrace): The recorded session.
+        game_params (dict, optional): Parameters overriding the recorded ones.
+    """
+    game_class = get_game_registry().get(trace.game_name).cls
+    return game_class(**{**trace.game_params, **(game_params or {})})
+
+def rescore_traces(
+    trace_path: str,
+    game_params: Optional[Dict[str, Any]] = None,
+    check_observations: bool = False
+) -> Iterator[Tuple[SessionTrace, ReplayResult]]:
+    """
+    Streams every recorded session together with the result of replaying it.
+    """
+    for trace in read_traces(trace_path):
+        yield trace, replay_trace(build_game(trace, game_params), trace, check_observations)
+
+def rescore_report(
+    trace_path: str,
+    game_params: Optional[Dict[str, Any]] = None,
+    check_observations: bool = False
+) -> RescoreReport:
+    """
+    Replays a whole trace file and compares the outcome with the recorded one.
+    """
+    total = 0
+    recorded_sum = 0.0
+    replayed_sum = 0.0
+    changed_scores = 0
+    changed_statuses = 0
+    diverged = 0
+
+    for trace, result in rescore_traces(trace_path, game_params, check_observations):
+        total += 1
+        recorded_sum += trace.final_score
+        replayed_sum += result.final_score
+        changed_scores += result.final_score != trace.final_score
+        changed_statuses += result.final_status != trace.final_status
+        diverged += result.first_divergence is not None
+
+    return RescoreReport(
+        total_sessions=total,
+        recorded_average_score=recorded_sum / total if total else 0.0,
+        replayed_average_score=replayed_sum / total if total else 0.0,
+        changed_scores=changed_scores,
+        changed_statuses=changed_statuses,
+        diverged_sessions=diverged
+    )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score recorded game sessions with the current game rules.")
+    parser.add_argument("trace_path", help="Trace file written by AgentEvaluator(trace_path=...).")
+    parser.add_argument("--check_observations", action="store_true", help="Count sessions whose observations changed.")
+    args = parser.parse_args()
+
+    report = rescore_report(args.trace_path, check_observations=args.check_observations)
+    print(f"Sessions:               {report.total_sessions}")
+    print(f"Recorded average score: {report.recorded_average_score:.4f}")
+    print(f"Replayed average score: {report.replayed_average_score:.4f}")
+    print(f"Changed scores:         {report.changed_scores}")
+    print(f"Changed statuses:       {report.changed_statuses}")
+    if args.check_observations:
+        print(f"Diverged sessions:      {report.diverged_sessions}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import asyncio
+import multiprocessing
+import multiprocessing.util
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Set, Tuple
+
+from agent_layer.llm_agents.LLMs.client_pool import close_clients
+from game_layer.game_engine.config_loader import GameConfig, preload_game_configs, install_game_configs
+
+# Event loop of the current worker process, kept alive between tasks so the
+# pooled LLM clients (and their open connections) are reused across sessions.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def run_in_worker_loop(coroutine):
+    """
+    Runs a coroutine on the persistent event loop of the worker process.
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        # Runs at worker shutdown (ProcessPoolExecutor workers skip atexit).
+        multiprocessing.util.Finalize(None, _close_worker_loop, exitpriority=10)
+    return _worker_loop.run_until_complete(coroutine)
+
+def _close_worker_loop() -> None:
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _worker_loop.run_until_complete(close_clients())
+        _worker_loop.close()
+
+def _initialize_worker(game_configs: Dict[str, GameConfig], environment: Dict[str, str]) -> None:
+    os.environ.update(environment)
+    install_game_configs(game_configs)
+
+
+class WorkerPool:
+    """
+    Process pool that survives crashed workers.
+
+    When a worker process dies (segfault, OOM kill, `os._exit`), the whole
+    ProcessPoolExecutor becomes unusable. WorkerPool replaces it with a fresh
+    one and resubmits the affected tasks. At most `max_workers` tasks are
+    submitted at a time, so a crash only hits the tasks that were running.
+
+    Which of them killed the worker is unknown, so that crash is not counted
+    against any of them: each one keeps its slot and is resubmitted at once
+    to the fresh pool. Only a task that crashes a second time is isolated:
+    it gives its slot back and is rerun in a single-worker executor of its
+    own, next to the pool (at most `max_workers` such tasks run at a time).
+    A crash there is the task's own and counts against its
+    `max_crash_retries`.
+
+    With `max_tasks_per_child`, the workers are also recycled: after
+    `max_tasks_per_child * max_workers` tasks the executor is retired (its
+    running tasks still finish) and a new one takes the next tasks. This
+    bounds slow leaks of long evaluations. (ProcessPoolExecutor's own
+    `max_tasks_per_child` is not used: it requires the 'spawn' start method
+    and can deadlock on Python 3.11.)
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_tasks_per_child: Optional[int] = None,
+        max_crash_retries: int = 2,
+        game_configs: Sequence[str] = (),
+        environment: Optional[Mapping[str, str]] = None
+    ):
+        """
+        Args:
+            max_workers (int): Number of worker processes.
+            max_tasks_per_child (int, optional): Tasks run per worker before the workers are replaced.
+            max_crash_retries (int): Times an isolated task is resubmitted after it
+                                     crashed its own worker.
+            game_configs (Sequence[str]): Game configurations parsed once here and handed to
+                                          every worker; the others are loaded by the workers
+                                          that need them.
+            environment (Mapping[str, str], optional): Environment variables set in every worker
+                                                       before it runs any task.
+        """
+        if max_tasks_per_child is not None and max_tasks_per_child < 1:
+            raise ValueError("max_tasks_per_child must be at least 1.")
+
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_crash_retries = max_crash_retries
+        self.crashes = 0
+
+        self._game_configs = preload_game_configs(list(game_configs))
+        self._environment = dict(environment or {})
+        self._executor = self._create_executor(self.max_workers)
+        self._generation = 0
+        self._submitted = 0
+        self._slots = asyncio.Semaphore(max_workers)
+        # Single-worker executors of the tasks that crashed twice.
+        self._isolated_executors: Set[ProcessPoolExecutor] = set()
+        self._isolated_slots = asyncio.Semaphore(max_workers)
+
+    @property
+    def max_attempts(self) -> int:
+        """
+        Times a task is run before `run` gives up: twice in the shared pool,
+        then `max_crash_retries + 1` times alone.
+        """
+        return self.max_crash_retries + 3
+
+    def _create_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        # Workers receive the already parsed game configs instead of re-reading them
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(self._game_configs, self._environment)
+        )
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        retry_args: Optional[Callable[[], Optional[Tuple[Any, ...]]]] = None
+    ) -> Any:
+        """
+        Runs `fn(*args)` in a worker process.
+
+        Args:
+            fn (Callable): Picklable function to run.
+            *args: Its (picklable) arguments.
+            retry_args (Callable, optional): Called before each resubmission after a crash,
+                                             returns the arguments to resubmit with, or None
+                                             when nothing is left to run (`run` then returns
+                                             None). Lets a task that reports partial results
+                                             skip the work already reported.
+
+        Raises:
+            BrokenProcessPool: If the task crashed two shared pools, then its
+                               isolated worker `max_crash_retries + 1` times.
+        """
+        loop = asyncio.get_running_loop()
+        submissions = 0
+
+        def next_args() -> Optional[Tuple[Any, ...]]:
+            nonlocal submissions
+            submissions += 1
+            if submissions == 1 or retry_args is None:
+                return args
+            return retry_args()
+
+        # Crashes of the shared pool are not attributed: one free rerun, still holding the slot.
+        async with self._slots:
+            for _ in range(2):
+                if (args := next_args()) is None:
+                    return None
+                executor, generation = self._take_executor()
+                try:
+                    return await loop.run_in_executor(executor, fn, *args)
+                except BrokenProcessPool:
+                    if generation == self._generation:
+                        # Every task of a broken pool fails at once; only the first replaces it.
+                        self.crashes += 1
+                        self._replace(cancel_futures=True)
+
+        # Crashed twice: run alone, where a crash is its own.
+        for crash in range(self.max_crash_retries + 1):
+            if (args := next_args()) is None:
+                return None
+            async with self._isolated_slots:
+                executor = self._create_executor(1)
+                self._isolated_executors.add(executor)
+                try:
+                    return await loop.run_in_executor(executor, fn, *args)
+                except BrokenProcessPool:
+                    self.crashes += 1
+                    if crash == self.max_crash_retries:
+                        raise
+                finally:
+                    self._isolated_executors.discard(executor)
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+    def _take_executor(self) -> Tuple[ProcessPoolExecutor, int]:
+        if self.max_tasks_per_child is not None and self._submitted >= self.max_tasks_per_child * self.max_workers:
+            self._replace(cancel_futures=False)
+        self._submitted += 1
+        return self._executor, self._generation
+
+    def _replace(self, cancel_futures: bool) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=cancel_futures)
+        self._executor = self._create_executor(self.max_workers)
+        self._generation += 1
+        self._submitted = 0
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for executor in list(self._isolated_executors):
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
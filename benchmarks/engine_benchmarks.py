@@ -0,0 +1,289 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from game_layer.game_engine.history import HistoryPolicy, KeepLastHistory
+from game_layer.games.level_based_games.mystery_secuences.mystery_secuences import MisterySecuences
+from game_layer.games.level_based_games.mystery_secuences.solver import solve_configuration, format_answer
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# A benchmark receives the number of operations to run and returns nothing.
+# Setup work happens in the factory, outside the measured call.
+BenchmarkFn = Callable[[int], None]
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Measurements of a single benchmark.
+
+    Attributes:
+        ops_per_sec (float): Best throughput over all repeats.
+        median_ops_per_sec (float): Median throughput over all repeats.
+        net_bytes_per_op (float): Memory retained after the run, per operation.
+        peak_kib (float): Peak traced memory during the run.
+    """
+    ops_per_sec: float
+    median_ops_per_sec: float
+    net_bytes_per_op: float
+    peak_kib: float
+
+
+def _solutions() -> List[str]:
+    return [
+        format_answer(solution.min_weight_answer, solution.length)
+        for solution in solve_configuration()
+    ]
+
+
+def _new_game(max_failed: int = 10**9, history_policy: Optional[HistoryPolicy] = None) -> MisterySecuences:
+    game = MisterySecuences(max_consecutive_failed_attempts=max_failed, history_policy=history_policy)
+    game.start()
+    return game
+
+
+def _long_game(turns: int, history_policy: Optional[HistoryPolicy] = None) -> MisterySecuences:
+    """
+    Returns a game on level 3 whose history already holds `turns` inputs.
+    """
+    game = _new_game(history_policy=history_policy)
+    answers = _solutions()
+    game.step(answers[0])
+    game.step(answers[1])
+    for _ in range(turns):
+        game.step("1 1")
+    return game
+
+
+def bench_step_valid_short_sessions() -> BenchmarkFn:
+    answers = _solutions()
+
+    def run(ops: int) -> None:
+        game = _new_game()
+        for i in range(ops):
+            if i % len(answers) == 0:
+                game = _new_game()
+            game.step(answers[i % len(answers)])
+    return run
+
+
+def bench_step_wrong_answer_long_session() -> BenchmarkFn:
+    game = _long_game(turns=100_000)
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.step("1 1")
+    return run
+
+
+def bench_step_wrong_answer_bounded_history() -> BenchmarkFn:
+    game = _long_game(turns=100_000, history_policy=KeepLastHistory(100))
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.step("1 1")
+    return run
+
+
+def bench_step_invalid_input() -> BenchmarkFn:
+    game = _new_game()
+    # A valid command every 5 inputs keeps the game below MAX_INVALID_INPUTS.
+    pattern = ["1 0 1", "2", "", "1 x", "/level 1"]
+
+    def run(ops: int) -> None:
+        for i in range(ops):
+            game.step(pattern[i % len(pattern)])
+    return run
+
+
+def bench_step_commands() -> BenchmarkFn:
+    game = _long_game(turns=0)
+    pattern = ["/repeat", "/level 3", "/level 1", "/level 9"]
+
+    def run(ops: int) -> None:
+        for i in range(ops):
+            game.step(pattern[i % len(pattern)])
+    return run
+
+
+def bench_parse_input() -> BenchmarkFn:
+    game = _long_game(turns=0)
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.parse_input("1 1")
+    return run
+
+
+def bench_verify_input() -> BenchmarkFn:
+    game = _long_game(turns=0)
+    action = game.parse_input("1 1")
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.verify_input(action)
+    return run
+
+
+def bench_process_input() -> BenchmarkFn:
+    game = _long_game(turns=0)
+    action = game.parse_input("1 1")
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.process_input(action)
+    return run
+
+
+def bench_apply_level_logic() -> BenchmarkFn:
+    game = _new_game()
+    game.max_unlocked_level = game.max_level_index
+    game.change_level(game.max_level_index)
+    answer = game.parse_level_input(" ".join("1" * len(game.string_layout)))
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.apply_level_logic(answer)
+    return run
+
+
+def bench_full_history_short() -> BenchmarkFn:
+    game = _long_game(turns=50)
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.get_full_history()
+    return run
+
+
+def bench_full_history_long() -> BenchmarkFn:
+    game = _long_game(turns=5_000)
+
+    def run(ops: int) -> None:
+        for _ in range(ops):
+            game.get_full_history()
+    return run
+
+
+# name -> (factory, operations per repeat)
+BENCHMARKS: Dict[str, tuple] = {
+    "step/valid/short_sessions": (bench_step_valid_short_sessions, 50_000),
+    "step/wrong_answer/long_session": (bench_step_wrong_answer_long_session, 100_000),
+    "step/wrong_answer/bounded_history": (bench_step_wrong_answer_bounded_history, 100_000),
+    "step/invalid_input": (bench_step_invalid_input, 100_000),
+    "step/commands": (bench_step_commands, 100_000),
+    "level_engine/parse_input": (bench_parse_input, 200_000),
+    "level_engine/verify_input": (bench_verify_input, 200_000),
+    "level_engine/process_input": (bench_process_input, 200_000),
+    "mystery_sequences/apply_level_logic": (bench_apply_level_logic, 200_000),
+    "core_engine/get_full_history/50_turns": (bench_full_history_short, 2_000),
+    "core_engine/get_full_history/5000_turns": (bench_full_history_long, 20),
+}
+
+
+def measure(factory: Callable[[], BenchmarkFn], ops: int, repeats: int) -> BenchmarkResult:
+    """
+    Runs a benchmark `repeats` times for throughput, then once more under
+    tracemalloc (with fewer operations) for allocation figures.
+    """
+    rates = []
+    for _ in range(repeats):
+        run = factory()
+        start = time.perf_counter()
+        run(ops)
+        rates.append(ops / (time.perf_counter() - start))
+
+    traced_ops = max(ops // 10, 1)
+    run = factory()
+    tracemalloc.start()
+    baseline_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    run(traced_ops)
+    current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return BenchmarkResult(
+        ops_per_sec=max(rates),
+        median_ops_per_sec=statistics.median(rates),
+        net_bytes_per_op=(current_bytes - baseline_bytes) / traced_ops,
+        peak_kib=(peak_bytes - baseline_bytes) / 1024
+    )
+
+
+def run_benchmarks(selected: Optional[List[str]] = None, repeats: int = 5, scale: float = 1.0) -> Dict[str, BenchmarkResult]:
+    results = {}
+    for name, (factory, ops) in BENCHMARKS.items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        results[name] = measure(factory, max(int(ops * scale), 1), repeats)
+        print(f"{name:<45} {results[name].ops_per_sec:>14,.0f} ops/s", flush=True)
+    return results
+
+
+def save_results(results: Dict[str, BenchmarkResult], path: Path) -> None:
+    payload = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=4)
+
+
+def compare_with_baseline(results: Dict[str, BenchmarkResult], baseline_path: Path, tolerance: float) -> List[str]:
+    """
+    Prints the throughput change against a stored run.
+
+    Returns:
+        List[str]: Names of the benchmarks slower than the baseline by more than `tolerance`.
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    print(f"\nComparison with {baseline_path}:")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        reference = baseline[name]["ops_per_sec"]
+        change = result.ops_per_sec / reference - 1
+        flag = ""
+        if change < -tolerance:
+            regressions.append(name)
+            flag = "  <-- REGRESSION"
+        print(f"{name:<45} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Game engine hot path microbenchmarks.")
+    parser.add_argument("--filter", nargs="*", help="Only run benchmarks whose name contains one of these strings.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the number of operations per repeat.")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, help="Stored results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed slowdown before flagging a regression.")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.filter, args.repeats, args.scale)
+    save_results(results, args.output)
+    print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+@dataclass(frozen=True)
+class CommandAction:
+    """
+    A system command such as '/repeat' or '/level 3'.
+
+    Attributes:
+        command (str): The command name, including the leading slash.
+        argument (Optional[int]): The integer argument, if the command takes one.
+    """
+    command: str
+    argument: Optional[int] = None
+
+    def __str__(self) -> str:
+        if self.argument is None:
+            return self.command
+        return f"{self.command} {self.argument}"
+
+
+@dataclass(frozen=True)
+class LevelAction:
+    """
+    A game move, already decoded by the game's level input parser.
+
+    Attributes:
+        payload (Any): The game-specific representation of the move (e.g. a BitVector).
+    """
+    payload: Any
+
+    def __str__(self) -> str:
+        return str(self.payload)
+
+
+@dataclass(frozen=True)
+class BitVector:
+    """
+    A fixed-length sequence of 0/1 values packed into an integer. The first
+    element of the sequence is the most significant bit.
+
+    Attributes:
+        bits (int): The packed value (e.g. '1 0 1' -> 0b101).
+        length (int): Number of elements of the sequence.
+    """
+    bits: int
+    length: int
+
+    def __str__(self) -> str:
+        return " ".join(format(self.bits, f"0{self.length}b")) if self.length else ""
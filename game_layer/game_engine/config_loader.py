@@ -0,0 +1,170 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# Resolved from the package location so loading never depends on the cwd.
+GAME_CONFIGS_DIR = Path(__file__).resolve().parent.parent / "game_configs"
+
+# Environment variable overriding the directory of user configurations.
+USER_CONFIGS_DIR_VARIABLE = "GAME_CONFIGS_USER_DIR"
+
+_config_cache: Dict[str, "GameConfig"] = {}
+_cache_lock = threading.Lock()
+
+class FrozenMapping(Mapping):
+    """
+    Read-only mapping used for level entries. Unlike MappingProxyType it can be
+    pickled and deep-copied, so engines holding it stay copyable.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._data = dict(data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def __reduce__(self):
+        return (FrozenMapping, (self._data,))
+
+@dataclass(frozen=True)
+class GameConfig:
+    """
+    Immutable, validated content of a game configuration file.
+
+    Level entries are read-only mappings (lists are stored as tuples), so a
+    single instance can be shared by every engine built in the process.
+
+    Attributes:
+        name (str): The configuration identifier (file name without extension).
+        levels (Tuple[Mapping[str, Any], ...]): The level definitions, in order.
+    """
+    name: str
+    levels: Tuple[Mapping[str, Any], ...]
+
+
+def user_configs_dir() -> Path:
+    """
+    Returns the directory of user configurations (e.g. generated level pools),
+    kept outside the package: GAME_CONFIGS_USER_DIR, or ~/.agentic-games/game_configs.
+    """
+    directory = os.getenv(USER_CONFIGS_DIR_VARIABLE)
+    return Path(directory) if directory else Path.home() / ".agentic-games" / "game_configs"
+
+
+def find_game_configs(prefix: str = "") -> List[str]:
+    """
+    Returns the names of the configurations starting with `prefix`, from
+    `game_configs/` and the user directory.
+    """
+    names = set()
+    for directory in (GAME_CONFIGS_DIR, user_configs_dir()):
+        names.update(path.stem for path in directory.glob(f"{prefix}*.json"))
+    return sorted(names)
+
+
+def load_game_config(config_name: str) -> GameConfig:
+    """
+    Returns the parsed configuration for a game. Each file is read and
+    validated at most once per process.
+
+    Args:
+        config_name (str): The file name without extension (e.g. 'mistery_sequences'),
+                           inside `game_configs/` or else the user directory.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist.
+        ValueError: If the file content is not a valid level configuration.
+    """
+    config = _config_cache.get(config_name)
+    if config is not None:
+        return config
+
+    with _cache_lock:
+        config = _config_cache.get(config_name)
+        if config is None:
+            config = _read_config(config_name)
+            _config_cache[config_name] = config
+    return config
+
+
+def preload_game_configs(config_names: Optional[list] = None) -> Dict[str, GameConfig]:
+    """
+    Loads the given configurations (all the files in `game_configs/` by default)
+    into the process cache.
+
+    Returns:
+        Dict[str, GameConfig]: The loaded configurations, ready to be handed to
+                               `install_game_configs` in worker processes.
+    """
+    if config_names is None:
+        config_names = sorted(path.stem for path in GAME_CONFIGS_DIR.glob("*.json"))
+
+    return {name: load_game_config(name) for name in config_names}
+
+
+def install_game_configs(configs: Dict[str, GameConfig]) -> None:
+    """
+    Seeds the process cache with already parsed configurations.
+
+    Intended as a `ProcessPoolExecutor` initializer, so workers receive the
+    parent's configurations instead of re-reading and re-validating the files.
+    """
+    with _cache_lock:
+        _config_cache.update(configs)
+
+
+def _read_config(config_name: str) -> GameConfig:
+    path = GAME_CONFIGS_DIR / f"{config_name}.json"
+    if not path.exists():
+        path = user_configs_dir() / f"{config_name}.json"
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Game configuration '{config_name}' not found in {GAME_CONFIGS_DIR} or {user_configs_dir()}."
+        )
+
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+
+    return _build_config(config_name, _validate_levels(config_name, raw))
+
+
+def _validate_levels(config_name: str, raw: Any) -> list:
+    if not isinstance(raw, dict):
+        raise ValueError(f"Game configuration '{config_name}' must be a JSON object.")
+
+    levels = raw.get("levels", [])
+    if not isinstance(levels, list) or not levels:
+        raise ValueError(f"Game configuration '{config_name}' must define a non-empty 'levels' list.")
+
+    for index, level in enumerate(levels):
+        if not isinstance(level, dict):
+            raise ValueError(f"Level {index + 1} of '{config_name}' must be a JSON object.")
+
+    return levels
+
+
+def _build_config(config_name: str, levels: list) -> GameConfig:
+    return GameConfig(name=config_name, levels=tuple(_freeze(level) for level in levels))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenMapping({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
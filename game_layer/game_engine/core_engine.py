@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Mapping, Type, Union
+from game_layer.game_engine.history import (
+    DEFAULT_HISTORY_TURNS, HistoryLog, HistoryPolicy, KeepAllHistory, SessionHistory, create_history_policy
+)
 
 class GameStatus(Enum):
     RUNNING = auto()
@@ -9,16 +13,47 @@ class GameStatus(Enum):
 
 MAX_INVALID_INPUTS = 10
 
+@dataclass(frozen=True)
+class EngineSnapshot:
+    """
+    Captured state of a game engine, produced by `CoreEngine.snapshot`.
+
+    Attributes:
+        engine_type (Type[CoreEngine]): The class of the engine that was captured.
+        state (Mapping[str, Any]): The engine attributes. Histories are stored as
+                                   O(1) forks that share storage with the engine.
+    """
+    engine_type: Type["CoreEngine"]
+    state: Mapping[str, Any]
+
 class CoreEngine(ABC):
     """
     Abstract Base Class for all Games.
     It manages the game loop state, history tracking, and basic lifecycle.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        history_policy: Union[HistoryPolicy, str, None] = None,
+        history_turns: int = DEFAULT_HISTORY_TURNS
+    ):
+        """
+        Args:
+            history_policy (HistoryPolicy | str, optional): How inputs and observations
+                are stored (keep all, keep the last N turns, spill to disk), as a
+                policy or one of HISTORY_POLICY_NAMES. Defaults to keeping
+                everything in memory.
+            history_turns (int): Turns kept by the 'keep_last' policy name.
+
+        Raises:
+            ValueError: If the policy name is unknown.
+        """
+        if isinstance(history_policy, str):
+            history_policy = create_history_policy(history_policy, history_turns)
         self.game_status = GameStatus.RUNNING
-        self.input_history: List[str] = []
-        self.observation_history: List[str] = []
+        self.history_policy = history_policy or KeepAllHistory()
+        self.input_history: HistoryLog = self.history_policy.create_log()
+        self.observation_history: HistoryLog = self.history_policy.create_log()
         self.consecutive_invalid_inputs = 0
 
     def start(self) -> str:
@@ -39,7 +74,8 @@ class CoreEngine(ABC):
         self.input_history.append(input_data)
 
         try:
-            self.verify_input(input_data)
+            action = self.parse_input(input_data)
+            self.verify_input(action)
             self.consecutive_invalid_inputs = 0
         except ValueError as e:
             self.consecutive_invalid_inputs += 1
@@ -48,10 +84,51 @@ class CoreEngine(ABC):
                 return "Too many invalid inputs. Aborting the game to avoid infinite loop."
             return str(e)
         
-        new_obs = self.process_input(input_data)
+        new_obs = self.process_input(action)
         self.observation_history.append(new_obs)
         return new_obs
     
+    def snapshot(self) -> EngineSnapshot:
+        """
+        Captures the current state of the game in O(1) with respect to the
+        history length.
+
+        Engine attributes are copied shallowly, so subclasses must replace
+        (not mutate in place) any container they keep besides the histories.
+        """
+        state = {
+            key: value.fork() if isinstance(value, HistoryLog) else value
+            for key, value in self.__dict__.items()
+        }
+        return EngineSnapshot(engine_type=type(self), state=state)
+
+    def restore(self, snapshot: EngineSnapshot) -> None:
+        """
+        Returns the game to a previously captured state. The snapshot remains
+        valid and can be restored any number of times.
+
+        Raises:
+            ValueError: If the snapshot was taken from a different kind of engine.
+        """
+        if snapshot.engine_type is not type(self):
+            raise ValueError(
+                f"Cannot restore a {snapshot.engine_type.__name__} snapshot "
+                f"into a {type(self).__name__}."
+            )
+
+        self.__dict__.clear()
+        for key, value in snapshot.state.items():
+            self.__dict__[key] = value.fork() if isinstance(value, HistoryLog) else value
+
+    def fork(self) -> "CoreEngine":
+        """
+        Returns an independent copy of the game that shares the history
+        storage with this one (copy-on-write).
+        """
+        clone = type(self).__new__(type(self))
+        clone.restore(self.snapshot())
+        return clone
+
     def get_initial_observation(self) -> str:
         obs = f"Game '{self.name}' started.\n"
         obs += self.get_instructions()
@@ -68,31 +145,45 @@ class CoreEngine(ABC):
         """Returns the game instructions."""
         ...
 
-    @abstractmethod
-    def verify_input(self, input_data: str):
+    def parse_input(self, input_data: str) -> Any:
+        """
+        Converts the raw input into the action consumed by verify_input and
+        process_input, so the input string is only decoded once per turn.
+        Games override this to plug in their own parser; by default the
+        action is the raw string itself.
+
+        Raises:
+            ValueError: If the input cannot be parsed.
+        """
         if not isinstance(input_data, str):
             raise ValueError("Input must be a string.")
+        return input_data
 
     @abstractmethod
-    def process_input(self, input_data: str) -> str:
+    def verify_input(self, action: Any):
+        """
+        Validates the parsed action against the current game state.
+        Raises ValueError if the action is not allowed.
+        """
         ...
 
-    def get_full_history(self) -> str:        
+    @abstractmethod
+    def process_input(self, action: Any) -> str:
+        ...
+
+    def get_history(self) -> SessionHistory:
+        """
+        Returns a lazy view of the session history. It is cheap to create and
+        is not affected by later turns; the text is only built on `render()`.
+        """
+        return SessionHistory(self.input_history.fork(), self.observation_history.fork())
+
+    def get_full_history(self) -> str:
         """
         Formats the session history into a readable string.
         """
-        out = []
-        max_len = max(len(self.observation_history), len(self.input_history))
-        
-        for i in range(max_len):
-            if i < len(self.observation_history):
-                out.append(f"Observation {i}: {self.observation_history[i]}")
-            if i < len(self.input_history):
-                out.append(f"Input {i}: {self.input_history[i]}")
-            out.append("-" * 20)
-            
-        return "\n".join(out)
-    
+        return self.get_history().render()
+
     @abstractmethod
     def get_score(self) -> float:
         """
@@ -0,0 +1,407 @@
+import json
+import os
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
+
+class HistoryLog(Sequence, ABC):
+    """
+    Append-only record of one kind of session event (inputs or observations).
+
+    Logs may drop old items; `offset` is the session index of the first item
+    still retained, so item `i` of the log is event number `offset + i`.
+    """
+
+    @abstractmethod
+    def append(self, item: Any) -> None:
+        ...
+
+    @abstractmethod
+    def fork(self) -> "HistoryLog":
+        """
+        Returns an independent copy that future appends do not affect.
+        """
+        ...
+
+    @property
+    def offset(self) -> int:
+        return 0
+
+
+# Items per shared segment of a ForkableLog: a fork copies at most this many.
+SEGMENT_SIZE = 64
+
+class _Segment:
+    """
+    An immutable run of SEGMENT_SIZE items, linked to the segment before it.
+    Segments are shared by every fork that has seen them.
+    """
+
+    __slots__ = ("items", "previous", "start")
+
+    def __init__(self, items: tuple, previous: Optional["_Segment"]):
+        self.items = items
+        self.previous = previous
+        self.start = previous.start + SEGMENT_SIZE if previous is not None else 0
+
+
+class ForkableLog(HistoryLog):
+    """
+    Append-only sequence whose forks share storage (persistent segments).
+
+    Items are grouped into immutable segments of SEGMENT_SIZE items, each
+    linked to the previous one; only the last, partial segment is private to
+    a log. Forking shares the segment chain and copies the partial segment,
+    and appending never touches shared data, so both are O(1) regardless of
+    the log length and of how many forks exist. Recent items are found in
+    O(1); older ones are reached by walking back the chain.
+    """
+
+    __slots__ = ("_last", "_tail", "_length")
+
+    def __init__(self, items: Optional[Iterable[Any]] = None):
+        self._last: Optional[_Segment] = None
+        self._tail: List[Any] = []
+        self._length = 0
+        for item in items if items is not None else ():
+            self.append(item)
+
+    def append(self, item: Any) -> None:
+        """
+        Appends an item to this log without affecting any other fork.
+        """
+        self._tail.append(item)
+        self._length += 1
+        if len(self._tail) == SEGMENT_SIZE:
+            self._last = _Segment(tuple(self._tail), self._last)
+            self._tail = []
+
+    def fork(self) -> "ForkableLog":
+        """
+        Returns an independent copy of the current content in O(1).
+        """
+        clone = ForkableLog.__new__(ForkableLog)
+        clone._last = self._last
+        clone._tail = self._tail.copy()
+        clone._length = self._length
+        return clone
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ForkableLog index out of range")
+
+        segment = self._last
+        if segment is None or index >= segment.start + SEGMENT_SIZE:
+            return self._tail[index - self._length + len(self._tail)]
+        while index < segment.start:
+            segment = segment.previous
+        return segment.items[index - segment.start]
+
+    def __iter__(self) -> Iterator[Any]:
+        segments = []
+        segment = self._last
+        while segment is not None:
+            segments.append(segment)
+            segment = segment.previous
+        for segment in reversed(segments):
+            yield from segment.items
+        yield from self._tail.copy()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ForkableLog, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ForkableLog({list(self)!r})"
+
+    def __reduce__(self):
+        return (ForkableLog, (list(self),))
+
+
+class BoundedLog(HistoryLog):
+    """
+    Keeps only the last `max_items` appended items. Forking copies at most
+    `max_items` references.
+    """
+
+    __slots__ = ("_items", "_total")
+
+    def __init__(self, max_items: int, items: Iterable[Any] = (), offset: int = 0):
+        self._items = deque(items, maxlen=max_items)
+        self._total = offset + len(self._items)
+
+    def append(self, item: Any) -> None:
+        self._items.append(item)
+        self._total += 1
+
+    def fork(self) -> "BoundedLog":
+        return BoundedLog(self._items.maxlen, self._items, self.offset)
+
+    @property
+    def offset(self) -> int:
+        return self._total - len(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(*index.indices(len(self._items)))]
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __reduce__(self):
+        return (BoundedLog, (self._items.maxlen, list(self._items), self.offset))
+
+
+class _SpillFile:
+    """
+    A temporary file shared by the forks of a SpilledLog. It is deleted once
+    no log references it anymore.
+    """
+
+    def __init__(self, directory: Optional[str]):
+        handle, self.path = tempfile.mkstemp(prefix="history_", suffix=".jsonl", dir=directory)
+        os.close(handle)
+        weakref.finalize(self, _remove_file, self.path)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class SpilledLog(HistoryLog):
+    """
+    Stores items on disk (one JSON value per line), keeping only a small write
+    buffer in memory. Forks share the file prefix; the first flush of a fork
+    whose file was extended by another one copies that prefix to a private file.
+
+    Random access reads the file sequentially; the log is meant to be written
+    during the session and read once when the history is rendered.
+
+    The file belongs to the process that wrote it and is deleted with its last
+    log. A pickled log (e.g. sent back from a worker in a GameResult) carries
+    its content instead, which the receiving process writes to a file of its own.
+    """
+
+    def __init__(self, directory: Optional[str] = None, buffer_size: int = 64):
+        self._directory = directory
+        self._buffer_size = buffer_size
+        self._file = _SpillFile(directory)
+        self._length = 0
+        self._end = 0
+        self._pending: List[str] = []
+
+    def append(self, item: Any) -> None:
+        self._pending.append(json.dumps(item) + "\n")
+        self._length += 1
+        if len(self._pending) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered items to disk.
+        """
+        if not self._pending:
+            return
+
+        if os.path.getsize(self._file.path) != self._end:
+            # Another fork wrote past our end: continue in a private copy.
+            self._detach()
+
+        data = "".join(self._pending).encode("utf-8")
+        with open(self._file.path, "ab") as f:
+            f.write(data)
+        self._end += len(data)
+        self._pending = []
+
+    def fork(self) -> "SpilledLog":
+        self.flush()
+        clone = SpilledLog.__new__(SpilledLog)
+        clone._directory = self._directory
+        clone._buffer_size = self._buffer_size
+        clone._file = self._file
+        clone._length = self._length
+        clone._end = self._end
+        clone._pending = []
+        return clone
+
+    def _detach(self) -> None:
+        new_file = _SpillFile(self._directory)
+        with open(self._file.path, "rb") as source, open(new_file.path, "wb") as target:
+            remaining = self._end
+            while remaining:
+                chunk = source.read(min(remaining, 1 << 20))
+                target.write(chunk)
+                remaining -= len(chunk)
+        self._file = new_file
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        self.flush()
+        with open(self._file.path, "rb") as f:
+            for line in islice(f, self._length):
+                yield json.loads(line)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._length))
+            wanted = set(indices)
+            items = {i: item for i, item in enumerate(self) if i in wanted}
+            return [items[i] for i in indices]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SpilledLog index out of range")
+        return next(islice(iter(self), index, None))
+
+    def __reduce__(self):
+        self.flush()
+        with open(self._file.path, "rb") as f:
+            data = f.read(self._end)
+        return (_load_spilled_log, (self._directory, self._buffer_size, self._length, data))
+
+
+def _load_spilled_log(directory: Optional[str], buffer_size: int, length: int, data: bytes) -> SpilledLog:
+    if directory is not None and not os.path.isdir(directory):
+        directory = None
+    log = SpilledLog(directory, buffer_size)
+    with open(log._file.path, "wb") as f:
+        f.write(data)
+    log._length = length
+    log._end = len(data)
+    return log
+
+
+class HistoryPolicy(ABC):
+    """
+    Decides how a game engine stores its session history.
+    """
+
+    @abstractmethod
+    def create_log(self) -> HistoryLog:
+        ...
+
+
+class KeepAllHistory(HistoryPolicy):
+    """Keeps every input and observation in memory (default)."""
+
+    def create_log(self) -> HistoryLog:
+        return ForkableLog()
+
+
+class KeepLastHistory(HistoryPolicy):
+    """Keeps only the last `max_turns` inputs and observations in memory."""
+
+    def __init__(self, max_turns: int):
+        if max_turns < 1:
+            raise ValueError("max_turns must be at least 1.")
+        self.max_turns = max_turns
+
+    def create_log(self) -> HistoryLog:
+        return BoundedLog(self.max_turns)
+
+
+class SpillToDiskHistory(HistoryPolicy):
+    """Writes the whole history to temporary files instead of keeping it in memory."""
+
+    def __init__(self, directory: Optional[str] = None, buffer_size: int = 64):
+        self.directory = directory
+        self.buffer_size = buffer_size
+
+    def create_log(self) -> HistoryLog:
+        return SpilledLog(self.directory, self.buffer_size)
+
+
+# Names under which the policies can be chosen as plain game parameters.
+HISTORY_POLICY_NAMES = ("keep_all", "keep_last", "spill_to_disk")
+
+DEFAULT_HISTORY_TURNS = 100
+
+def create_history_policy(name: str, max_turns: int = DEFAULT_HISTORY_TURNS) -> HistoryPolicy:
+    """
+    Builds a history policy from its name.
+
+    Args:
+        name (str): One of HISTORY_POLICY_NAMES.
+        max_turns (int): Turns kept by 'keep_last'.
+
+    Raises:
+        ValueError: If the name is unknown or `max_turns` is not positive.
+    """
+    if name == "keep_all":
+        return KeepAllHistory()
+    if name == "keep_last":
+        return KeepLastHistory(max_turns)
+    if name == "spill_to_disk":
+        return SpillToDiskHistory()
+    raise ValueError(f"Unknown history policy '{name}'. Available policies: {', '.join(HISTORY_POLICY_NAMES)}")
+
+
+class SessionHistory:
+    """
+    Lazy, structured view of a session history.
+
+    It holds forks of the engine logs, so creating it is cheap and later turns
+    do not modify it. The text transcript is only built when `render()` (or
+    `str()`) is called.
+
+    Pickling copies the logs, including the content of spilled ones, so a
+    history stays readable after crossing a process boundary.
+    """
+
+    def __init__(self, inputs: HistoryLog, observations: HistoryLog):
+        self.inputs = inputs
+        self.observations = observations
+
+    def render(self) -> str:
+        """
+        Formats the session history into a readable string.
+        """
+        out = []
+        first = min(self.inputs.offset, self.observations.offset)
+        if first > 0:
+            out.append(f"[{first} earlier turns not retained]")
+
+        observations = iter(self.observations)
+        inputs = iter(self.inputs)
+        observations_end = self.observations.offset + len(self.observations)
+        inputs_end = self.inputs.offset + len(self.inputs)
+
+        for i in range(first, max(observations_end, inputs_end)):
+            has_observation = self.observations.offset <= i < observations_end
+            has_input = self.inputs.offset <= i < inputs_end
+            if not (has_observation or has_input):
+                continue
+            if has_observation:
+                out.append(f"Observation {i}: {next(observations)}")
+            if has_input:
+                out.append(f"Input {i}: {next(inputs)}")
+            out.append("-" * 20)
+
+        return "\n".join(out)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"SessionHistory(inputs={len(self.inputs)}, observations={len(self.observations)})"
@@ -1,7 +1,10 @@
 from enum import Enum, auto
 from game_layer.game_engine.core_engine import CoreEngine, GameStatus
+from game_layer.game_engine.config_loader import load_game_config
+from game_layer.game_engine.history import DEFAULT_HISTORY_TURNS, HistoryPolicy
+from game_layer.game_engine.actions import CommandAction, LevelAction
 from abc import abstractmethod
-import json
+from typing import Union
 
 class LevelLogicResult(Enum):
     CONTINUE = auto()
@@ -9,22 +12,29 @@ class LevelLogicResult(Enum):
     FAILED = auto()
 
 class LevelBasedEngine(CoreEngine):
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        history_policy: Union[HistoryPolicy, str, None] = None,
+        history_turns: int = DEFAULT_HISTORY_TURNS
+    ):
+        super().__init__(history_policy, history_turns)
         self.max_unlocked_level = 0
         self.load_game_configuration()
         self.start_level(0)
         self.steps_in_current_level = 0
 
-    def load_game_configuration(self):
+    @property
+    def config_name(self):
         """
-        Loads the game configuration.
+        Returns the identifier of the configuration file in game_layer/game_configs.
         """
-        path = f"game_layer/game_configs/{self.name.replace(' ', '_').lower()}.json"
-        with open(path, 'r') as f:
-            config = json.load(f)
+        return self.name.replace(' ', '_').lower()
 
-        self.level_configs = config.get("levels", [])
+    def load_game_configuration(self):
+        """
+        Loads the game configuration from the process-wide config cache.
+        """
+        self.level_configs = load_game_config(self.config_name).levels
 
     @property
     def max_level_index(self):
@@ -78,7 +88,7 @@ class LevelBasedEngine(CoreEngine):
     @abstractmethod
     def apply_level_logic(self, input_data):
         """
-        Applies the level logic based on the input data.
+        Applies the level logic based on the payload returned by parse_level_input.
         """
         return LevelLogicResult.CONTINUE
     
@@ -109,19 +119,15 @@ class LevelBasedEngine(CoreEngine):
             LevelLogicResult.FAILED: _handle_failed,
         }
 
-    def process_input(self, input_data):
-        if input_data[0] == '/':
-            command_parts = input_data.split()
-            command = command_parts[0]
-
-            requested_level = None
-            if command == '/repeat':
+    def process_input(self, action):
+        if isinstance(action, CommandAction):
+            if action.command == '/repeat':
                 requested_level = self.current_level_index - 1
-            elif command == '/level' and len(command_parts) > 1:
-                    requested_level = int(command_parts[1]) - 1
+            else:
+                requested_level = action.argument - 1
             return self.change_level(requested_level)  
 
-        level_status = self.apply_level_logic(input_data)
+        level_status = self.apply_level_logic(action.payload)
 
         return self.HANDLERS.get(level_status)(self)
         
@@ -135,22 +141,47 @@ class LevelBasedEngine(CoreEngine):
         self.start_level(new_level_index)
         return self.get_level_observation()
     
-    def verify_input(self, input_data):
-        super().verify_input(input_data)
-        if input_data[0] == "/":
-            command_parts = input_data.split()
-            command = command_parts[0]
-
-            assert command in ['/repeat', '/level'], f"Unknown command: {command}"
-            if command == '/level':
-                assert len(command_parts) > 1 and command_parts[1].isdigit(), "Command '/level' requires an integer argument"
-        else:
-            self.verify_level_input(input_data)
-            
+    def parse_input(self, input_data):
+        """
+        Splits the raw input into either a CommandAction or a LevelAction whose
+        payload is decoded by the game's parse_level_input.
+        """
+        input_data = super().parse_input(input_data)
+        if input_data.startswith("/"):
+            return self.parse_command(input_data)
+        return LevelAction(self.parse_level_input(input_data))
+
+    @staticmethod
+    def parse_command(input_data):
+        """
+        Parses a '/repeat' or '/level n' command.
+        """
+        command_parts = input_data.split()
+        command = command_parts[0]
+
+        if command == '/repeat':
+            return CommandAction(command)
+        if command == '/level':
+            if not (len(command_parts) > 1 and command_parts[1].isdigit()):
+                raise ValueError("Command '/level' requires an integer argument")
+            return CommandAction(command, int(command_parts[1]))
+        raise ValueError(f"Unknown command: {command}")
+
+    def verify_input(self, action):
+        if isinstance(action, LevelAction):
+            self.verify_level_input(action.payload)
+
     @abstractmethod
-    def verify_level_input(self, input_data):
+    def parse_level_input(self, input_data):
+        """
+        Decodes a level move into the payload consumed by verify_level_input and
+        apply_level_logic. Raises ValueError if the input is malformed.
+        """
+        pass
+
+    def verify_level_input(self, payload):
         """
-        Verifies the level-specific input.
+        Verifies the decoded level move against the current game state.
         """
         pass
 
@@ -0,0 +1,336 @@
+import json
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from game_layer.game_engine.core_engine import CoreEngine, GameStatus
+
+# File layout:
+#   MAGIC, then a sequence of records, each starting with a one-byte tag.
+#   _STRING_TAG   uint32 byte length + UTF-8 text. Strings are numbered in
+#                 order of appearance and shared by every session of the file.
+#   _SESSION_TAG  _SESSION_HEADER, then `turns` pairs of uint32 string ids
+#                 (action, observation).
+# All integers are little-endian.
+MAGIC = b"GTRACE\x00\x02"
+_STRING_TAG = b"S"
+_SESSION_TAG = b"G"
+_LENGTH = struct.Struct("<I")
+# run ID (-1 if none), game name id, game params id, initial observation id,
+# status, final score, turns
+_SESSION_HEADER = struct.Struct("<iIIIBdI")
+# Version 1 files (still readable) have no run ID.
+_V1_MAGIC = b"GTRACE\x00\x01"
+_V1_SESSION_HEADER = struct.Struct("<IIIBdI")
+# Type code of a 32-bit unsigned array (its width is platform dependent).
+_ID_TYPE = "I" if array("I").itemsize == 4 else "L"
+
+@dataclass
+class SessionTrace:
+    """
+    The inputs and observations of one finished game session.
+
+    Attributes:
+        game_name (str): Registry identifier of the game.
+        game_params (Dict[str, Any]): Keyword arguments used to build the game.
+        initial_observation (str): Observation returned by `start()`.
+        actions (List[str]): Raw inputs, in order.
+        observations (List[str]): The observation returned by `step()` for each input.
+        final_status (GameStatus): Status of the game when the session ended.
+        final_score (float): Score of the game when the session ended.
+        run_id (Optional[int]): Evaluation run the session belongs to.
+    """
+    game_name: str
+    game_params: Dict[str, Any] = field(default_factory=dict)
+    initial_observation: str = ""
+    actions: List[str] = field(default_factory=list)
+    observations: List[str] = field(default_factory=list)
+    final_status: GameStatus = GameStatus.RUNNING
+    final_score: float = 0.0
+    run_id: Optional[int] = None
+
+    def record(self, action: str, observation: str) -> None:
+        self.actions.append(action)
+        self.observations.append(observation)
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """
+    Outcome of feeding a recorded session back through a game engine.
+
+    Attributes:
+        final_status (GameStatus): Status reached by the engine.
+        final_score (float): Score reached by the engine.
+        turns_replayed (int): Inputs consumed before the game ended or the trace ran out.
+        first_divergence (Optional[int]): Index of the first input whose observation
+            differs from the recorded one (-1 for the initial observation), or None
+            if the replay reproduced every observation. Only set when observations
+            are checked.
+    """
+    final_status: GameStatus
+    final_score: float
+    turns_replayed: int
+    first_divergence: Optional[int] = None
+
+
+class TraceWriter:
+    """
+    Appends sessions to a binary trace file. Every distinct action and
+    observation text is written once per file; sessions only store ids.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        append: bool = False,
+        keep_runs: Optional[AbstractSet[int]] = None
+    ):
+        """
+        Args:
+            path (str | Path): The trace file.
+            append (bool): If True and the file exists, new sessions are added to it
+                           (its string table is loaded first). Otherwise the file is
+                           overwritten.
+            keep_runs (AbstractSet[int], optional): When appending, the runs whose
+                           sessions are kept (e.g. those of a checkpoint); the
+                           others are removed from the file first.
+
+        Raises:
+            ValueError: If the file to append to is not a current trace file.
+        """
+        self.path = Path(path)
+        self._ids: Dict[str, int] = {}
+
+        if append and self.path.exists() and self.path.stat().st_size > 0:
+            self._file: BinaryIO = self._resume(keep_runs)
+        else:
+            self._file = open(self.path, "wb")
+            self._file.write(MAGIC)
+
+    def _resume(self, keep_runs: Optional[AbstractSet[int]]) -> BinaryIO:
+        """
+        Reopens an existing file for appending. A record cut by a crash is
+        truncated, and sessions of runs outside `keep_runs` are dropped.
+        """
+        with open(self.path, "r+b") as f:
+            strings, run_ids, end = _scan(f)
+            f.truncate(end)
+
+        if keep_runs is not None and any(run_id not in keep_runs for run_id in run_ids):
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with TraceWriter(temp_path) as writer:
+                for trace in read_traces(self.path):
+                    if trace.run_id in keep_runs:
+                        writer.write(trace)
+            os.replace(temp_path, self.path)
+            with open(self.path, "rb") as f:
+                strings, _, _ = _scan(f)
+
+        self._ids = {text: string_id for string_id, text in enumerate(strings)}
+        return open(self.path, "ab")
+
+    def write(self, trace: SessionTrace) -> None:
+        """
+        Raises:
+            ValueError: If the game parameters are not JSON serializable.
+        """
+        try:
+            params = json.dumps(trace.game_params, sort_keys=True)
+        except TypeError as e:
+            raise ValueError(f"Game parameters must be JSON serializable to be recorded. {e}")
+
+        turns = min(len(trace.actions), len(trace.observations))
+        ids = array(_ID_TYPE)
+        for i in range(turns):
+            ids.append(self._intern(trace.actions[i]))
+            ids.append(self._intern(trace.observations[i]))
+
+        header = _SESSION_HEADER.pack(
+            -1 if trace.run_id is None else trace.run_id,
+            self._intern(trace.game_name),
+            self._intern(params),
+            self._intern(trace.initial_observation),
+            trace.final_status.value,
+            trace.final_score,
+            turns
+        )
+        ids = _little_endian(ids)
+        self._file.write(_SESSION_TAG + header + ids.tobytes())
+
+    def _intern(self, text: str) -> int:
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = len(self._ids)
+            self._ids[text] = string_id
+            data = text.encode("utf-8")
+            self._file.write(_STRING_TAG + _LENGTH.pack(len(data)) + data)
+        return string_id
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to disk and syncs the file.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_traces(path: Union[str, Path]) -> Iterator[SessionTrace]:
+    """
+    Streams the sessions stored in a trace file.
+
+    Raises:
+        ValueError: If the file is not a trace file or is truncated.
+    """
+    with open(path, "rb") as f:
+        yield from _read_records(f)
+
+
+def _scan(f: BinaryIO) -> Tuple[List[str], List[Optional[int]], int]:
+    """
+    Reads the string table and the run IDs of a file without decoding the
+    sessions, and returns them with the offset where its last complete record ends.
+
+    Raises:
+        ValueError: If the file is not a current trace file.
+    """
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"'{f.name}' is not a trace file of the current format.")
+
+    size = os.fstat(f.fileno()).st_size
+    strings: List[str] = []
+    run_ids: List[Optional[int]] = []
+    end = f.tell()
+    try:
+        while True:
+            tag = f.read(1)
+            if not tag:
+                break
+            if tag == _STRING_TAG:
+                length, = _LENGTH.unpack(_read_exact(f, _LENGTH.size))
+                text = _read_exact(f, length).decode("utf-8")
+            elif tag == _SESSION_TAG:
+                header = _SESSION_HEADER.unpack(_read_exact(f, _SESSION_HEADER.size))
+                f.seek(header[-1] * 8, 1)
+                if f.tell() > size:
+                    break
+            else:
+                break
+            # The record is complete.
+            if tag == _STRING_TAG:
+                strings.append(text)
+            else:
+                run_ids.append(None if header[0] < 0 else header[0])
+            end = f.tell()
+    except (ValueError, UnicodeDecodeError):
+        pass
+    return strings, run_ids, end
+
+
+def _read_records(f: BinaryIO) -> Iterator[SessionTrace]:
+    magic = f.read(len(MAGIC))
+    if magic == MAGIC:
+        session_header = _SESSION_HEADER
+    elif magic == _V1_MAGIC:
+        session_header = _V1_SESSION_HEADER
+    else:
+        raise ValueError(f"'{f.name}' is not a game trace file.")
+
+    strings: List[str] = []
+    statuses = {status.value: status for status in GameStatus}
+
+    while True:
+        tag = f.read(1)
+        if not tag:
+            return
+
+        if tag == _STRING_TAG:
+            length, = _LENGTH.unpack(_read_exact(f, _LENGTH.size))
+            strings.append(_read_exact(f, length).decode("utf-8"))
+
+        elif tag == _SESSION_TAG:
+            fields = session_header.unpack(_read_exact(f, session_header.size))
+            run_id = fields[0] if session_header is _SESSION_HEADER else -1
+            name_id, params_id, initial_id, status, score, turns = fields[-6:]
+
+            ids = array(_ID_TYPE)
+            ids.frombytes(_read_exact(f, turns * 8))
+            ids = _little_endian(ids)
+            yield SessionTrace(
+                game_name=strings[name_id],
+                game_params=json.loads(strings[params_id]),
+                initial_observation=strings[initial_id],
+                actions=[strings[i] for i in ids[0::2]],
+                observations=[strings[i] for i in ids[1::2]],
+                final_status=statuses[status],
+                final_score=score,
+                run_id=None if run_id < 0 else run_id
+            )
+
+        else:
+            raise ValueError(f"Corrupted trace file '{f.name}': unknown record tag {tag!r}.")
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError(f"Trace file '{f.name}' is truncated.")
+    return data
+
+
+def _little_endian(ids: array) -> array:
+    if sys.byteorder != "little":
+        ids.byteswap()
+    return ids
+
+
+def replay_trace(engine: CoreEngine, trace: SessionTrace, check_observations: bool = False) -> ReplayResult:
+    """
+    Feeds the recorded inputs to a fresh engine through `CoreEngine.step`,
+    without actor or event loop, and reports where the engine ends up.
+
+    The replay stops early if the game ends before the trace does (e.g. after
+    a rule change).
+
+    Args:
+        engine (CoreEngine): A newly built, not yet started engine.
+        trace (SessionTrace): The session to replay.
+        check_observations (bool): Compare each observation with the recorded one.
+
+    Returns:
+        ReplayResult: Final status and score reached by the engine.
+    """
+    divergence = None
+    observation = engine.start()
+    if check_observations and observation != trace.initial_observation:
+        divergence = -1
+
+    turns = 0
+    step = engine.step
+    for action in trace.actions:
+        if engine.game_status != GameStatus.RUNNING:
+            break
+        observation = step(action)
+        if check_observations and divergence is None and observation != trace.observations[turns]:
+            divergence = turns
+        turns += 1
+
+    return ReplayResult(
+        final_status=engine.game_status,
+        final_score=engine.get_score(),
+        turns_replayed=turns,
+        first_divergence=divergence
+    )
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+from .sequence_character import CHAR_MAP
+
+@dataclass(frozen=True)
+class CompiledLevel:
+    """
+    Constraint checker for a single Mystery Sequences layout.
+
+    All the character rules of a layout are folded into one bitmask of the
+    positions where a 1 is forbidden. Answers are represented as integers whose
+    most significant bit is the first element of the sequence (see
+    `position_bit`), so checking an answer is one AND plus the
+    "at least one 1" rule.
+
+    Attributes:
+        layout (Tuple[str, ...]): The symbols of the level, as shown to the player.
+        length (int): Number of elements an answer must have.
+        forbidden_mask (int): Bitmask of the positions that must be 0.
+    """
+    layout: Tuple[str, ...]
+    length: int
+    forbidden_mask: int
+
+    def accepts(self, answer_mask: int) -> bool:
+        """
+        Returns True if the answer bitmask satisfies every constraint of the level.
+        """
+        return answer_mask != 0 and not (answer_mask & self.forbidden_mask)
+
+
+def compile_layout(layout: Sequence[str]) -> CompiledLevel:
+    """
+    Returns the compiled checker for a layout. Results are cached, so jumping
+    between levels (or building new games) never rebuilds the character rules.
+
+    Args:
+        layout (Sequence[str]): The level symbols (e.g. ["A", "_", "X"]).
+    """
+    return _compile_layout(tuple(layout))
+
+
+def build_compiled_level(layout: Sequence[str]) -> CompiledLevel:
+    """
+    Compiles a layout without going through the cache. Meant for bulk tools
+    (e.g. level generation) that see each layout once.
+    """
+    layout = tuple(layout)
+    length = len(layout)
+    forbidden_mask = 0
+
+    for i, char in enumerate(layout):
+        if char in CHAR_MAP:
+            forbidden_mask |= CHAR_MAP[char](position=i).forbidden_mask(length)
+
+    return CompiledLevel(layout=layout, length=length, forbidden_mask=forbidden_mask)
+
+
+@lru_cache(maxsize=None)
+def _compile_layout(layout: Tuple[str, ...]) -> CompiledLevel:
+    return build_compiled_level(layout)
@@ -0,0 +1,276 @@
+import argparse
+import json
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from game_layer.game_engine.config_loader import user_configs_dir
+from .compiled_level import build_compiled_level
+from .mystery_secuences import DEFAULT_LEVEL_SET
+from .sequence_character import CHAR_MAP
+from .solver import answer_space_difficulty, count_answers
+
+BLANK_SYMBOL = "_"
+
+DEFAULT_SYMBOL_WEIGHTS: Dict[str, float] = {char: 1.0 for char in CHAR_MAP}
+
+# Lengths are packed into the low byte of the canonical key.
+MAX_GENERATED_LENGTH = 255
+
+@dataclass(frozen=True)
+class GeneratedLevel:
+    """
+    A sampled layout together with its canonical key and difficulty estimate.
+
+    Attributes:
+        layout (Tuple[str, ...]): The level symbols.
+        canonical_key (int): (forbidden_mask << 8) | length. Layouts with the same
+                             key accept exactly the same answers.
+        difficulty (float): See `solver.answer_space_difficulty`.
+    """
+    layout: Tuple[str, ...]
+    canonical_key: int
+    difficulty: float
+
+
+@dataclass(frozen=True)
+class GenerationSettings:
+    """
+    Sampling parameters shared by every generation worker.
+
+    Each layout gets between 1 and `max_symbols` symbols at random positions,
+    the rest being blanks; this keeps long layouts solvable.
+    """
+    min_length: int = 3
+    max_length: int = 12
+    max_symbols: int = 6
+    symbol_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SYMBOL_WEIGHTS))
+    min_difficulty: float = 0.0
+    max_difficulty: float = float('inf')
+
+
+def canonical_key(layout: Tuple[str, ...]) -> Tuple[int, int]:
+    """
+    Returns (key, allowed_mask) for a layout. The key only depends on the
+    compiled constraints, so semantically identical layouts collapse.
+    """
+    compiled = build_compiled_level(layout)
+    allowed_mask = ((1 << compiled.length) - 1) & ~compiled.forbidden_mask
+    return (compiled.forbidden_mask << 8) | compiled.length, allowed_mask
+
+
+def generate_chunk(seed: int, size: int, settings: GenerationSettings) -> List[GeneratedLevel]:
+    """
+    Samples `size` layouts and returns the solvable ones that fall in the
+    difficulty range, deduplicated within the chunk.
+    """
+    rng = random.Random(seed)
+    symbols = list(settings.symbol_weights.keys())
+    weights = list(settings.symbol_weights.values())
+    mask_tables: Dict[int, List[Dict[str, int]]] = {}
+
+    seen: Set[int] = set()
+    levels = []
+    for _ in range(size):
+        length = rng.randint(settings.min_length, settings.max_length)
+        if length not in mask_tables:
+            mask_tables[length] = _symbol_mask_table(length)
+        table = mask_tables[length]
+
+        symbol_count = rng.randint(1, min(settings.max_symbols, length))
+        positions = rng.sample(range(length), symbol_count)
+        chars = rng.choices(symbols, weights=weights, k=symbol_count)
+
+        layout = [BLANK_SYMBOL] * length
+        forbidden_mask = 0
+        for position, char in zip(positions, chars):
+            layout[position] = char
+            forbidden_mask |= table[position][char]
+
+        key = (forbidden_mask << 8) | length
+        allowed_mask = ((1 << length) - 1) & ~forbidden_mask
+        if key in seen or not allowed_mask:
+            continue
+
+        difficulty = answer_space_difficulty(length, count_answers(allowed_mask))
+        if not settings.min_difficulty <= difficulty <= settings.max_difficulty:
+            continue
+
+        seen.add(key)
+        levels.append(GeneratedLevel(layout=tuple(layout), canonical_key=key, difficulty=difficulty))
+
+    return levels
+
+
+def _symbol_mask_table(length: int) -> List[Dict[str, int]]:
+    """
+    Returns, for every position, the forbidden mask of each symbol placed there.
+    """
+    return [
+        {char: CHAR_MAP[char](position=i).forbidden_mask(length) for char in CHAR_MAP}
+        for i in range(length)
+    ]
+
+
+def generate_levels(
+    count: int,
+    settings: GenerationSettings,
+    seed: int = 0,
+    workers: int = 1,
+    chunk_size: int = 10_000,
+    max_samples: Optional[int] = None
+) -> Iterator[GeneratedLevel]:
+    """
+    Streams `count` unique levels (fewer if the layout space runs out first).
+
+    Chunks are sampled in parallel and consumed as they complete; only the
+    canonical keys seen so far are kept in memory.
+
+    Args:
+        count (int): Number of unique levels to produce.
+        settings (GenerationSettings): Sampling parameters.
+        seed (int): Base seed; each chunk derives its own seed from it.
+        workers (int): Number of processes. 1 generates in-process.
+        chunk_size (int): Layouts sampled per task.
+        max_samples (int, optional): Sampling budget. Defaults to 20 * count.
+    """
+    if not 1 <= settings.min_length <= settings.max_length <= MAX_GENERATED_LENGTH:
+        raise ValueError(f"Layout lengths must satisfy 1 <= min_length <= max_length <= {MAX_GENERATED_LENGTH}.")
+
+    max_chunks = -(-(max_samples or 20 * count) // chunk_size)
+    seen: Set[int] = set()
+    produced = 0
+
+    for chunk in _iter_chunks(max_chunks, seed, chunk_size, settings, workers):
+        for level in chunk:
+            if level.canonical_key in seen:
+                continue
+            seen.add(level.canonical_key)
+            yield level
+            produced += 1
+            if produced >= count:
+                return
+
+
+def _iter_chunks(
+    max_chunks: int,
+    seed: int,
+    chunk_size: int,
+    settings: GenerationSettings,
+    workers: int
+) -> Iterator[List[GeneratedLevel]]:
+    if workers <= 1:
+        for index in range(max_chunks):
+            yield generate_chunk(_chunk_seed(seed, index), chunk_size, settings)
+        return
+
+    # Bounded number of in-flight chunks keeps memory flat on huge runs
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        next_index = 0
+        pending: Set[Future] = set()
+        try:
+            while next_index < max_chunks or pending:
+                while next_index < max_chunks and len(pending) < workers * 2:
+                    pending.add(executor.submit(generate_chunk, _chunk_seed(seed, next_index), chunk_size, settings))
+                    next_index += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _chunk_seed(seed: int, chunk_index: int) -> int:
+    return seed * 1_000_003 + chunk_index
+
+
+class LevelPoolWriter:
+    """
+    Streams generated levels into config files loadable as a Mystery Sequences
+    `level_set` (e.g. mistery_sequences_pool_0000.json). They are written to
+    the user configuration directory by default, not into the package.
+    """
+
+    def __init__(self, output_name: str, levels_per_file: int = 10_000, output_dir: Optional[Path] = None):
+        self.output_name = output_name
+        self.levels_per_file = levels_per_file
+        self.output_dir = Path(output_dir) if output_dir is not None else user_configs_dir()
+        self.written_files: List[Path] = []
+
+        self._file = None
+        self._levels_in_file = 0
+
+    def write(self, level: GeneratedLevel) -> None:
+        if self._file is None or self._levels_in_file >= self.levels_per_file:
+            self._open_next_file()
+        else:
+            self._file.write(",\n")
+
+        entry = {"layout": list(level.layout), "difficulty": round(level.difficulty, 4)}
+        self._file.write("        " + json.dumps(entry))
+        self._levels_in_file += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.write("\n    ]\n}\n")
+            self._file.close()
+            self._file = None
+
+    def _open_next_file(self) -> None:
+        self.close()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"{self.output_name}_{len(self.written_files):04d}.json"
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('{\n    "levels": [\n')
+        self._levels_in_file = 0
+        self.written_files.append(path)
+
+    def __enter__(self) -> "LevelPoolWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate Mystery Sequences level pools.")
+    parser.add_argument("--count", type=int, required=True, help="Number of unique levels to generate.")
+    parser.add_argument("--output_name", default=f"{DEFAULT_LEVEL_SET}_pool", help="Prefix of the generated config files.")
+    parser.add_argument(
+        "--output_dir", type=Path, default=None,
+        help="Directory for the generated files (default: GAME_CONFIGS_USER_DIR or ~/.agentic-games/game_configs)."
+    )
+    parser.add_argument("--levels_per_file", type=int, default=10_000)
+    parser.add_argument("--min_length", type=int, default=3)
+    parser.add_argument("--max_length", type=int, default=12)
+    parser.add_argument("--max_symbols", type=int, default=6)
+    parser.add_argument("--min_difficulty", type=float, default=0.0)
+    parser.add_argument("--max_difficulty", type=float, default=float('inf'))
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk_size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    settings = GenerationSettings(
+        min_length=args.min_length,
+        max_length=args.max_length,
+        max_symbols=args.max_symbols,
+        min_difficulty=args.min_difficulty,
+        max_difficulty=args.max_difficulty
+    )
+
+    produced = 0
+    with LevelPoolWriter(args.output_name, args.levels_per_file, args.output_dir) as writer:
+        for level in generate_levels(args.count, settings, args.seed, args.workers, args.chunk_size):
+            writer.write(level)
+            produced += 1
+
+    print(f"Generated {produced} unique levels into {len(writer.written_files)} file(s) in {writer.output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
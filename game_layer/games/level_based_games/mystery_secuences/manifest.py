@@ -1,6 +1,11 @@
 from app_layer.registries.generic_registry import EntityManifest
-from app_layer.registries.specs import IntParamSpec
-from .mystery_secuences import MisterySecuences
+from app_layer.registries.specs import IntParamSpec, ChoiceParamSpec
+from game_layer.game_engine.config_loader import find_game_configs
+from game_layer.game_engine.history import DEFAULT_HISTORY_TURNS, HISTORY_POLICY_NAMES
+from .mystery_secuences import MisterySecuences, DEFAULT_LEVEL_SET
+
+# Level sets are the config files of this game (hand-written or generated)
+level_sets = find_game_configs(DEFAULT_LEVEL_SET)
 
 # The discovery system will identify this instance via type inspection
 manifest = EntityManifest(
@@ -19,6 +24,28 @@ manifest = EntityManifest(
             default=50,
             min_value=1,
             max_value=float('inf')
+        ),
+        ChoiceParamSpec(
+            id="level_set",
+            label="Level Set",
+            description="The configuration file (in game_configs/ or the user directory) providing the levels.",
+            choices=level_sets,
+            default=DEFAULT_LEVEL_SET
+        ),
+        ChoiceParamSpec(
+            id="history_policy",
+            label="History Policy",
+            description="How the session history is stored: all in memory, only the last turns, or on disk.",
+            choices=list(HISTORY_POLICY_NAMES),
+            default="keep_all"
+        ),
+        IntParamSpec(
+            id="history_turns",
+            label="History Turns",
+            description="Turns kept by the 'keep_last' history policy.",
+            default=DEFAULT_HISTORY_TURNS,
+            min_value=1,
+            max_value=float('inf')
         )
     ]
 )
\ No newline at end of file
@@ -1,9 +1,37 @@
 from game_layer.game_engine.level_based_engine import LevelBasedEngine, LevelLogicResult
-from .sequence_character import CHAR_MAP
+from typing import Union
+from game_layer.game_engine.actions import BitVector
+from game_layer.game_engine.history import DEFAULT_HISTORY_TURNS, HistoryPolicy
+from .compiled_level import compile_layout
+
+DEFAULT_LEVEL_SET = "mistery_sequences"
+
+_BINARY_SYMBOLS = frozenset(("0", "1"))
+
+def parse_answer(input_data: str, length: int) -> BitVector:
+    """
+    Decodes an answer such as '1 0 1' into a BitVector in a single pass.
+
+    Raises:
+        ValueError: If the answer does not have `length` elements or an element is not 0 or 1.
+    """
+    input_parts = input_data.split()
+    if len(input_parts) != length:
+        raise ValueError(f"The length of the current sequence is {length}, and hence, your input must have {length} elements separated by spaces.")
+    if not _BINARY_SYMBOLS.issuperset(input_parts):
+        raise ValueError("Each element in the input must be either 0 or 1.")
+    return BitVector(int("".join(input_parts), 2), length)
 
 class MisterySecuences(LevelBasedEngine):
-    def __init__(self, max_consecutive_failed_attempts: int = 50):
-        super().__init__()
+    def __init__(
+        self,
+        max_consecutive_failed_attempts: int = 50,
+        level_set: str = DEFAULT_LEVEL_SET,
+        history_policy: Union[HistoryPolicy, str, None] = None,
+        history_turns: int = DEFAULT_HISTORY_TURNS
+    ):
+        self.level_set = level_set
+        super().__init__(history_policy, history_turns)
         self.max_consecutive_failed_attempts = max_consecutive_failed_attempts
         self.current_consecutive_failed_attempts = 0
     
@@ -11,18 +39,15 @@ class MisterySecuences(LevelBasedEngine):
     def name(self):
         return "Mistery Sequences"
 
+    @property
+    def config_name(self):
+        return self.level_set
+
     def start_level(self, level_index):
         super().start_level(level_index)
 
         self.string_layout = self.level_configs[level_index].get("layout", [])
-        level_character_layout = []
-
-        for i, char in enumerate(self.string_layout):
-            if char in CHAR_MAP:
-                character_instance = CHAR_MAP[char](position=i)
-                level_character_layout.append(character_instance)
-                
-        self.level_character_layout = level_character_layout
+        self.compiled_level = compile_layout(self.string_layout)
 
     def get_level_observation(self):
         obs = super().get_level_observation()
@@ -32,16 +57,10 @@ class MisterySecuences(LevelBasedEngine):
             obs += "\nCurrent sequence: " + " ".join(self.string_layout)
         return obs
     
-    def apply_level_logic(self, input_data):
-        input_data = [int(x) for x in input_data.split()]
-        for character in self.level_character_layout:
-            if not character.check_sequence(input_data):
-                return self._handle_not_completed()
-        
-        for x in input_data:
-            if x == 1:
-                self.current_consecutive_failed_attempts = 0
-                return LevelLogicResult.COMPLETED
+    def apply_level_logic(self, answer):
+        if self.compiled_level.accepts(answer.bits):
+            self.current_consecutive_failed_attempts = 0
+            return LevelLogicResult.COMPLETED
         
         return self._handle_not_completed()
     
@@ -62,10 +81,5 @@ class MisterySecuences(LevelBasedEngine):
         )
         return inst
     
-    def verify_level_input(self, input_data):
-        input_parts = input_data.split()
-        if len(input_parts) != len(self.string_layout):
-            raise ValueError(f"The length of the current sequence is {len(self.string_layout)}, and hence, your input must have {len(self.string_layout)} elements separated by spaces.")
-        for part in input_parts:
-            if part not in ["0", "1"]:
-                raise ValueError("Each element in the input must be either 0 or 1.")
\ No newline at end of file
+    def parse_level_input(self, input_data):
+        return parse_answer(input_data, self.compiled_level.length)
\ No newline at end of file
@@ -3,6 +3,31 @@ from enum import Enum, auto
 
 
 
+def position_bit(position, length):
+    """
+    Returns the bit representing a sequence position inside an answer bitmask.
+    The first element of the sequence is the most significant bit, so a binary
+    answer such as '1 0 1' maps directly to int('101', 2).
+    """
+    return 1 << (length - 1 - position)
+
+
+def suffix_mask(start, length):
+    """
+    Returns the bitmask of every position from `start` to the end of the sequence.
+    """
+    return (1 << max(length - start, 0)) - 1
+
+
+def parity_mask(parity, length):
+    """
+    Returns the bitmask of every position i with i % 2 == parity.
+    """
+    last_bit_parity = (length - 1 - parity) % 2
+    even_bits = ((1 << (length + length % 2)) - 1) // 3
+    return even_bits if last_bit_parity == 0 else (even_bits << 1) & ((1 << length) - 1)
+
+
 class SequenceCharacter(ABC):
     def __init__(self,):
         pass
@@ -16,11 +41,18 @@ class SequenceCharacter(ABC):
         """
         pass
 
+    @abstractmethod
+    def forbidden_mask(self, length):
+        """
+        Returns the bitmask of the positions where this character forbids a 1
+        in a sequence of the given length.
+        """
+        pass
+
 
 class Letter(SequenceCharacter):
     def __init__(self, position):
         self.position = position
-    pass
 
 class LetterA(Letter):
     def check_sequence(self, sequence):
@@ -28,6 +60,10 @@ class LetterA(Letter):
             if sequence[i] == 1:
                 return False
         return True
+
+    def forbidden_mask(self, length):
+        full_mask = (1 << length) - 1
+        return full_mask & ~suffix_mask(self.position + 1, length)
     
 class LetterB(Letter):
     def check_sequence(self, sequence):
@@ -35,10 +71,16 @@ class LetterB(Letter):
             if sequence[i] == 1:
                 return False
         return True
+
+    def forbidden_mask(self, length):
+        return suffix_mask(self.position, length)
             
 class LetterX(Letter):
     def check_sequence(self, sequence):
         return sequence[self.position] != 1
+
+    def forbidden_mask(self, length):
+        return position_bit(self.position, length)
     
 class LetterC(Letter):
     def check_sequence(self, sequence):
@@ -46,6 +88,9 @@ class LetterC(Letter):
             if sequence[i] == 1:
                 return False
         return True
+
+    def forbidden_mask(self, length):
+        return parity_mask((self.position + 1) % 2, length)
     
 
 CHAR_MAP = {
@@ -53,4 +98,4 @@ CHAR_MAP = {
     "B": LetterB,
     "X": LetterX,
     "C": LetterC,
-}
\ No newline at end of file
+}
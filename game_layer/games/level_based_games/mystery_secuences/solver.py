@@ -0,0 +1,151 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from game_layer.game_engine.config_loader import load_game_config
+from .compiled_level import compile_layout
+from .sequence_character import CHAR_MAP
+
+@dataclass(frozen=True)
+class LevelSolution:
+    """
+    Closed-form description of the answer space of a Mystery Sequences layout.
+
+    Since every symbol only forbids positions, the accepted answers are exactly
+    the non-empty subsets of the allowed positions. Everything here is derived
+    from that single mask, so solving is O(length) whatever the layout size.
+
+    Attributes:
+        layout (Tuple[str, ...]): The level symbols.
+        length (int): Number of elements of an answer.
+        allowed_mask (int): Bitmask of the positions where a 1 may be placed.
+        answer_count (int): Number of accepted answers.
+        min_weight_answer (Optional[int]): An accepted answer with a single 1
+                                           (the first allowed position), or None
+                                           if the level has no solution.
+        symbol_selectivity (Dict[str, float]): For each symbol of the layout, the
+                                               fraction of the answers accepted by
+                                               the other symbols that it rejects.
+    """
+    layout: Tuple[str, ...]
+    length: int
+    allowed_mask: int
+    answer_count: int
+    min_weight_answer: Optional[int]
+    symbol_selectivity: Dict[str, float]
+
+    @property
+    def is_solvable(self) -> bool:
+        return self.answer_count > 0
+
+    @property
+    def difficulty(self) -> float:
+        """
+        Bits of information needed to hit an accepted answer by chance:
+        -log2(accepted answers / non-zero answers). Returns inf when unsolvable.
+        """
+        return answer_space_difficulty(self.length, self.answer_count)
+
+    def accepted_answers(self) -> Iterator[int]:
+        """
+        Enumerates every accepted answer bitmask (2**k - 1 values for k allowed positions).
+        """
+        return iter_submasks(self.allowed_mask)
+
+
+def solve_layout(layout: Sequence[str]) -> LevelSolution:
+    """
+    Returns the solution of a layout. Results are cached by layout, which acts
+    as the answer-space index shared by every caller in the process.
+    """
+    return _solve_layout(tuple(layout))
+
+
+def solve_configuration(config_name: str = "mistery_sequences") -> Tuple[LevelSolution, ...]:
+    """
+    Solves every level of a Mystery Sequences configuration file, in order.
+    """
+    return tuple(
+        solve_layout(level.get("layout", []))
+        for level in load_game_config(config_name).levels
+    )
+
+
+def answer_space_difficulty(length: int, answer_count: int) -> float:
+    """
+    Returns -log2(answer_count / non-zero answers of the given length), or inf
+    if no answer is accepted.
+    """
+    if answer_count <= 0:
+        return math.inf
+    return math.log2((1 << length) - 1) - math.log2(answer_count)
+
+
+def count_answers(allowed_mask: int) -> int:
+    """
+    Returns the number of accepted answers given the allowed-positions mask.
+    """
+    return (1 << allowed_mask.bit_count()) - 1
+
+
+def iter_submasks(mask: int) -> Iterator[int]:
+    """
+    Yields every non-zero submask of `mask`, from largest to smallest.
+    """
+    submask = mask
+    while submask:
+        yield submask
+        submask = (submask - 1) & mask
+
+
+def format_answer(answer_mask: int, length: int) -> str:
+    """
+    Renders an answer bitmask as the input expected by the game (e.g. '0 1 0').
+    """
+    return " ".join(format(answer_mask, f"0{length}b")) if length else ""
+
+
+@lru_cache(maxsize=None)
+def _solve_layout(layout: Tuple[str, ...]) -> LevelSolution:
+    compiled = compile_layout(layout)
+    full_mask = (1 << compiled.length) - 1
+    allowed_mask = full_mask & ~compiled.forbidden_mask
+    answer_count = count_answers(allowed_mask)
+
+    min_weight_answer = None
+    if allowed_mask:
+        min_weight_answer = 1 << (allowed_mask.bit_length() - 1)
+
+    return LevelSolution(
+        layout=layout,
+        length=compiled.length,
+        allowed_mask=allowed_mask,
+        answer_count=answer_count,
+        min_weight_answer=min_weight_answer,
+        symbol_selectivity=_symbol_selectivity(layout, full_mask, answer_count)
+    )
+
+
+def _symbol_selectivity(layout: Tuple[str, ...], full_mask: int, answer_count: int) -> Dict[str, float]:
+    """
+    Measures each symbol by removing it from the layout and comparing answer counts.
+    """
+    length = len(layout)
+    masks_by_symbol: Dict[str, int] = {}
+    for i, char in enumerate(layout):
+        if char in CHAR_MAP:
+            char_mask = CHAR_MAP[char](position=i).forbidden_mask(length)
+            masks_by_symbol[char] = masks_by_symbol.get(char, 0) | char_mask
+
+    selectivity = {}
+    for symbol in masks_by_symbol:
+        others_mask = 0
+        for other, mask in masks_by_symbol.items():
+            if other != symbol:
+                others_mask |= mask
+
+        count_without = count_answers(full_mask & ~others_mask)
+        selectivity[symbol] = 1 - answer_count / count_without if count_without else 0.0
+
+    return selectivity
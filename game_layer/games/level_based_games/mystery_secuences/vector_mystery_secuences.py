@@ -0,0 +1,285 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from game_layer.game_engine.core_engine import GameStatus, MAX_INVALID_INPUTS
+from game_layer.game_engine.level_based_engine import LevelBasedEngine
+from .mystery_secuences import MisterySecuences, DEFAULT_LEVEL_SET, parse_answer
+from .compiled_level import compile_layout
+
+# Largest layout whose answers fit in the uint64 mask arrays.
+MAX_VECTOR_LAYOUT_LENGTH = 64
+
+_RUNNING = GameStatus.RUNNING.value
+_FINISHED = GameStatus.FINISHED.value
+_FAILED = GameStatus.FAILED.value
+
+# Per-game classification of an action before the vectorized update.
+_ANSWER = 0
+_COMMAND = 1
+_INVALID = 2
+_ENDED = 3
+
+@dataclass
+class VectorStepResult:
+    """
+    Outcome of advancing every game of a VectorMysterySequences by one turn.
+
+    Attributes:
+        observations (List[str]): The observation of each game, identical to the
+                                  one `CoreEngine.step` would have returned.
+        scores (np.ndarray): The score of each game after the step.
+        statuses (np.ndarray): The `GameStatus` value of each game after the step.
+        dones (np.ndarray): True for the games that ended on this step. When
+                            auto-reset is enabled those games have already been
+                            restarted and their next observation is
+                            `VectorMysterySequences.initial_observation`.
+    """
+    observations: List[str]
+    scores: np.ndarray
+    statuses: np.ndarray
+    dones: np.ndarray
+
+
+class VectorMysterySequences:
+    """
+    Batched Mystery Sequences environment that steps N independent games at once.
+
+    The state of every game lives in NumPy arrays and all the answers of a turn
+    are checked against the compiled level masks in a single vectorized pass.
+    Rules, commands (/repeat, /level n) and observation texts are the same as
+    in `MisterySecuences`; the only per-game Python work left is parsing the
+    raw input strings.
+    """
+
+    def __init__(
+        self,
+        num_games: int,
+        max_consecutive_failed_attempts: int = 50,
+        auto_reset: bool = True,
+        level_set: str = DEFAULT_LEVEL_SET
+    ):
+        """
+        Args:
+            num_games (int): Number of independent games held by the environment.
+            max_consecutive_failed_attempts (int): Same meaning as in MisterySecuences.
+            auto_reset (bool): If True, games that end are restarted at the end of
+                               the step that finished them.
+            level_set (str): Same meaning as in MisterySecuences.
+        """
+        if num_games < 1:
+            raise ValueError("num_games must be at least 1.")
+
+        self.num_games = num_games
+        self.max_consecutive_failed_attempts = max_consecutive_failed_attempts
+        self.auto_reset = auto_reset
+
+        # A scalar game acts as the reference for configuration and texts.
+        template = MisterySecuences(max_consecutive_failed_attempts, level_set)
+        self.name = template.name
+        self.max_level_index = template.max_level_index
+        self._build_level_tables(template)
+
+        self.current_level = np.zeros(num_games, dtype=np.int64)
+        self.max_unlocked_level = np.zeros(num_games, dtype=np.int64)
+        self.steps_in_current_level = np.zeros(num_games, dtype=np.int64)
+        self.failed_attempts = np.zeros(num_games, dtype=np.int64)
+        self.invalid_inputs = np.zeros(num_games, dtype=np.int64)
+        self.status = np.full(num_games, _RUNNING, dtype=np.int8)
+
+    def _build_level_tables(self, template: MisterySecuences) -> None:
+        """
+        Precomputes the per-level masks, lengths and observation texts.
+        """
+        compiled = [
+            compile_layout(level.get("layout", []))
+            for level in template.level_configs
+        ]
+        if any(level.length > MAX_VECTOR_LAYOUT_LENGTH for level in compiled):
+            raise ValueError(
+                f"Layouts longer than {MAX_VECTOR_LAYOUT_LENGTH} positions are not supported."
+            )
+
+        self.level_lengths = np.array([level.length for level in compiled], dtype=np.int64)
+        self.level_masks = np.array([level.forbidden_mask for level in compiled], dtype=np.uint64)
+
+        self.level_start_observations = []
+        for index in range(len(compiled)):
+            template.start_level(index)
+            self.level_start_observations.append(template.get_level_observation())
+
+        template.start_level(0)
+        self.initial_observation = template.get_initial_observation()
+
+        template.steps_in_current_level = 1
+        self.wrong_answer_observation = template.get_level_observation()
+
+    def reset(self, indices: Optional[np.ndarray] = None) -> List[str]:
+        """
+        Restarts the selected games (all of them by default).
+
+        Returns:
+            List[str]: The initial observation of every restarted game.
+        """
+        if indices is None:
+            indices = np.arange(self.num_games)
+
+        self.current_level[indices] = 0
+        self.max_unlocked_level[indices] = 0
+        self.steps_in_current_level[indices] = 0
+        self.failed_attempts[indices] = 0
+        self.invalid_inputs[indices] = 0
+        self.status[indices] = _RUNNING
+
+        return [self.initial_observation] * len(indices)
+
+    def get_scores(self) -> np.ndarray:
+        """
+        Returns the current score of every game.
+        """
+        return (self.max_unlocked_level + 1).astype(np.float64)
+
+    def step(self, actions: Sequence[str]) -> VectorStepResult:
+        """
+        Advances every game by one turn.
+
+        Args:
+            actions (Sequence[str]): One raw input string per game.
+
+        Returns:
+            VectorStepResult: Observations, scores, statuses and finished flags.
+        """
+        if len(actions) != self.num_games:
+            raise ValueError(f"Expected {self.num_games} actions, got {len(actions)}.")
+
+        observations: List[Optional[str]] = [None] * self.num_games
+        kinds, answers, targets = self._parse_actions(actions, observations)
+
+        # Valid inputs reset the invalid counter, exactly like CoreEngine.step.
+        valid = kinds != _INVALID
+        running = self.status == _RUNNING
+        self.invalid_inputs[valid & running] = 0
+        self._apply_invalid(kinds == _INVALID, observations)
+        self._apply_answers(kinds == _ANSWER, answers, observations)
+        self._apply_commands(kinds == _COMMAND, targets, observations)
+
+        scores = self.get_scores()
+        statuses = self.status.copy()
+        dones = running & (self.status != _RUNNING)
+
+        if self.auto_reset and dones.any():
+            self.reset(np.flatnonzero(dones))
+
+        return VectorStepResult(
+            observations=observations,
+            scores=scores,
+            statuses=statuses,
+            dones=dones
+        )
+
+    def _parse_actions(self, actions: Sequence[str], observations: List[Optional[str]]):
+        """
+        Tokenizes the raw inputs, writing the error observation of invalid ones.
+
+        Returns:
+            Tuple of arrays: action kind, answer bitmask and requested level index.
+        """
+        kinds = np.empty(self.num_games, dtype=np.int8)
+        answers = np.zeros(self.num_games, dtype=np.uint64)
+        targets = np.zeros(self.num_games, dtype=np.int64)
+
+        expected_lengths = self.level_lengths[self.current_level].tolist()
+        running = (self.status == _RUNNING).tolist()
+        current_levels = self.current_level.tolist()
+
+        for i, action in enumerate(actions):
+            if not running[i]:
+                kinds[i] = _ENDED
+                observations[i] = "Error: The game has already ended."
+                continue
+
+            # Same parsers as the scalar engine, so error texts always match.
+            try:
+                if not isinstance(action, str):
+                    raise ValueError("Input must be a string.")
+                if action.startswith("/"):
+                    command = LevelBasedEngine.parse_command(action)
+                    kinds[i] = _COMMAND
+                    target = current_levels[i] - 1 if command.command == "/repeat" else command.argument - 1
+                    if not 0 <= target <= self.max_level_index:
+                        # Checked before storing: the argument may not fit in an int64.
+                        targets[i] = -1
+                        observations[i] = f"Level {target + 1} does not exist."
+                    else:
+                        targets[i] = target
+                else:
+                    answers[i] = parse_answer(action, expected_lengths[i]).bits
+                    kinds[i] = _ANSWER
+            except ValueError as e:
+                kinds[i] = _INVALID
+                observations[i] = str(e)
+
+        return kinds, answers, targets
+
+    def _apply_invalid(self, selected: np.ndarray, observations: List[Optional[str]]) -> None:
+        self.invalid_inputs[selected] += 1
+        aborted = selected & (self.invalid_inputs >= MAX_INVALID_INPUTS)
+        self.status[aborted] = _FAILED
+
+        for i in np.flatnonzero(aborted).tolist():
+            observations[i] = "Too many invalid inputs. Aborting the game to avoid infinite loop."
+
+    def _apply_answers(
+        self,
+        selected: np.ndarray,
+        answers: np.ndarray,
+        observations: List[Optional[str]]
+    ) -> None:
+        forbidden = self.level_masks[self.current_level]
+        accepted = selected & (answers != 0) & ((answers & forbidden) == 0)
+        rejected = selected & ~accepted
+
+        # Completed levels
+        self.failed_attempts[accepted] = 0
+        finished = accepted & (self.current_level == self.max_level_index)
+        advanced = accepted & ~finished
+        self.status[finished] = _FINISHED
+        self.current_level[advanced] += 1
+        self.steps_in_current_level[advanced] = 0
+        np.maximum(self.max_unlocked_level, self.current_level, out=self.max_unlocked_level, where=advanced)
+
+        # Wrong answers
+        self.failed_attempts[rejected] += 1
+        failed = rejected & (self.failed_attempts >= self.max_consecutive_failed_attempts)
+        retry = rejected & ~failed
+        self.status[failed] = _FAILED
+        self.steps_in_current_level[retry] += 1
+
+        for i in np.flatnonzero(finished).tolist():
+            observations[i] = "Congratulations! You have completed the final level of the game."
+        for i in np.flatnonzero(advanced).tolist():
+            observations[i] = self.level_start_observations[self.current_level[i]]
+        for i in np.flatnonzero(failed).tolist():
+            observations[i] = "You have failed the Game. Better luck next time!"
+        for i in np.flatnonzero(retry).tolist():
+            observations[i] = self.wrong_answer_observation
+
+    def _apply_commands(
+        self,
+        selected: np.ndarray,
+        targets: np.ndarray,
+        observations: List[Optional[str]]
+    ) -> None:
+        # Observations of missing levels were written while parsing.
+        missing = selected & (targets < 0)
+        locked = selected & ~missing & (targets > self.max_unlocked_level)
+        moved = selected & ~missing & ~locked
+
+        self.current_level[moved] = targets[moved]
+        self.steps_in_current_level[moved] = 0
+
+        for i in np.flatnonzero(locked).tolist():
+            observations[i] = f"Level {targets[i] + 1} is not unlocked yet."
+        for i in np.flatnonzero(moved).tolist():
+            observations[i] = self.level_start_observations[targets[i]]
@@ -6,6 +6,7 @@ from ui_layer.cli.cli_session_configurator import CLISessionConfigurator
 from app_layer.execution.managers.direct_execution_manager import DirectExecutionManager
 from app_layer.core.runner_types import GameEvent, GameStart, GameTurn, GameResult
 from app_layer.io.input_source import InputSource
+from agent_layer.llm_agents.LLMs.client_pool import close_clients
 
 
 
@@ -33,8 +34,11 @@ async def main():
 
     manager = DirectExecutionManager(session_config, input_adapter)
 
-    async for event in manager.execute():
-        handle_event(event)
+    try:
+        async for event in manager.execute():
+            handle_event(event)
+    finally:
+        await close_clients()
 
 def handle_event(event):
     match event:
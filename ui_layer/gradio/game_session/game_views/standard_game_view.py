@@ -1,7 +1,7 @@
 import gradio as gr
 from typing import List, Any, Dict
 from ui_layer.gradio.signals import SignalReceiver
-from app_layer.core.runner_types import GameEvent, GameStart, GameTurn, GameResult
+from app_layer.core.runner_types import GameEvent, GameStart, GameTurn, GameResult, SessionTiming, BudgetExhausted
 from game_layer.game_engine.core_engine import GameStatus
 
 class StandardGameView(SignalReceiver):
@@ -22,6 +22,7 @@ class StandardGameView(SignalReceiver):
             game_name (str): The display name of the current game.
         """
         self._history_buffer: List[Dict[str, str]] = []
+        self._timing = SessionTiming()
         
         with gr.Group():
             with gr.Row():
@@ -44,7 +45,9 @@ class StandardGameView(SignalReceiver):
                 render_markdown=True
             )
 
-        super().__init__(targets=[self.display_area, self.score_display])
+            self.timing_display = gr.Markdown(self._format_timing())
+
+        super().__init__(targets=[self.display_area, self.score_display, self.timing_display])
 
     def update(self, events: List[GameEvent]) -> Any:
         """
@@ -54,7 +57,7 @@ class StandardGameView(SignalReceiver):
             events (List[GameEvent]): New events emitted by the game engine.
 
         Returns:
-            List[Dict[str, str]]: The updated message history for Gradio rendering.
+            Tuple: The updated message history, the current score and the timing summary.
         """
         if not events:
             return gr.skip()
@@ -62,11 +65,32 @@ class StandardGameView(SignalReceiver):
         for event in events:
             new_messages = self._event_to_messages(event)
             self._history_buffer.extend(new_messages)
+            if isinstance(event, GameTurn) and event.timing is not None:
+                self._timing.add(event.timing)
 
         last_event = events[-1]
         score = self._get_score(last_event)
 
-        return self._history_buffer, score
+        return self._history_buffer, score, self._format_timing()
+
+    def _format_timing(self) -> str:
+        """
+        Summarizes where the session time goes (agent, model streaming, engine).
+        """
+        timing = self._timing
+        if not timing.turns:
+            return "⏱️ *No turns yet.*"
+
+        first_token = timing.mean_first_token_seconds
+        tokens_per_second = timing.tokens_per_second
+        return (
+            f"⏱️ **Avg action:** {timing.mean_action_seconds:.2f}s · "
+            f"**Avg rate-limit wait:** {timing.mean_throttled_seconds:.2f}s · "
+            f"**Avg first token:** {f'{first_token:.2f}s' if first_token is not None else 'n/a'} · "
+            f"**Tokens/s:** {f'{tokens_per_second:.1f}' if tokens_per_second is not None else 'n/a'} · "
+            f"**Avg engine step:** {timing.mean_step_seconds * 1000:.2f}ms · "
+            f"**Tokens:** {timing.tokens}"
+        )
 
     def _event_to_messages(self, event: GameEvent) -> List[Dict[str, str]]:
         """
@@ -93,6 +117,13 @@ class StandardGameView(SignalReceiver):
                     }
                 ]
 
+            case GameResult(final_status=BudgetExhausted() as status):
+                header = f"## ⏱️ BUDGET EXHAUSTED ({status.name.replace('_', ' ').lower()})"
+                return [{
+                    "role": "assistant",
+                    "content": header
+                }]
+
             case GameResult(final_status=status):
                 header = "## 🏆 MISSION ACCOMPLISHED" if status == GameStatus.FINISHED else "## 💀 GAME OVER"
                 return [{